@@ -0,0 +1,228 @@
+"""
+Micro-benchmark for business-rule matching as used by update_stage.
+
+Generates synthetic BusinessRule sets and email/file metadata, times the legacy
+_contains_pattern based matching against RuleMatcher, and checks that both pick
+the same rule for every file. Runs offline; no database is needed.
+
+    python -m benchmarks.business_rule_engine_bench --rule-counts 10,100,1000 --files 500
+"""
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.domain.entities.business_rule import BusinessRule
+from src.domain.enums.business_rule_enums import BusinessRuleTypes
+from src.utils.rule_matcher import RuleMatcher, parse_file_metadata
+
+VOCABULARY = [
+    "capital", "call", "distribution", "notice", "quarterly", "report", "statement", "k1",
+    "invoice", "fund", "partners", "growth", "equity", "credit", "venture", "holdings",
+    "q1", "q2", "q3", "q4", "2024", "2025", "annual", "audited", "financial", "nav",
+    "investor", "letter", "update", "tax", "estimate", "schedule", "portfolio", "summary",
+]
+DOMAINS = ["example.com", "fundadmin.com", "gpservices.net", "investorportal.io"]
+EXPRESSION_KEYS = ["FileName", "SenderAddress", "Subject", "EmailBody"]
+
+
+# ----------------------------------------------------------------------
+# Legacy engine: kept verbatim from the pre-RuleMatcher repository code
+# ----------------------------------------------------------------------
+class LegacyRuleEngine:
+    def _get_matching_classification_rule(self, file, rules):
+        if not file.file_metadata:
+            return None
+
+        try:
+            metadata = json.loads(file.file_metadata)
+        except json.JSONDecodeError:
+            return None
+
+        if file.harvestsource == "Email":
+            return self._has_matching_email_rules(metadata, rules)
+        else:
+            file_name = metadata.get("File_Name")
+            if file_name:
+                return self._check_for_matching_rule(file_name, rules)
+        return None
+
+    def _has_matching_email_rules(self, metadata, rules):
+        subject = metadata.get("Subject")
+        sender = metadata.get("To")
+        body = metadata.get("Email_Body")
+        filename = metadata.get("File_Name")
+
+        for rule in rules:
+            if (self._contains_pattern(rule.ruleexpressions, subject) or
+                self._contains_pattern(rule.ruleexpressions, sender) or
+                self._contains_pattern(rule.ruleexpressions, body) or
+                self._contains_pattern(rule.ruleexpressions, filename)):
+                return rule
+        return None
+
+    def _check_for_matching_rule(self, file_name, rules):
+        for rule in rules:
+            if not rule.ruleexpressions:
+                continue
+            if self._contains_pattern(rule.ruleexpressions, file_name, is_email=False):
+                return rule
+        return None
+
+    def _contains_pattern(self, rule_data: str, file_data: str, is_email: bool = True) -> bool:
+        if not rule_data or not file_data:
+            return False
+
+        try:
+            rule_dict = json.loads(rule_data)
+        except:
+            return False
+
+        if not is_email:
+            # File Only Check
+            if "FileName" in rule_dict:
+                pattern = rule_dict["FileName"]
+                if pattern:
+                    # Convert wildcard * to regex .*
+                    regex_pattern = pattern.replace("*", ".*")
+                    if re.search(regex_pattern, file_data, re.IGNORECASE):
+                        return True
+            return False
+
+        # Email Check (Iterate all keys)
+        for key, pattern in rule_dict.items():
+            if not pattern:
+                continue
+            regex_pattern = pattern.replace("*", ".*")
+            if re.search(regex_pattern, file_data, re.IGNORECASE):
+                return True
+
+        return False
+
+
+class SyntheticFile:
+    def __init__(self, harvestsource: str, file_metadata: str):
+        self.harvestsource = harvestsource
+        self.file_metadata = file_metadata
+
+
+def _words(rng: random.Random, count: int) -> List[str]:
+    return rng.sample(VOCABULARY, count)
+
+
+def generate_rules(rng: random.Random, count: int) -> List[BusinessRule]:
+    rules = []
+    for index in range(count):
+        expressions = {}
+        for key in rng.sample(EXPRESSION_KEYS, rng.randint(1, len(EXPRESSION_KEYS))):
+            if key == "SenderAddress":
+                expressions[key] = f"*@{rng.choice(DOMAINS)}"
+            else:
+                expressions[key] = "*".join(_words(rng, rng.randint(2, 3)))
+        rules.append(BusinessRule(
+            uniqueruleid=f"CN{index + 1:04d}",
+            ruletype=BusinessRuleTypes.Classification.value,
+            ruleexpressions=json.dumps(expressions)
+        ))
+    return rules
+
+
+def generate_files(rng: random.Random, count: int, email_ratio: float) -> List[SyntheticFile]:
+    files = []
+    for _ in range(count):
+        file_name = "_".join(_words(rng, rng.randint(2, 4))) + ".pdf"
+        if rng.random() < email_ratio:
+            metadata = {
+                "Subject": " ".join(_words(rng, rng.randint(3, 6))),
+                "To": f"{rng.choice(VOCABULARY)}@{rng.choice(DOMAINS)}",
+                "Email_Body": " ".join(_words(rng, 12)),
+                "File_Name": file_name,
+            }
+            files.append(SyntheticFile("Email", json.dumps(metadata)))
+        else:
+            files.append(SyntheticFile("Portal", json.dumps({"File_Name": file_name})))
+    return files
+
+
+def time_engine(files: List[SyntheticFile], match: Callable[[SyntheticFile], Optional[BusinessRule]]) -> Tuple[List[Optional[str]], List[float]]:
+    decisions = []
+    latencies = []
+    for file in files:
+        started = time.perf_counter()
+        rule = match(file)
+        latencies.append(time.perf_counter() - started)
+        decisions.append(rule.uniqueruleid if rule else None)
+    return decisions, latencies
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    total = sum(latencies)
+    ordered = sorted(latencies)
+    p99_index = max(0, int(round(0.99 * len(ordered))) - 1)
+    return {
+        "files_per_sec": len(latencies) / total if total else float("inf"),
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": ordered[p99_index] * 1000,
+    }
+
+
+def run(rule_counts: List[int], file_count: int, email_ratio: float, seed: int) -> bool:
+    legacy = LegacyRuleEngine()
+    all_identical = True
+
+    print(f"{'rules':>7} {'engine':>8} {'compile ms':>11} {'files/s':>11} {'p50 ms':>9} {'p99 ms':>9} {'matched':>8}")
+    for rule_count in rule_counts:
+        rng = random.Random(seed + rule_count)
+        rules = generate_rules(rng, rule_count)
+        files = generate_files(rng, file_count, email_ratio)
+
+        legacy_decisions, legacy_latencies = time_engine(
+            files, lambda file: legacy._get_matching_classification_rule(file, rules)
+        )
+
+        compile_started = time.perf_counter()
+        matcher = RuleMatcher(rules)
+        compile_ms = (time.perf_counter() - compile_started) * 1000
+        matcher_decisions, matcher_latencies = time_engine(
+            files, lambda file: matcher.match(parse_file_metadata(file.file_metadata), file.harvestsource)
+        )
+
+        for engine, compile_time, decisions, latencies in (
+            ("legacy", 0.0, legacy_decisions, legacy_latencies),
+            ("matcher", compile_ms, matcher_decisions, matcher_latencies),
+        ):
+            stats = summarize(latencies)
+            matched = sum(1 for decision in decisions if decision)
+            print(f"{rule_count:>7} {engine:>8} {compile_time:>11.1f} {stats['files_per_sec']:>11.1f} "
+                  f"{stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f} {matched:>8}")
+
+        mismatches = [i for i, (a, b) in enumerate(zip(legacy_decisions, matcher_decisions)) if a != b]
+        if mismatches:
+            all_identical = False
+            first = mismatches[0]
+            print(f"        DECISION MISMATCH on {len(mismatches)} file(s); first: legacy={legacy_decisions[first]} "
+                  f"matcher={matcher_decisions[first]} metadata={files[first].file_metadata}")
+
+    print("decisions identical" if all_identical else "decisions DIFFER")
+    return all_identical
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark business-rule matching engines.")
+    parser.add_argument("--rule-counts", default="10,100,1000,10000",
+                        help="Comma separated rule set sizes (default: 10,100,1000,10000)")
+    parser.add_argument("--files", type=int, default=200, help="Synthetic files per rule set size (default: 200)")
+    parser.add_argument("--email-ratio", type=float, default=0.5, help="Share of email-harvested files (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    args = parser.parse_args()
+
+    rule_counts = [int(count) for count in args.rule_counts.split(",") if count.strip()]
+    return 0 if run(rule_counts, args.files, args.email_ratio, args.seed) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Micro-benchmark for the extraction JSON checks run by update_extract_file.
+
+Generates realistic multi-entity extraction documents of a target size
+(entities with many portfolios, each field carrying its value, confidence
+and bounding box) and times the uniqueness check, key field diff and the
+value stored back, once with the per-call helpers (which parse the new
+document twice and the old one once) and once with ExtractionDocument
+(one parse per document, no re-serialization of an unchanged document).
+Both paths are checked to reach the same decision. Runs offline; no
+database is needed.
+
+    python -m benchmarks.extraction_document_bench --size-mb 5 --samples 10
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from src.utils.datetime_utils import parse_datetime
+from src.utils.extraction_json_utils import (
+    ExtractionDocument,
+    are_investor_account_names_unique,
+    extract_portfolio_fields,
+)
+
+PORTFOLIO_FIELDS = [
+    "FundName", "Commitment", "UnfundedCommitment", "CallAmount", "DistributionAmount",
+    "NAV", "Currency", "ManagementFee", "CarriedInterest", "RecallableAmount",
+]
+VOCABULARY = [
+    "capital", "call", "distribution", "fund", "partners", "growth", "equity", "credit",
+    "holdings", "quarterly", "statement", "investor", "notice", "USD", "EUR", "LP", "II", "IV",
+]
+
+
+def _field(rng: random.Random, value: str) -> dict:
+    return {
+        "Value": value,
+        "Confidence": round(rng.uniform(0.5, 1.0), 4),
+        "Page": rng.randint(1, 40),
+        "BoundingBox": [round(rng.uniform(0, 1), 4) for _ in range(8)],
+    }
+
+
+def _text(rng: random.Random) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(1, 5)))
+
+
+def generate_document(rng: random.Random, size_bytes: int) -> str:
+    """Multi-entity extraction JSON of roughly size_bytes, with unique investor/account pairs."""
+    entities = []
+    size = 0
+    index = 0
+    while size < size_bytes:
+        portfolios = []
+        for _ in range(rng.randint(20, 60)):
+            portfolio = {
+                "Investor": _field(rng, f"Investor {index}"),
+                "Account": _field(rng, f"ACC-{index:08d}"),
+                "PeriodEndingDT": _field(rng, "2024-12-31T00:00:00"),
+            }
+            for name in PORTFOLIO_FIELDS:
+                portfolio[name] = _field(rng, f"{rng.uniform(0, 10_000_000):.2f}" if rng.random() < 0.6 else _text(rng))
+            portfolios.append(portfolio)
+            index += 1
+        entity = {"EntityName": _text(rng), "portfolio": portfolios}
+        size += len(json.dumps(entity))
+        entities.append(entity)
+    return json.dumps([{"documentType": "Statement", "entities": entities}])
+
+
+def check_with_helpers(old_json: str, new_json: str, classification: str) -> Tuple[bool, bool, str]:
+    if not are_investor_account_names_unique(new_json):
+        return False, False, new_json
+    old_fields = extract_portfolio_fields(old_json)
+    new_fields = extract_portfolio_fields(new_json)
+    is_modified = (
+        old_fields.investor != new_fields.investor
+        or old_fields.account != new_fields.account
+        or parse_datetime(old_fields.period_ending_dt) != parse_datetime(new_fields.period_ending_dt)
+    )
+    return True, is_modified, new_json
+
+
+def check_with_document(old_json: str, new_json: str, classification: str) -> Tuple[bool, bool, str]:
+    old_document = ExtractionDocument(old_json)
+    new_document = ExtractionDocument(new_json)
+    if not new_document.are_investor_account_names_unique():
+        return False, False, new_json
+    is_modified = bool(old_document.diff_key_fields(new_document, classification, classification))
+    return True, is_modified, new_document.to_json()
+
+
+def time_check(
+    pairs: List[Tuple[str, str]], check: Callable[[str, str, str], Tuple[bool, bool, str]]
+) -> Tuple[List[float], List[Tuple[bool, bool, int]]]:
+    latencies = []
+    decisions = []
+    for old_json, new_json in pairs:
+        started = time.perf_counter()
+        unique, modified, stored = check(old_json, new_json, "CapitalAccount")
+        latencies.append(time.perf_counter() - started)
+        decisions.append((unique, modified, len(stored)))
+    return latencies, decisions
+
+
+def run(size_mb: float, samples: int, seed: int) -> bool:
+    rng = random.Random(seed)
+    size_bytes = int(size_mb * 1024 * 1024)
+    pairs = []
+    for _ in range(samples):
+        old_json = generate_document(rng, size_bytes)
+        # The edited document changes the first investor name, as the review screen does
+        new_document = ExtractionDocument(old_json)
+        new_document.set_portfolio_value("Investor", "Investor edited")
+        pairs.append((old_json, new_document.to_json()))
+    average_kb = statistics.mean(len(new_json) for _, new_json in pairs) / 1024
+
+    print(f"{samples} document pair(s), {average_kb:.0f} KB per document")
+    print(f"{'path':>10} {'p50 ms':>9} {'mean ms':>9} {'max ms':>9}")
+    results = {}
+    for name, check in (("helpers", check_with_helpers), ("document", check_with_document)):
+        latencies, decisions = time_check(pairs, check)
+        results[name] = (latencies, decisions)
+        print(f"{name:>10} {statistics.median(latencies) * 1000:>9.1f} "
+              f"{statistics.mean(latencies) * 1000:>9.1f} {max(latencies) * 1000:>9.1f}")
+
+    speedup = statistics.median(results["helpers"][0]) / statistics.median(results["document"][0])
+    print(f"speedup (p50): {speedup:.2f}x")
+    identical = results["helpers"][1] == results["document"][1]
+    print("decisions identical" if identical else "decisions DIFFER")
+    return identical
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark extraction document parsing for update_extract_file.")
+    parser.add_argument("--size-mb", type=float, default=5.0, help="Approximate document size in MB (default: 5)")
+    parser.add_argument("--samples", type=int, default=10, help="Document pairs to check (default: 10)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    args = parser.parse_args()
+
+    return 0 if run(args.size_mb, args.samples, args.seed) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Micro-benchmark for compressed extraction payload storage.
+
+Generates synthetic extraction JSON, bounding box and confidence score payloads
+of increasing size, encodes them into frames with every available codec, and
+reports stored size against write and read (decompress) latency. Every decoded value is checked against its original.
+Runs offline; no database is needed.
+
+    python -m benchmarks.extraction_payload_compression_bench --field-counts 50,500,5000 --samples 50
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from src.domain.entities.compressed_payload import CODEC_MARKERS, compress_text, decompress_text, zstandard
+
+FIELD_NAMES = [
+    "InvestorName", "AccountNumber", "FundName", "NoticeDate", "DueDate", "CallAmount",
+    "DistributionAmount", "Commitment", "UnfundedCommitment", "NAV", "Currency", "Period",
+]
+VOCABULARY = [
+    "capital", "call", "distribution", "fund", "partners", "growth", "equity", "credit",
+    "holdings", "quarterly", "statement", "investor", "notice", "USD", "EUR", "LP", "II", "IV",
+]
+
+
+def _value(rng: random.Random) -> str:
+    if rng.random() < 0.4:
+        return f"{rng.uniform(0, 10_000_000):.2f}"
+    return " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(1, 5)))
+
+
+def generate_payloads(rng: random.Random, field_count: int) -> Dict[str, str]:
+    fields = [
+        {"name": f"{rng.choice(FIELD_NAMES)}_{index}", "value": _value(rng), "page": rng.randint(1, 40)}
+        for index in range(field_count)
+    ]
+    boxes = [
+        {
+            "field": field["name"],
+            "page": field["page"],
+            "box": [round(rng.uniform(0, 1), 4) for _ in range(4)],
+        }
+        for field in fields
+    ]
+    scores = {field["name"]: round(rng.uniform(0.5, 1.0), 4) for field in fields}
+    return {
+        "extraction_data": json.dumps({"fields": fields}),
+        "bounding_box_data": json.dumps(boxes),
+        "confidence_scores": json.dumps(scores),
+    }
+
+
+def time_codec(
+    payloads: List[str], encode: Callable[[str], bytes], decode: Callable[[bytes], str]
+) -> Tuple[int, List[float], List[float], int]:
+    stored = 0
+    write_latencies = []
+    read_latencies = []
+    mismatches = 0
+    for payload in payloads:
+        started = time.perf_counter()
+        frame = encode(payload)
+        write_latencies.append(time.perf_counter() - started)
+        stored += len(frame)
+
+        started = time.perf_counter()
+        value = decode(frame)
+        read_latencies.append(time.perf_counter() - started)
+        if value != payload:
+            mismatches += 1
+    return stored, write_latencies, read_latencies, mismatches
+
+
+def percentile(latencies: List[float], fraction: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[max(0, int(round(fraction * len(ordered))) - 1)]
+
+
+def run(field_counts: List[int], samples: int, seed: int) -> bool:
+    codecs = [codec for codec in CODEC_MARKERS if codec != "zstd" or zstandard is not None]
+    all_identical = True
+
+    print(f"{'fields':>7} {'codec':>6} {'raw KB':>9} {'stored KB':>10} {'saved':>7} "
+          f"{'write p50 ms':>13} {'read p50 ms':>12} {'read p99 ms':>12}")
+    for field_count in field_counts:
+        rng = random.Random(seed + field_count)
+        payloads = [
+            value
+            for _ in range(samples)
+            for value in generate_payloads(rng, field_count).values()
+        ]
+        raw_bytes = sum(len(payload.encode("utf-8")) for payload in payloads)
+
+        for codec in codecs:
+            stored, writes, reads, mismatches = time_codec(
+                payloads,
+                lambda value, codec=codec: compress_text(value, codec),
+                decompress_text,
+            )
+            saved = 1 - stored / raw_bytes if raw_bytes else 0.0
+            print(f"{field_count:>7} {codec:>6} {raw_bytes / 1024:>9.1f} {stored / 1024:>10.1f} {saved:>7.1%} "
+                  f"{statistics.median(writes) * 1000:>13.3f} {statistics.median(reads) * 1000:>12.3f} "
+                  f"{percentile(reads, 0.99) * 1000:>12.3f}")
+            if mismatches:
+                all_identical = False
+                print(f"        ROUND TRIP MISMATCH on {mismatches} payload(s) with {codec}")
+
+    if zstandard is None:
+        print("zstd skipped: zstandard is not installed")
+    print("round trips identical" if all_identical else "round trips DIFFER")
+    return all_identical
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compressed extraction payload storage.")
+    parser.add_argument("--field-counts", default="50,500,5000",
+                        help="Comma separated extracted field counts per file (default: 50,500,5000)")
+    parser.add_argument("--samples", type=int, default=50, help="Synthetic files per field count (default: 50)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    args = parser.parse_args()
+
+    field_counts = [int(count) for count in args.field_counts.split(",") if count.strip()]
+    return 0 if run(field_counts, args.samples, args.seed) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
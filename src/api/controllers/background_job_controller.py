@@ -0,0 +1,99 @@
+from importlib import import_module
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from src.core.settings import get_connection_config
+from src.domain.dtos.background_job_dto import (
+    BackgroundJobItemsResponse,
+    BackgroundJobResponse,
+    CreateFileJobRequest,
+)
+from src.domain.enums.background_job_enums import BackgroundJobItemStatus
+from src.domain.services.background_job_service import BackgroundJobService
+from src.infrastructure.database.connection_manager import get_db
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/jobs", tags=["BackgroundJob"])
+
+
+def get_background_job_service(db: Session = Depends(get_db)) -> BackgroundJobService:
+    """
+    Dependency provider for BackgroundJobService.
+    Dynamically loads the repository based on the active connection configuration.
+    """
+    try:
+        _, active_repository_path = get_connection_config()
+        module_path = f"{active_repository_path}.background_job_repository"
+        repository_module = import_module(module_path)
+        repository_cls = getattr(repository_module, "BackgroundJobRepository")
+
+        repository = repository_cls()
+        return BackgroundJobService(repository)
+    except (ImportError, AttributeError) as e:
+        logger.critical(f"Failed to load BackgroundJobRepository: {e}", exc_info=True)
+        raise RuntimeError("Configuration error: Repository could not be loaded.")
+
+
+@router.post("/files", response_model=BackgroundJobResponse, status_code=202)
+def create_file_job(
+    request: CreateFileJobRequest,
+    service: BackgroundJobService = Depends(get_background_job_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a replay, ignore, restore or approve for a batch of files.
+
+    Returns immediately with the job id; poll GET /jobs/{jobuid} for progress
+    and GET /jobs/{jobuid}/items for per-file outcomes.
+    """
+    logger.info(f"CreateFileJobApi called: jobtype={request.jobtype.value}, files={len(request.fileuids)}")
+    return service.create_file_job(db, request)
+
+
+@router.get("/{jobuid}", response_model=BackgroundJobResponse)
+def get_job(
+    jobuid: UUID,
+    service: BackgroundJobService = Depends(get_background_job_service),
+    db: Session = Depends(get_db),
+):
+    job = service.get_job(db, jobuid)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/{jobuid}/items", response_model=BackgroundJobItemsResponse)
+def get_job_items(
+    jobuid: UUID,
+    status: Optional[BackgroundJobItemStatus] = Query(None, alias="Status"),
+    cursor: int = Query(0, alias="Cursor", ge=0),
+    limit: int = Query(100, alias="Limit", ge=1, le=1000),
+    service: BackgroundJobService = Depends(get_background_job_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Per-file outcomes of a job, keyset-paged; pass nextcursor back as Cursor.
+    """
+    items = service.get_job_items(db, jobuid, status.value if status else None, cursor, limit)
+    if items is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return items
+
+
+@router.post("/{jobuid}/cancel", response_model=BackgroundJobResponse)
+def cancel_job(
+    jobuid: UUID,
+    service: BackgroundJobService = Depends(get_background_job_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Cancel a job. Items already processed keep their outcome.
+    """
+    job = service.cancel_job(db, jobuid)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
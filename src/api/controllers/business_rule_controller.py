@@ -1,12 +1,14 @@
 from typing import Optional
 from src.domain.dtos.business_rule_request import BusinessRuleRequest
-from src.domain.dtos.business_rule_api_input import GetBusinessRuleApiInput
+from src.domain.dtos.business_rule_api_input import GetBusinessRuleApiInput, SimulateBusinessRuleInput
 from typing import Any, Dict
-from fastapi import APIRouter, Depends, Query, Body
+from fastapi import APIRouter, Depends, Query, Body, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from importlib import import_module
 from src.api.controllers.base_controller import BaseController
-from src.infrastructure.database.connection_manager import get_db
+from src.infrastructure.database.audit_writer import AuditWriter
+from src.infrastructure.database.connection_manager import SessionLocal, get_db
 from src.domain.services.business_rule_service import BusinessRuleService
 from src.infrastructure.logging.logger_manager import get_logger
 from src.core.settings import get_connection_config
@@ -31,7 +33,7 @@ def get_business_rule_service(db: Session = Depends(get_db)) -> BusinessRuleServ
         business_rule_repository_cls = getattr(repository_module, "BusinessRuleRepository")
         
         repository = business_rule_repository_cls()
-        return BusinessRuleService(repository)
+        return BusinessRuleService(repository, AuditWriter())
     except (ImportError, AttributeError) as e:
         logger.critical(f"Failed to load BusinessRuleRepository: {e}", exc_info=True)
         raise RuntimeError("Configuration error: Repository could not be loaded.")
@@ -122,6 +124,20 @@ class BusinessRuleController(BaseController):
 
     # @router.get("/list", response_model=Dict[str, Any], summary="List all Business Rules")
 
+    @router.post("/simulate", response_model=Dict[str, Any], summary="Simulate a Business Rule")
+    def simulate_rule(
+        input_data: SimulateBusinessRuleInput = Body(..., description="Candidate rule and date window to evaluate"),
+        service: BusinessRuleService = Depends(get_business_rule_service),
+        db: Session = Depends(get_db)
+    ):
+        """
+        Evaluate a candidate rule against historical files without applying it.
+        """
+        logger.info("Request received to simulate a business rule.")
+        return BaseController.safe_execute(lambda:
+            BaseController.success_response(service.simulate_rule(db, input_data))
+        )
+
     @router.patch("/toggle", response_model=Dict[str, Any], summary="Toggle Business Rule Status")
     def toggle_rule_status(
         rule_data: BusinessRuleRequest = Body(..., description="Data identifying the rule to toggle"),
@@ -171,6 +187,8 @@ class BusinessRuleController(BaseController):
         source_type: str = Query(..., alias="SourceType"),
         rule_type: str = Query(..., alias="RuleType"),
         content_type: Optional[str] = Query(None, alias="ContentType"),
+        prefix: Optional[str] = Query(None, alias="Prefix", description="Only return values starting with this text"),
+        limit: Optional[int] = Query(None, alias="Limit", ge=1, le=1000),
         service: BusinessRuleService = Depends(get_business_rule_service),
         db: Session = Depends(get_db)
     ):
@@ -179,33 +197,91 @@ class BusinessRuleController(BaseController):
         """
         logger.info(f"Request received to filter business rules by field: {filter_field}")
         return BaseController.safe_execute(lambda:
-            BaseController.success_response(service.get_business_filter_by_field(db, filter_field, source_type, rule_type, content_type))
+            BaseController.success_response(service.get_business_filter_by_field(db, filter_field, source_type, rule_type, content_type, prefix, limit))
         )
 
     @router.get("/log", response_model=Dict[str, Any], summary="Get Business Rule Log")
     def get_rule_logs(
         rule_id: str = Query(..., alias="Id", description="The ID of the rule"),
+        page_size: Optional[int] = Query(None, alias="PageSize", ge=1, le=500, description="Page size; pages the logs when set"),
+        cursor: Optional[str] = Query(None, alias="Cursor", description="NextCursor from the previous page"),
         service: BusinessRuleService = Depends(get_business_rule_service),
         db: Session = Depends(get_db)
     ):
         """
-        Retrieve logs associated with a specific business rule.
+        Retrieve logs associated with a specific business rule, newest first.
+        Returns every log as a list unless PageSize or Cursor is sent, in which
+        case one page is returned as ResultObject with the NextCursor.
         """
         logger.info(f"Request received to get logs for rule ID: {rule_id}")
         return BaseController.safe_execute(lambda:
-            BaseController.success_response(service.get_business_rule_log(db, rule_id))
+            BaseController.success_response(service.get_business_rule_log(db, rule_id, page_size, cursor))
         )
 
-    # @router.post("/usage-log", response_model=Dict[str, Any], summary="Get Usage Log")
-    # def get_usage_log(
-    #     input_model: Dict[str, Any] = Body(...),
-    #     service: BusinessRuleService = Depends(get_business_rule_service),
-    #     db: Session = Depends(get_db)
-    # ):
-    #     """
-    #     Retrieve usage logs based on input criteria.
-    #     """
-    #     logger.info("Request received to get usage logs.")
-    #     return BaseController.safe_execute(lambda:
-    #         BaseController.success_response(service.get_usage_log_by_rule_api(db, input_model))
-    #     )
+    @router.post("/import", response_model=Dict[str, Any], summary="Import Business Rules")
+    def import_rules(
+        file: UploadFile = File(..., description="JSON lines file, one business rule per line"),
+        service: BusinessRuleService = Depends(get_business_rule_service),
+        db: Session = Depends(get_db)
+    ):
+        """
+        Import many business rules in a single transaction.
+        """
+        logger.info(f"Request received to import business rules from {file.filename}.")
+        content = file.file.read()
+        return BaseController.safe_execute(lambda:
+            BaseController.success_response(service.import_rules(db, content), "Rules successfully imported")
+        )
+
+    @router.get("/export", summary="Export Business Rules")
+    def export_rules(
+        rule_type: Optional[str] = Query(None, alias="RuleType"),
+        service: BusinessRuleService = Depends(get_business_rule_service)
+    ):
+        """
+        Export business rules as JSON lines.
+        """
+        logger.info("Request received to export business rules.")
+
+        # The body streams after the handler returns, so it reads on its own
+        # session instead of the request-scoped one
+        def export_lines():
+            db = SessionLocal()
+            try:
+                yield from service.export_rules(db, rule_type)
+            finally:
+                db.close()
+
+        return StreamingResponse(
+            export_lines(),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": "attachment; filename=business_rules.jsonl"}
+        )
+
+    @router.post("/usage/reconcile", response_model=Dict[str, Any], summary="Reconcile Business Rule Usage")
+    def reconcile_rule_usage(
+        service: BusinessRuleService = Depends(get_business_rule_service),
+        db: Session = Depends(get_db)
+    ):
+        """
+        Recompute the rule usage counters from the file table and correct any drift.
+        """
+        logger.info("Request received to reconcile business rule usage.")
+        return BaseController.safe_execute(lambda:
+            BaseController.success_response(service.reconcile_rule_usage(db), "Rule usage reconciled")
+        )
+
+    @router.post("/usage-log", response_model=Dict[str, Any], summary="Get Usage Log")
+    def get_usage_log(
+        input_model: Dict[str, Any] = Body(...),
+        service: BusinessRuleService = Depends(get_business_rule_service),
+        db: Session = Depends(get_db)
+    ):
+        """
+        Retrieve usage logs based on input criteria.
+        Pages are keyset based: pass the returned NextCursor as Cursor to fetch the next page.
+        """
+        logger.info("Request received to get usage logs.")
+        return BaseController.safe_execute(lambda:
+            BaseController.success_response(service.get_usage_log_by_rule_api(db, input_model))
+        )
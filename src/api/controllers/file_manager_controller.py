@@ -1,31 +1,45 @@
 from src.domain.dtos.file_manager_dto import ReplayFileRequestDTO
 from src.domain.dtos.response_object import ResponseObject
-from src.domain.dtos.file_request_dto import FileRequestDTO
+from src.domain.dtos.file_request_dto import FileRequestDTO, FileUploadRequest
 from src.infrastructure.database.postgres_repositories.file_manager_repository import (
     FileManagerRepository,
 )
 from importlib import import_module
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from src.core.settings import get_connection_config
+from src.core.settings import get_connection_config, settings
 from src.domain.services.file_manager_service import FileManagerService
 from src.domain.dtos.file_manager_dto import (
     FileManagerFilter,
     FileManagerResponse,
     IgnoreFilesRequest,
     ApproveFileRequest,
+    ApproveFilesRequest,
+    ApproveFileResult,
 )
-from src.domain.dtos.extract_file_dto import ExtractFile
+from src.domain.dtos.extract_file_dto import EXTRACTION_PAYLOAD_FIELDS, ExtractFile
 from src.domain.dtos.file_comment_dto import AddFileCommentRequest
 from src.domain.dtos.update_extract_file_dto import (
     UpdateExtractFileRequest,
     ResponseObjectModel,
 )
-from src.domain.dtos.file_details_dto import FileDetailsResponse
+from src.domain.dtos.file_details_dto import (
+    FileDetailsBatchRequest,
+    FileDetailsBatchResponse,
+    FileDetailsResponse,
+)
+from src.infrastructure.database.audit_writer import AuditWriter
 from src.infrastructure.database.connection_manager import get_db
 from src.infrastructure.logging.logger_manager import get_logger
+from src.infrastructure.storage.local_blob_storage import LocalBlobStorage
+from src.utils.json_splice import JSONFragment, render_json
+from src.utils.multipart_stream import StreamingMultipartReader, UploadLimitExceeded
 from uuid import UUID
 from typing import Dict, List
+from urllib.parse import quote
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/files", tags=["FileManager"])
@@ -43,7 +57,12 @@ def get_file_manager_service(db: Session = Depends(get_db)) -> FileManagerServic
         repository_cls = getattr(repository_module, "FileManagerRepository")
 
         repository = repository_cls()
-        return FileManagerService(repository)
+        return FileManagerService(
+            repository,
+            AuditWriter(),
+            LocalBlobStorage(settings.blob_storage_directory),
+            settings.blob_storage_max_concurrent_writes,
+        )
     except (ImportError, AttributeError) as e:
         logger.critical(f"Failed to load FileManagerRepository: {e}", exc_info=True)
         raise RuntimeError("Configuration error: Repository could not be loaded.")
@@ -95,6 +114,23 @@ def get_file_details_by_fileuid(
     return service.get_file_details_by_file_uid(db, fileuid)
 
 
+@router.post("/get-file-details-by-fileuids", response_model=FileDetailsBatchResponse)
+def get_file_details_by_fileuids(
+    request: FileDetailsBatchRequest,
+    service: FileManagerService = Depends(get_file_manager_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Get file details for up to MAX_FILE_DETAILS_BATCH_SIZE fileuids.
+
+    The files are read with one query and the SLA thresholds of their
+    configurations with another. Results are keyed by fileuid; fileuids with
+    no file are returned with found=false.
+    """
+    logger.info(f"GetFileDetailsByFileUIDs called: {len(request.fileuids)} fileuid(s)")
+    return service.get_file_details_by_file_uids(db, request.fileuids)
+
+
 @router.post("/get-manual-extraction-config_fields-by-id")
 def get_manual_extraction_config_fields_by_id(
     fileConfigurationId: int,
@@ -115,6 +151,7 @@ def get_manual_extraction_config_fields_by_id(
 @router.post("/get-extract-file-api", response_model=None)
 def get_extract_file_api(
     fileuid: UUID,
+    raw_payloads: bool = False,
     service: FileManagerService = Depends(get_file_manager_service),
     db: Session = Depends(get_db),
 ):
@@ -128,11 +165,28 @@ def get_extract_file_api(
     - Security mappings for specific classifications (Rage, BrokerageMSBilling)
     - Update file references
 
+    The stored extraction, bounding box and confidence score payloads are
+    spliced into the response body instead of being serialized with the rest
+    of it. By default they are returned as JSON strings, as before; each one is
+    still escaped in full with json.dumps, so this path only skips the DTO and
+    jsonable_encoder copies and saves little. With raw_payloads=true the stored
+    documents are embedded as JSON values: each is parsed once to check it but
+    not escaped or re-encoded (blank payloads as null, text that is not a valid
+    object or array as a string).
+
     Returns:
         ExtractionFileField with all related data
     """
     logger.info(f"GetExtractFileApi called: fileuid={fileuid}")
-    return service.get_extract_file_api(db, fileuid)
+    result = service.get_extract_file_api(db, fileuid)
+
+    detail = result.get("extraction_file_detail")
+    if detail:
+        to_fragment = JSONFragment.raw if raw_payloads else JSONFragment.string
+        for field in EXTRACTION_PAYLOAD_FIELDS:
+            if detail.get(field) is not None:
+                detail[field] = to_fragment(detail[field])
+    return Response(content=render_json(result), media_type="application/json")
 
 
 @router.get("/get-extract-files-by-fileuid-async", response_model=List[ExtractFile])
@@ -207,6 +261,105 @@ def file_retrieval(
     )
 
 
+@router.post(
+    "/upload-files",
+    response_model=ResponseObject,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["type", "harvest_source", "files"],
+                        "properties": {
+                            "type": {"type": "string"},
+                            "harvest_source": {"type": "string"},
+                            "haas": {"type": "boolean"},
+                            "created_by": {"type": "string"},
+                            "files": {
+                                "type": "array",
+                                "items": {"type": "string", "format": "binary"},
+                            },
+                        },
+                    }
+                }
+            },
+        }
+    },
+)
+async def upload_files(
+    request: Request,
+    service: FileManagerService = Depends(get_file_manager_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Upload files as multipart/form-data (streaming alternative to
+    /files-start-processing).
+
+    The body is parsed as it arrives: each file is spooled to disk while its
+    size and SHA-256 checksum are computed, and the request is rejected with
+    413 as soon as the file count or total size limit is exceeded.
+    """
+    try:
+        reader = StreamingMultipartReader(
+            request.headers.get("content-type", ""),
+            max_total_bytes=service.MAX_ALLOWED_SIZE,
+            max_files=service.MAX_FILE_COUNT,
+        )
+        form = await reader.read(request.stream())
+    except UploadLimitExceeded as e:
+        logger.warning(f"UploadFiles rejected: {e}")
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        # MultipartUploadError and the parser's own errors are both ValueErrors
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        try:
+            upload_request = FileUploadRequest.model_validate(form.fields)
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+
+        logger.info(f"UploadFiles called: files={len(form.files)}")
+        # Blob writes, fsyncs and the database transaction block; keep them off the event loop
+        return await run_in_threadpool(service.file_upload, db, upload_request, form.files)
+    finally:
+        form.close()
+
+
+@router.get("/{fileuid}/content", response_class=StreamingResponse)
+def download_file(
+    fileuid: UUID,
+    service: FileManagerService = Depends(get_file_manager_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Download the stored content of a file.
+
+    Blobs on the local filesystem are sent with FileResponse, which the server
+    can hand to sendfile (zero-copy); other backends are streamed in blocks.
+    """
+    blob = service.get_file_blob(db, fileuid)
+    if not blob or not service.storage.head(blob[1]):
+        raise HTTPException(status_code=404, detail="File content not found")
+    filename, path = blob
+
+    local_path = service.storage.local_path(path)
+    if local_path:
+        return FileResponse(local_path, filename=filename, media_type="application/octet-stream")
+
+    def iter_blob():
+        with service.storage.open(path) as handle:
+            yield from iter(lambda: handle.read(1024 * 1024), b"")
+
+    return StreamingResponse(
+        iter_blob(),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"},
+    )
+
+
 @router.post("/replay_files", response_model=ResponseObject)
 async def replay_files(
     request: ReplayFileRequestDTO,
@@ -239,6 +392,24 @@ async def update_file_status_api(
     return await service.update_file_status(db, request)
 
 
+@router.post("/approve-files", response_model=List[ApproveFileResult])
+async def approve_files(
+    request: ApproveFilesRequest,
+    service: FileManagerService = Depends(get_file_manager_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Approve a batch of files for ingestion.
+
+    Every file is validated (linked account present, no SID linked to more
+    than one account); valid files are approved together and the rest are
+    reported with their validation error. For very large batches use the
+    Approve job (POST /jobs/files).
+    """
+    logger.info(f"ApproveFiles called: files={len(request.fileuids)}")
+    return await service.approve_files(db, request)
+
+
 # @router.post("/approve-file", response_model=ResponseObjectModel)
 # async def approve_file(
 #     request: ApproveFileRequest,
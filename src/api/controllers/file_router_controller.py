@@ -8,6 +8,7 @@ from src.core.settings import get_connection_config
 from src.domain.services.file_router_service import FileRouterService
 from src.domain.dtos.extract_file_dto import ExtractFile
 from src.domain.dtos.resolve_file_update_dto import ResolveFileUpdate
+from src.infrastructure.database.audit_writer import AuditWriter
 from src.infrastructure.database.connection_manager import get_db
 from src.infrastructure.logging.logger_manager import get_logger
 from src.api.controllers.base_controller import BaseController
@@ -32,7 +33,7 @@ def get_file_router_service(db: Session = Depends(get_db)) -> FileRouterService:
         repository_cls = getattr(repository_module, "FileRouterRepository")
         
         repository = repository_cls()
-        return FileRouterService(repository)
+        return FileRouterService(repository, AuditWriter())
     except (ImportError, AttributeError) as e:
         logger.critical(f"Failed to load FileRouterRepository: {e}", exc_info=True)
         raise RuntimeError("Configuration error: Repository could not be loaded.")
@@ -0,0 +1,71 @@
+from importlib import import_module
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from src.core.settings import get_connection_config, settings
+from src.domain.dtos.file_workspace_dto import FileWorkspaceResponse, WorkspaceSection
+from src.domain.services.account_master_service import AccountMasterService
+from src.domain.services.file_account_validation_service import FileAccountValidationService
+from src.domain.services.file_activity_service import FileActivityService
+from src.domain.services.file_manager_service import FileManagerService
+from src.domain.services.file_router_service import FileRouterService
+from src.domain.services.file_workspace_service import FileWorkspaceService
+from src.infrastructure.database.audit_writer import AuditWriter
+from src.infrastructure.database.connection_manager import SessionLocal
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/files", tags=["FileWorkspace"])
+
+
+def get_file_workspace_service() -> FileWorkspaceService:
+    """
+    Dependency provider for FileWorkspaceService.
+    Dynamically loads the repositories based on the active connection configuration.
+    Sections open their own sessions, so no request-scoped session is taken here.
+    """
+    try:
+        _, active_repository_path = get_connection_config()
+
+        def load_repository(module_name: str, class_name: str):
+            repository_module = import_module(f"{active_repository_path}.{module_name}")
+            return getattr(repository_module, class_name)()
+
+        audit_writer = AuditWriter()
+        return FileWorkspaceService(
+            SessionLocal,
+            FileManagerService(load_repository("file_manager_repository", "FileManagerRepository"), audit_writer),
+            FileActivityService(load_repository("file_activity_repository", "FileActivityRepository")),
+            FileAccountValidationService(
+                load_repository("file_account_validation_repository", "FileAccountvalidationRepository")
+            ),
+            AccountMasterService(load_repository("account_master_repository", "AccountMasterRepository")),
+            FileRouterService(load_repository("file_router_repository", "FileRouterRepository"), audit_writer),
+            settings.file_workspace_max_concurrent_sections,
+        )
+    except (ImportError, AttributeError) as e:
+        logger.critical(f"Failed to load the file workspace repositories: {e}", exc_info=True)
+        raise RuntimeError("Configuration error: Repository could not be loaded.")
+
+
+@router.get("/{fileuid}/workspace", response_model=FileWorkspaceResponse)
+async def get_file_workspace(
+    fileuid: UUID,
+    sections: Optional[List[WorkspaceSection]] = Query(
+        default=None, description="Sections to include (default: all)"
+    ),
+    service: FileWorkspaceService = Depends(get_file_workspace_service),
+):
+    """
+    Get everything the review screen shows for a file in one request.
+
+    Replaces separate calls to get-file-details-by-fileuid, get-extract-file-api,
+    the activity log, the account validation details, the account-master file
+    data and the file-router extraction data. The requested sections are
+    loaded concurrently, a few at a time; a section that fails is listed in
+    errors and the others are still returned.
+    """
+    logger.info(f"GetFileWorkspace called: fileuid={fileuid}, sections={sections}")
+    return await service.get_workspace(fileuid, sections)
@@ -0,0 +1,144 @@
+from importlib import import_module
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request
+from sqlalchemy.orm import Session
+
+from src.core.settings import get_connection_config, settings
+from src.domain.dtos.upload_session_dto import CreateUploadSessionRequest, UploadSessionResponse
+from src.domain.services.file_manager_service import FileManagerService
+from src.domain.services.upload_session_service import UploadSessionService
+from src.infrastructure.database.audit_writer import AuditWriter
+from src.infrastructure.database.connection_manager import get_db
+from src.infrastructure.logging.logger_manager import get_logger
+from src.infrastructure.storage.local_blob_storage import LocalBlobStorage
+from src.infrastructure.storage.local_upload_spool import LocalUploadSpool
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/upload-sessions", tags=["UploadSession"])
+
+
+def get_upload_session_service(db: Session = Depends(get_db)) -> UploadSessionService:
+    """
+    Dependency provider for UploadSessionService.
+    Dynamically loads the repositories based on the active connection configuration.
+    """
+    try:
+        _, active_repository_path = get_connection_config()
+        session_module = import_module(f"{active_repository_path}.upload_session_repository")
+        file_manager_module = import_module(f"{active_repository_path}.file_manager_repository")
+
+        return UploadSessionService(
+            getattr(session_module, "UploadSessionRepository")(),
+            LocalUploadSpool(settings.upload_spool_directory),
+            FileManagerService(
+                getattr(file_manager_module, "FileManagerRepository")(),
+                AuditWriter(),
+                LocalBlobStorage(settings.blob_storage_directory),
+                settings.blob_storage_max_concurrent_writes,
+            ),
+            chunk_size=settings.upload_session_chunk_size,
+            max_size=settings.upload_session_max_size,
+            ttl_hours=settings.upload_session_ttl_hours,
+        )
+    except (ImportError, AttributeError) as e:
+        logger.critical(f"Failed to load UploadSessionRepository: {e}", exc_info=True)
+        raise RuntimeError("Configuration error: Repository could not be loaded.")
+
+
+def _not_found():
+    return HTTPException(status_code=404, detail="Upload session not found")
+
+
+@router.post("", response_model=UploadSessionResponse, status_code=201)
+def create_upload_session(
+    request: CreateUploadSessionRequest,
+    service: UploadSessionService = Depends(get_upload_session_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Open a resumable upload. The response gives the chunk size and the chunks
+    to send; PUT each one to /upload-sessions/{sessionuid}/chunks/{index}.
+    """
+    logger.info(f"CreateUploadSession called: filename={request.filename}, size={request.totalsize}")
+    try:
+        return service.create_session(db, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{sessionuid}", response_model=UploadSessionResponse)
+def get_upload_session(
+    sessionuid: UUID,
+    service: UploadSessionService = Depends(get_upload_session_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Session state, including the chunks still missing (use it to resume).
+    """
+    session = service.get_session(db, sessionuid)
+    if not session:
+        raise _not_found()
+    return session
+
+
+@router.put(
+    "/{sessionuid}/chunks/{chunk_index}",
+    response_model=UploadSessionResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+)
+async def put_upload_chunk(
+    request: Request,
+    sessionuid: UUID,
+    chunk_index: int = Path(..., ge=0),
+    service: UploadSessionService = Depends(get_upload_session_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Upload one chunk: the raw bytes [chunk_index * chunksize, min((chunk_index + 1) * chunksize, totalsize)).
+    Chunks may arrive in any order and may be retried.
+    """
+    try:
+        session = await service.write_chunk(db, sessionuid, chunk_index, request.stream())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not session:
+        raise _not_found()
+    return session
+
+
+@router.post("/{sessionuid}/finalize", response_model=UploadSessionResponse)
+def finalize_upload_session(
+    sessionuid: UUID,
+    service: UploadSessionService = Depends(get_upload_session_service),
+    db: Session = Depends(get_db),
+):
+    """
+    Verify the SHA-256 of the assembled file and register it as a new file.
+    On a checksum mismatch the received chunks are reset and must be re-sent.
+    """
+    logger.info(f"FinalizeUploadSession called: sessionuid={sessionuid}")
+    try:
+        session = service.finalize(db, sessionuid)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not session:
+        raise _not_found()
+    return session
+
+
+@router.delete("/{sessionuid}", response_model=UploadSessionResponse)
+def abort_upload_session(
+    sessionuid: UUID,
+    service: UploadSessionService = Depends(get_upload_session_service),
+    db: Session = Depends(get_db),
+):
+    session = service.abort(db, sessionuid)
+    if not session:
+        raise _not_found()
+    return session
@@ -0,0 +1,5 @@
+from fastapi import APIRouter
+from src.api.controllers import background_job_controller
+
+router = APIRouter()
+router.include_router(background_job_controller.router)
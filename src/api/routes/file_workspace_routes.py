@@ -0,0 +1,5 @@
+from fastapi import APIRouter
+from src.api.controllers import file_workspace_controller
+
+router = APIRouter()
+router.include_router(file_workspace_controller.router)
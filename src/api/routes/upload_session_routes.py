@@ -0,0 +1,5 @@
+from fastapi import APIRouter
+from src.api.controllers import upload_session_controller
+
+router = APIRouter()
+router.include_router(upload_session_controller.router)
@@ -0,0 +1,185 @@
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from importlib import import_module
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.domain.entities.background_job import BackgroundJob
+from src.domain.enums.background_job_enums import (
+    BackgroundJobItemStatus,
+    BackgroundJobStatus,
+    BackgroundJobType,
+)
+from src.domain.enums.file_porcess_log_enums import FileProcessStatus
+from src.domain.services.file_manager_service import FileManagerService
+from src.infrastructure.database.audit_writer import AuditWriter
+from src.infrastructure.logging.logger_manager import get_logger
+from .settings import get_connection_config
+
+logger = get_logger(__name__)
+
+JobHandler = Callable[[FileManagerService, Session, List[UUID], dict], Dict[UUID, Tuple[str, Optional[str]]]]
+
+# Job type -> chunk handler; each returns {fileuid: (item status, message)} and leaves the commit to the worker
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    BackgroundJobType.Replay.value: lambda service, db, fileuids, payload: service.replay_files_chunk(
+        db, fileuids, payload.get("comment"), payload.get("updatedby") or "SYSTEM"
+    ),
+    BackgroundJobType.Ignore.value: lambda service, db, fileuids, payload: service.update_file_status_chunk(
+        db, fileuids, FileProcessStatus.Ignored.value, payload.get("comment"), payload.get("updatedby") or "SYSTEM"
+    ),
+    BackgroundJobType.Restore.value: lambda service, db, fileuids, payload: service.update_file_status_chunk(
+        db, fileuids, FileProcessStatus.InProgress.value, payload.get("comment"), payload.get("updatedby") or "SYSTEM"
+    ),
+    BackgroundJobType.Approve.value: lambda service, db, fileuids, payload: service.approve_files_chunk(
+        db, fileuids, payload.get("comment"), payload.get("updatedby") or "SYSTEM"
+    ),
+}
+
+
+def _load_repository(module_name: str, class_name: str):
+    _, active_repository_path = get_connection_config()
+    repository_module = import_module(f"{active_repository_path}.{module_name}")
+    return getattr(repository_module, class_name)()
+
+
+class BackgroundJobWorkerPool:
+    """
+    Daemon threads that claim queued jobs and process their items in committed chunks.
+
+    A claimed job carries a lease that is renewed with every chunk. If the owning
+    process dies, the lease runs out and any worker resumes the job from its
+    remaining pending items, so completed chunks are never redone.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        worker_count: int,
+        chunk_size: int,
+        poll_interval_seconds: int,
+        lease_seconds: int,
+    ):
+        self.session_factory = session_factory
+        self.worker_count = worker_count
+        self.chunk_size = max(chunk_size, 1)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease = timedelta(seconds=lease_seconds)
+        self.job_repo = _load_repository("background_job_repository", "BackgroundJobRepository")
+        self.file_service = FileManagerService(
+            _load_repository("file_manager_repository", "FileManagerRepository"), AuditWriter()
+        )
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._instance = f"{socket.gethostname()}:{uuid.uuid4().hex[:8]}"
+
+    def start(self) -> None:
+        for index in range(self.worker_count):
+            thread = threading.Thread(
+                target=self._run,
+                args=(f"{self._instance}:{index}",),
+                name=f"background-job-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"BackgroundJob: Started {self.worker_count} worker(s) on {self._instance}")
+
+    def stop(self, timeout_seconds: float = 30) -> None:
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout_seconds)
+        self._threads.clear()
+
+    def _run(self, owner: str) -> None:
+        while not self._stop_event.is_set():
+            processed = False
+            db = self.session_factory()
+            try:
+                job = self.job_repo.claim_next_job(db, owner, datetime.utcnow() + self.lease)
+                db.commit()
+                if job:
+                    processed = True
+                    self._process_job(db, job.backgroundjobid, owner)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"BackgroundJob: Worker {owner} failed: {e}", exc_info=True)
+            finally:
+                db.close()
+
+            # Go straight to the next job while there is work queued
+            if not processed:
+                self._stop_event.wait(self.poll_interval_seconds)
+
+    def _process_job(self, db: Session, job_id: int, owner: str) -> None:
+        while True:
+            # The row lock is held until the chunk commits, fencing off concurrent claims
+            job = self.job_repo.lock_job(db, job_id)
+            if not job or job.leaseowner != owner or job.status != BackgroundJobStatus.Running.value:
+                logger.warning(f"BackgroundJob: Worker {owner} lost the lease on job {job_id}")
+                db.rollback()
+                return
+
+            now = datetime.utcnow()
+            if self._stop_event.is_set():
+                # Hand the job back so another instance picks it up immediately
+                job.leaseexpires = now
+                db.commit()
+                return
+
+            if job.cancelrequested:
+                cancelled = self.job_repo.cancel_pending_items(db, job)
+                self._finish(job, BackgroundJobStatus.Cancelled.value, now)
+                db.commit()
+                logger.info(f"BackgroundJob: Cancelled job {job.jobuid}; {cancelled} item(s) not processed")
+                return
+
+            handler = JOB_HANDLERS.get(job.jobtype)
+            if handler is None:
+                job.error = f"Unsupported job type: {job.jobtype}"
+                self._finish(job, BackgroundJobStatus.Failed.value, now)
+                db.commit()
+                return
+
+            items = self.job_repo.get_pending_items(db, job_id, self.chunk_size)
+            if not items:
+                self._finish(job, BackgroundJobStatus.Completed.value, now)
+                db.commit()
+                logger.info(
+                    f"BackgroundJob: Completed job {job.jobuid} "
+                    f"({job.succeededcount} succeeded, {job.skippedcount} skipped, {job.failedcount} failed)"
+                )
+                return
+
+            item_ids = {item.fileuid: item.backgroundjobitemid for item in items}
+            try:
+                results = handler(self.file_service, db, list(item_ids), job.payload or {})
+                outcomes = {
+                    item_id: results.get(fileuid, (BackgroundJobItemStatus.Skipped.value, "No outcome recorded"))
+                    for fileuid, item_id in item_ids.items()
+                }
+            except Exception as e:
+                # Undo the partial chunk, then record it as failed under a fresh lock
+                db.rollback()
+                logger.error(f"BackgroundJob: Chunk of job {job_id} failed: {e}", exc_info=True)
+                job = self.job_repo.lock_job(db, job_id)
+                if not job or job.leaseowner != owner:
+                    db.rollback()
+                    return
+                message = str(e)[:500]
+                outcomes = {item_id: (BackgroundJobItemStatus.Failed.value, message) for item_id in item_ids.values()}
+
+            self.job_repo.record_item_outcomes(db, job, outcomes)
+            job.leaseexpires = datetime.utcnow() + self.lease
+            db.commit()
+
+    def _finish(self, job: BackgroundJob, status: str, now: datetime) -> None:
+        job.status = status
+        job.completedon = now
+        job.leaseowner = None
+        job.leaseexpires = None
+        job.updated = now
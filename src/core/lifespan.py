@@ -1,12 +1,127 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from importlib import import_module
 from fastapi import FastAPI
 from typing import AsyncGenerator
-from src.infrastructure.database.connection_manager import init_db, engine
+from src.domain.services.file_manager_service import FileManagerService
+from src.domain.services.upload_session_service import UploadSessionService
+from src.infrastructure.database.audit_writer import AuditWriter
+from src.infrastructure.database.compressed_text import resolve_codec
+from src.infrastructure.database.connection_manager import init_db, engine, SessionLocal
+from src.infrastructure.storage.local_blob_storage import LocalBlobStorage
+from src.infrastructure.storage.local_upload_spool import LocalUploadSpool
 from src.infrastructure.logging.logger_manager import get_logger
-from .settings import settings
+from .background_job_worker import BackgroundJobWorkerPool
+from .settings import settings, get_connection_config
 
 logger = get_logger(__name__)
 
+
+def _reconcile_rule_usage() -> int:
+    """
+    Run one rule usage reconcile pass on its own session.
+    """
+    _, active_repository_path = get_connection_config()
+    repository_module = import_module(f"{active_repository_path}.business_rule_repository")
+    repository = getattr(repository_module, "BusinessRuleRepository")()
+
+    db = SessionLocal()
+    try:
+        return repository.reconcile_rule_usage(db)
+    finally:
+        db.close()
+
+
+def _build_upload_session_service() -> UploadSessionService:
+    _, active_repository_path = get_connection_config()
+    session_module = import_module(f"{active_repository_path}.upload_session_repository")
+    file_manager_module = import_module(f"{active_repository_path}.file_manager_repository")
+
+    return UploadSessionService(
+        getattr(session_module, "UploadSessionRepository")(),
+        LocalUploadSpool(settings.upload_spool_directory),
+        FileManagerService(
+            getattr(file_manager_module, "FileManagerRepository")(),
+            AuditWriter(),
+            LocalBlobStorage(settings.blob_storage_directory),
+            settings.blob_storage_max_concurrent_writes,
+        ),
+        chunk_size=settings.upload_session_chunk_size,
+        max_size=settings.upload_session_max_size,
+        ttl_hours=settings.upload_session_ttl_hours,
+    )
+
+
+def _purge_expired_upload_sessions() -> int:
+    db = SessionLocal()
+    try:
+        return _build_upload_session_service().purge_expired(db)
+    finally:
+        db.close()
+
+
+async def _upload_session_purge_loop(interval_seconds: int) -> None:
+    """
+    Periodically expire abandoned upload sessions and free their spool files.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            purged = await asyncio.to_thread(_purge_expired_upload_sessions)
+            if purged:
+                logger.info(f"Expired {purged} upload session(s)")
+        except Exception as e:
+            logger.error(f"Upload session purge failed: {e}", exc_info=True)
+
+
+def _compact_extraction_payloads(codec: str, batch_size: int) -> int:
+    """
+    Run one extraction payload compaction batch on its own session.
+    """
+    _, active_repository_path = get_connection_config()
+    repository_module = import_module(f"{active_repository_path}.file_manager_repository")
+    repository = getattr(repository_module, "FileManagerRepository")()
+
+    db = SessionLocal()
+    try:
+        return repository.compact_extraction_payloads(db, codec, batch_size)
+    finally:
+        db.close()
+
+
+async def _extraction_payload_compaction_loop(interval_seconds: int, batch_size: int) -> None:
+    """
+    Rewrite existing extraction payloads to the configured codec in committed
+    batches, so the switch never needs a long-running transaction.
+    """
+    codec = resolve_codec()
+    while True:
+        try:
+            total = 0
+            while True:
+                compacted = await asyncio.to_thread(_compact_extraction_payloads, codec, batch_size)
+                total += compacted
+                if compacted < batch_size:
+                    break
+            if total:
+                logger.info(f"Rewrote {total} extraction payload row(s) as {codec}")
+        except Exception as e:
+            logger.error(f"Extraction payload compaction failed: {e}", exc_info=True)
+        await asyncio.sleep(interval_seconds)
+
+
+async def _rule_usage_reconcile_loop(interval_seconds: int) -> None:
+    """
+    Periodically correct drift in the denormalized rule usage counters.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(_reconcile_rule_usage)
+        except Exception as e:
+            logger.error(f"Rule usage reconcile failed: {e}", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Application starting up...")
@@ -17,9 +132,53 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"Database initialization failed: {e}", exc_info=True)
 
+    reconcile_task = None
+    if settings.rule_usage_reconcile_interval_seconds > 0:
+        reconcile_task = asyncio.create_task(
+            _rule_usage_reconcile_loop(settings.rule_usage_reconcile_interval_seconds)
+        )
+
+    purge_task = None
+    if settings.upload_session_purge_interval_seconds > 0:
+        purge_task = asyncio.create_task(
+            _upload_session_purge_loop(settings.upload_session_purge_interval_seconds)
+        )
+
+    compaction_task = None
+    if settings.extraction_payload_compaction_interval_seconds > 0:
+        compaction_task = asyncio.create_task(
+            _extraction_payload_compaction_loop(
+                settings.extraction_payload_compaction_interval_seconds,
+                settings.extraction_payload_compaction_batch_size,
+            )
+        )
+
+    job_workers = None
+    if settings.background_job_worker_count > 0:
+        try:
+            job_workers = BackgroundJobWorkerPool(
+                SessionLocal,
+                worker_count=settings.background_job_worker_count,
+                chunk_size=settings.background_job_chunk_size,
+                poll_interval_seconds=settings.background_job_poll_interval_seconds,
+                lease_seconds=settings.background_job_lease_seconds,
+            )
+            job_workers.start()
+        except Exception as e:
+            logger.error(f"Background job workers failed to start: {e}", exc_info=True)
+            job_workers = None
+
     yield
 
     logger.info("Application shutting down...")
+    if job_workers:
+        await asyncio.to_thread(job_workers.stop)
+    for task in (reconcile_task, purge_task, compaction_task):
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
     try:
         if engine:
             engine.dispose()
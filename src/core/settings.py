@@ -58,6 +58,57 @@ class Settings(BaseSettings):
     client_id: str = Field(default=os.getenv("CLIENT_ID", ""))
     client_secret: str = Field(default=os.getenv("CLIENT_SECRET", ""))
 
+    # ======================================================
+    # Business Rules
+    # ======================================================
+    # Interval of the rule usage reconcile job; 0 disables it
+    rule_usage_reconcile_interval_seconds: int = Field(default=3600)
+
+    # ======================================================
+    # Background Jobs
+    # ======================================================
+    # Worker threads per instance; 0 disables job processing here
+    background_job_worker_count: int = Field(default=2)
+    background_job_chunk_size: int = Field(default=200)
+    background_job_poll_interval_seconds: int = Field(default=5)
+    # A job whose lease is not renewed within this window is resumed by another worker
+    background_job_lease_seconds: int = Field(default=300)
+
+    # ======================================================
+    # Upload Sessions
+    # ======================================================
+    # Local spool for resumable uploads (reference storage backend)
+    upload_spool_directory: str = Field(default=os.getenv("UPLOAD_SPOOL_DIRECTORY", "./data/upload_spool"))
+    upload_session_chunk_size: int = Field(default=8 * 1024 * 1024)
+    upload_session_max_size: int = Field(default=10 * 1024 * 1024 * 1024)
+    upload_session_ttl_hours: int = Field(default=24)
+    # Interval of the expired session purge; 0 disables it
+    upload_session_purge_interval_seconds: int = Field(default=3600)
+
+    # ======================================================
+    # Blob Storage
+    # ======================================================
+    # Root of the local blob storage backend for received files
+    blob_storage_directory: str = Field(default=os.getenv("BLOB_STORAGE_DIRECTORY", "./data/blob_storage"))
+    # Parallel blob writes per upload request
+    blob_storage_max_concurrent_writes: int = Field(default=8)
+
+    # ======================================================
+    # Extraction Payload Compression
+    # ======================================================
+    # Codec the compaction job moves extraction payloads into: none, zlib or zstd (needs zstandard);
+    # writes always store text, "none" moves existing frames back to the text columns
+    extraction_payload_compression: str = Field(default=os.getenv("EXTRACTION_PAYLOAD_COMPRESSION", "none"))
+    # Interval of the job rewriting existing rows to the configured codec; 0 disables it (opt-in)
+    extraction_payload_compaction_interval_seconds: int = Field(default=0)
+    extraction_payload_compaction_batch_size: int = Field(default=500)
+
+    # ======================================================
+    # File Workspace
+    # ======================================================
+    # Sections loaded at once per workspace request, each holding a pooled connection
+    file_workspace_max_concurrent_sections: int = Field(default=3)
+
 
 settings = Settings()
 
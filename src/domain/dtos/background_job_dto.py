@@ -0,0 +1,65 @@
+"""
+Background Job DTOs - Request/Response models for the file batch job API
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from src.domain.enums.background_job_enums import BackgroundJobType
+
+
+class CreateFileJobRequest(BaseModel):
+    """
+    Request model - queue a file batch (replay, ignore, restore or approve) as a job
+    """
+
+    jobtype: BackgroundJobType = Field(description="Replay, Ignore, Restore or Approve")
+    fileuids: List[UUID] = Field(..., min_length=1, description="Files to process")
+    comment: Optional[str] = Field(None, description="Comment recorded on each file")
+    updatedby: Optional[str] = Field("SYSTEM", description="User initiating the job")
+
+
+class BackgroundJobResponse(BaseModel):
+    """
+    Response model - job state and progress counters
+    """
+
+    jobuid: UUID
+    jobtype: str
+    status: str
+    totalcount: int = 0
+    processedcount: int = 0
+    succeededcount: int = 0
+    failedcount: int = 0
+    skippedcount: int = 0
+    cancelrequested: bool = False
+    error: Optional[str] = None
+    created: Optional[datetime] = None
+    createdby: Optional[str] = None
+    startedon: Optional[datetime] = None
+    completedon: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class BackgroundJobItemResponse(BaseModel):
+    """
+    Response model - per-file outcome of a job
+    """
+
+    backgroundjobitemid: int
+    fileuid: UUID
+    status: str
+    message: Optional[str] = None
+    updated: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class BackgroundJobItemsResponse(BaseModel):
+    items: List[BackgroundJobItemResponse] = []
+    nextcursor: Optional[int] = None
@@ -20,3 +20,11 @@ class GetBusinessRuleApiInput(BaseModel):
     FilterEmailBody: Optional[str] = None
     FilterCreatedFrom: Optional[date] = None
     FilterCreatedTo: Optional[date] = None
+
+class SimulateBusinessRuleInput(BaseModel):
+    RuleType: str
+    RuleExpressions: str
+    FromDate: date
+    ToDate: date
+    SampleSize: int = Field(default=50, ge=0, le=1000)
+    ChunkSize: int = Field(default=1000, ge=1, le=10000)
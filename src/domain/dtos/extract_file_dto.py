@@ -70,6 +70,9 @@ class FileSecurityMappingDTO(BaseModel):
     class Config:
         from_attributes = True
 
+# ExtractionFileDetailDTO fields holding stored JSON documents
+EXTRACTION_PAYLOAD_FIELDS = ("extraction_data", "bounding_box_data", "confidence_scores")
+
 class ExtractionFileDetailDTO(BaseModel):
     """DTO for extraction file detail"""
     recid: Optional[int] = None
@@ -1,6 +1,6 @@
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -77,3 +77,26 @@ class FileDetailsItem(BaseModel):
 class FileDetailsResponse(BaseModel):
     total: int = Field(description="Total matching records")
     data: List[FileDetailsItem] = Field(description="File details")
+
+
+# Most fileuids accepted by one batch file details request
+MAX_FILE_DETAILS_BATCH_SIZE = 500
+
+
+class FileDetailsBatchRequest(BaseModel):
+    fileuids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_FILE_DETAILS_BATCH_SIZE,
+        description="Files to return details for",
+    )
+
+
+class FileDetailsBatchItem(BaseModel):
+    found: bool = Field(description="False when no file exists for the fileuid")
+    details: Optional[FileDetailsItem] = None
+
+
+class FileDetailsBatchResponse(BaseModel):
+    total: int = Field(description="Number of requested files that were found")
+    data: Dict[UUID, FileDetailsBatchItem] = Field(description="File details keyed by fileuid")
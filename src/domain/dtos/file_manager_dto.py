@@ -261,6 +261,28 @@ class ApproveFileRequest(BaseModel):
     )
 
 
+class ApproveFilesRequest(BaseModel):
+    """
+    Request model - ApproveFilesRequest (bulk approve)
+    """
+
+    fileuids: List[UUID] = Field(..., min_length=1, description="Files to approve")
+    comment: Optional[str] = Field(default=None, description="User comment")
+    updatedby: Optional[str] = Field(
+        default=None, description="Name of the use who approved the files"
+    )
+
+
+class ApproveFileResult(BaseModel):
+    """
+    Response item model - approve outcome of one file
+    """
+
+    fileuid: UUID
+    resultcode: str
+    resultmessage: str
+
+
 class ReplayFileRequestDTO(BaseModel):
     fileuids: List[UUID4] = Field(
         ..., description="List of unique file identifiers to replay"
@@ -21,3 +21,20 @@ class FileRequestDTO(BaseModel):
     created_by: Optional[str] = Field(
         None, description="User or system that created the request"
     )
+
+
+class FileUploadRequest(BaseModel):
+    """
+    Form fields sent alongside the files of a multipart upload
+    """
+
+    type: str = Field(..., description="File type identifier")
+    harvest_source: str = Field(
+        ..., description="Source system from which the file is harvested"
+    )
+    haas: bool = Field(
+        False, description="Indicates whether the request is processed in HAAS mode"
+    )
+    created_by: Optional[str] = Field(
+        None, description="User or system that created the request"
+    )
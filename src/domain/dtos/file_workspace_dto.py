@@ -0,0 +1,28 @@
+from enum import Enum
+from typing import Any, Dict
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class WorkspaceSection(str, Enum):
+    """
+    Sections of the file workspace bundle, each matching a standalone endpoint.
+    """
+
+    details = "details"  # /files/get-file-details-by-fileuid
+    extraction = "extraction"  # /files/get-extract-file-api
+    activity = "activity"  # /files/activity/get-file-activity-log-api
+    account_validation = "account_validation"  # /files/validation/file-account-details
+    account_data = "account_data"  # /account-master/file-data
+    extraction_data = "extraction_data"  # /file-router/extraction-data
+
+
+class FileWorkspaceResponse(BaseModel):
+    fileuid: UUID
+    sections: Dict[WorkspaceSection, Any] = Field(
+        description="Requested sections, shaped like the responses of their standalone endpoints"
+    )
+    errors: Dict[WorkspaceSection, str] = Field(
+        default_factory=dict, description="Sections that failed to load, with the reason"
+    )
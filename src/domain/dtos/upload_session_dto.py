@@ -0,0 +1,48 @@
+"""
+Upload Session DTOs - Request/Response models for resumable chunked uploads
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class CreateUploadSessionRequest(BaseModel):
+    """
+    Request model - open a resumable upload for one file
+    """
+
+    filename: str = Field(..., min_length=1, description="Name of the uploaded file")
+    type: str = Field(..., description="File type identifier")
+    harvest_source: str = Field(
+        ..., description="Source system from which the file is harvested"
+    )
+    haas: bool = Field(
+        False, description="Indicates whether the request is processed in HAAS mode"
+    )
+    totalsize: int = Field(..., gt=0, description="File size in bytes")
+    checksum: str = Field(
+        ..., pattern=r"^[0-9a-fA-F]{64}$", description="SHA-256 of the whole file (hex)"
+    )
+    created_by: Optional[str] = Field(
+        None, description="User or system that created the request"
+    )
+
+
+class UploadSessionResponse(BaseModel):
+    """
+    Response model - session state; upload every chunk in missingchunks,
+    each chunk i covering bytes [i * chunksize, min((i + 1) * chunksize, totalsize))
+    """
+
+    sessionuid: UUID
+    filename: str
+    status: str
+    totalsize: int
+    chunksize: int
+    chunkcount: int
+    receivedcount: int = 0
+    missingchunks: List[int] = []
+    fileuid: Optional[UUID] = None
+    expireson: Optional[datetime] = None
@@ -15,6 +15,8 @@ from .publishing_control import PublishingControl
 from .master_configuration_type import MasterConfigurationType
 from .validation import Validation
 from .logger import Logs
+from .background_job import BackgroundJob, BackgroundJobItem
+from .upload_session import UploadSession, UploadSessionChunk
 
 __all__ = [
     "Base",
@@ -34,5 +36,9 @@ __all__ = [
     "PublishingControl",
     "MasterConfigurationType",
     "Validation",
-    "Logs"
+    "Logs",
+    "BackgroundJob",
+    "BackgroundJobItem",
+    "UploadSession",
+    "UploadSessionChunk"
 ]
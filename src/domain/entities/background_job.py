@@ -0,0 +1,51 @@
+import uuid
+from sqlalchemy import Column, String, Text, BigInteger, Integer, Boolean, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from src.domain.entities.base_entity import BaseEntity
+
+
+class BackgroundJob(BaseEntity):
+    __tablename__ = "tbl_background_job"
+    __table_args__ = (
+        # Workers claim the oldest pending/expired job
+        Index("ix_tbl_background_job_status", "status", "backgroundjobid"),
+        {"schema": "frame"},
+    )
+
+    backgroundjobid = Column(BigInteger, primary_key=True, autoincrement=True)
+    jobuid = Column(UUID(as_uuid=True), nullable=False, default=uuid.uuid4, unique=True)
+    jobtype = Column(String(100), nullable=False)
+    status = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=True)
+
+    totalcount = Column(Integer, default=0)
+    processedcount = Column(Integer, default=0)
+    succeededcount = Column(Integer, default=0)
+    failedcount = Column(Integer, default=0)
+    skippedcount = Column(Integer, default=0)
+
+    cancelrequested = Column(Boolean, default=False)
+    leaseowner = Column(String(255), nullable=True)
+    leaseexpires = Column(TIMESTAMP(7), nullable=True)
+    startedon = Column(TIMESTAMP(7), nullable=True)
+    completedon = Column(TIMESTAMP(7), nullable=True)
+    error = Column(Text, nullable=True)
+
+    # isactive, created, createdby, updated, updatedby are inherited from BaseEntity
+
+
+class BackgroundJobItem(BaseEntity):
+    __tablename__ = "tbl_background_job_item"
+    __table_args__ = (
+        # Pending items of a job are fetched chunk by chunk in id order
+        Index("ix_tbl_background_job_item_job_status", "backgroundjobid", "status", "backgroundjobitemid"),
+        {"schema": "frame"},
+    )
+
+    backgroundjobitemid = Column(BigInteger, primary_key=True, autoincrement=True)
+    backgroundjobid = Column(BigInteger, nullable=False)
+    fileuid = Column(UUID(as_uuid=True), nullable=False)
+    status = Column(String(50), nullable=False)
+    message = Column(Text, nullable=True)
+
+    # isactive, created, createdby, updated, updatedby are inherited from BaseEntity
@@ -1,11 +1,30 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, Text, TIMESTAMP, Integer, BigInteger
-from sqlalchemy.dialects.postgresql import UUID
-from src.domain.entities.base_entity import BaseEntity
+from sqlalchemy import Column, String, Boolean, Text, TIMESTAMP, Integer, BigInteger, Computed, Index, Sequence
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from src.domain.entities.base_entity import BaseEntity, Base
+
+RULE_ID_PREFIXES = ("IG", "CN", "PW", "ETL")
+
+# Per-prefix counters for uniqueruleid numbers (IG0001) and clone suffixes (IG0001-CLONE0001)
+RULE_ID_SEQUENCES = {
+    prefix: Sequence(f"seq_business_rule_{prefix.lower()}", schema="frame", metadata=Base.metadata)
+    for prefix in RULE_ID_PREFIXES
+}
+RULE_CLONE_SEQUENCES = {
+    prefix: Sequence(f"seq_business_rule_{prefix.lower()}_clone", schema="frame", metadata=Base.metadata)
+    for prefix in RULE_ID_PREFIXES
+}
 
 class BusinessRule(BaseEntity):
     __tablename__ = "tbl_business_rule"
-    __table_args__ = {'schema': 'frame'}
+    __table_args__ = (
+        # Trigram indexes back the rule-grid ILIKE search/filters on the searchable keys (needs pg_trgm)
+        Index("ix_tbl_business_rule_filenamepattern_trgm", "filenamepattern", postgresql_using="gin", postgresql_ops={"filenamepattern": "gin_trgm_ops"}),
+        Index("ix_tbl_business_rule_senderaddresspattern_trgm", "senderaddresspattern", postgresql_using="gin", postgresql_ops={"senderaddresspattern": "gin_trgm_ops"}),
+        Index("ix_tbl_business_rule_subjectpattern_trgm", "subjectpattern", postgresql_using="gin", postgresql_ops={"subjectpattern": "gin_trgm_ops"}),
+        Index("ix_tbl_business_rule_emailbodypattern_trgm", "emailbodypattern", postgresql_using="gin", postgresql_ops={"emailbodypattern": "gin_trgm_ops"}),
+        {'schema': 'frame'},
+    )
 
     businessruleid = Column(BigInteger, primary_key=True, autoincrement=True)
     sourceid = Column(BigInteger, nullable=True) # Changed to BigInteger to match MasterConfigurationType ID
@@ -17,6 +36,15 @@ class BusinessRule(BaseEntity):
     reasonfortoggle = Column(Text)
     filetypeid = Column(BigInteger) # Changed to match MasterConfigurationType ID Refactor
     usage = Column(Integer, default=0) # Added based on C# GetBusinessDataResponse
-    
+
+    # Validated JSON copy of ruleexpressions, written by the repository on save/update/clone
+    ruleexpressionsjson = Column(JSONB, nullable=True)
+
+    # Generated per-key columns so listing/filtering never casts ruleexpressions per row
+    filenamepattern = Column(Text, Computed("ruleexpressionsjson ->> 'FileName'", persisted=True))
+    senderaddresspattern = Column(Text, Computed("ruleexpressionsjson ->> 'SenderAddress'", persisted=True))
+    subjectpattern = Column(Text, Computed("ruleexpressionsjson ->> 'Subject'", persisted=True))
+    emailbodypattern = Column(Text, Computed("ruleexpressionsjson ->> 'EmailBody'", persisted=True))
+
     # isactive, created, createdby, updated, updatedby are inherited from BaseEntity
     # ... any other fields? Step 148 shows this.
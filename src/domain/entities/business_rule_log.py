@@ -1,11 +1,15 @@
 import uuid
-from sqlalchemy import Column, String, Text, BigInteger
+from sqlalchemy import Column, String, Text, BigInteger, Index
 from sqlalchemy.dialects.postgresql import UUID
 from src.domain.entities.base_entity import BaseEntity
 
 class BusinessRuleLog(BaseEntity):
     __tablename__ = "tbl_business_rule_log"
-    __table_args__ = {'schema': 'frame'}
+    __table_args__ = (
+        # Keyset pagination of a rule's change history
+        Index("ix_tbl_business_rule_log_uniqueruleid_created", "uniqueruleid", "created"),
+        {'schema': 'frame'},
+    )
 
     businessrulelogid = Column(BigInteger, primary_key=True, autoincrement=True)
     uniqueruleid = Column(String(255))
@@ -0,0 +1,83 @@
+"""
+Compressed frames for large text payloads.
+
+A frame is a single format marker byte followed by the UTF-8 text, raw or
+compressed. Payload entities keep the original text column and store frames
+in a separate, nullable column next to it: FramedText reads the text column
+when it is set and decodes the frame column otherwise, so rows written as
+plain text (by this API or by the upstream extraction writer) stay readable
+whatever has been compressed.
+"""
+
+import zlib
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, only needed for the zstd codec
+    zstandard = None
+
+# Codec name -> frame format marker (first byte of every frame)
+CODEC_MARKERS = {
+    "none": 0x00,
+    "zlib": 0x01,
+    "zstd": 0x02,
+}
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compress_text(value: str, codec: str) -> bytes:
+    if codec not in CODEC_MARKERS:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    data = value.encode("utf-8")
+    if codec == "zlib":
+        data = zlib.compress(data, ZLIB_LEVEL)
+    elif codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd compression requested but zstandard is not installed")
+        data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return bytes((CODEC_MARKERS[codec],)) + data
+
+
+def decompress_text(frame: bytes) -> str:
+    frame = bytes(frame)
+    marker, payload = frame[0], frame[1:]
+    if marker == CODEC_MARKERS["none"]:
+        data = payload
+    elif marker == CODEC_MARKERS["zlib"]:
+        data = zlib.decompress(payload)
+    elif marker == CODEC_MARKERS["zstd"]:
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed payload found but zstandard is not installed")
+        data = zstandard.ZstdDecompressor().decompress(payload)
+    else:
+        raise ValueError(f"Unknown payload format marker: {marker:#04x}")
+    return data.decode("utf-8")
+
+
+class FramedText:
+    """
+    Text attribute backed by a text column and a compressed frame column.
+
+    Reads return the text column when it is set (upstream writes always win)
+    and the decoded frame otherwise. Writes go to the text column and clear
+    the frame; only the compaction job moves text into frames.
+    """
+
+    def __init__(self, text_attribute: str, frame_attribute: str):
+        self.text_attribute = text_attribute
+        self.frame_attribute = frame_attribute
+
+    def __get__(self, instance, owner) -> Optional[str]:
+        if instance is None:
+            return self
+        text = getattr(instance, self.text_attribute)
+        if text is not None:
+            return text
+        frame = getattr(instance, self.frame_attribute)
+        return decompress_text(frame) if frame is not None else None
+
+    def __set__(self, instance, value: Optional[str]) -> None:
+        setattr(instance, self.text_attribute, value)
+        setattr(instance, self.frame_attribute, None)
@@ -2,8 +2,12 @@ import uuid
 from sqlalchemy import (
     UUID, BigInteger, Column, TIMESTAMP, DateTime, Boolean, Integer, Text, String, Date
 )
+from sqlalchemy.orm import deferred
 from src.domain.entities.base_entity import BaseEntity
 
+# Deferred group of the large Text payloads; queries that return them undefer explicitly
+EXTRACT_FILE_PAYLOAD = "extract_file_payload"
+
 class ExtractFile(BaseEntity):
     __tablename__ = "tbl_extractfile"
     __table_args__ = {'schema': 'frame'}
@@ -12,7 +16,7 @@ class ExtractFile(BaseEntity):
     fileuid = Column(UUID(as_uuid=True), nullable=False, default=uuid.uuid4)
     fileconfigurationid = Column(UUID(as_uuid=True), nullable=True)
     filetype = Column(Text, nullable=True)
-    extracteddata = Column(Text, nullable=True)
+    extracteddata = deferred(Column(Text, nullable=True), group=EXTRACT_FILE_PAYLOAD)
     investor = Column(Text, nullable=True)
     account = Column(Text, nullable=True)
     account_uid = Column(UUID(as_uuid=True), nullable=True)
@@ -28,6 +32,6 @@ class ExtractFile(BaseEntity):
     ignorecomment = Column(Text, nullable=True)
     batchid = Column(Text, nullable=True)
     ingestionstatus = Column(String(10), nullable=True)
-    ingestionlog = Column(Text, nullable=True)
+    ingestionlog = deferred(Column(Text, nullable=True), group=EXTRACT_FILE_PAYLOAD)
     ismanualingested = Column(Boolean, default=False)
     ingestedby = Column(String(100), nullable=True)
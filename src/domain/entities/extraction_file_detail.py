@@ -1,8 +1,13 @@
 import uuid
 from sqlalchemy import (
-    UUID, BigInteger, Column, TIMESTAMP, Boolean, Integer, Text, String, Date
+    UUID, BigInteger, Column, TIMESTAMP, Boolean, Integer, Text, String, Date, LargeBinary
 )
+from sqlalchemy.orm import deferred
 from src.domain.entities.base_entity import BaseEntity
+from src.domain.entities.compressed_payload import FramedText
+
+# Deferred group of the large payloads (text and frame columns); queries that return them undefer explicitly
+EXTRACTION_PAYLOAD = "extraction_payload"
 
 class ExtractionFileDetail(BaseEntity):
     __tablename__ = "tbl_extractionfiledetail"
@@ -11,9 +16,16 @@ class ExtractionFileDetail(BaseEntity):
     recid = Column(BigInteger, primary_key=True, autoincrement=True)
     fileuid = Column(UUID(as_uuid=True), nullable=False, default=uuid.uuid4)
     classification = Column(Text)
-    extraction_data = Column(Text)
-    bounding_box_data = Column(Text)
-    confidence_scores = Column(Text)
+    # Payloads are stored as text, or as a compressed frame once the compaction job has moved them
+    extraction_data_text = deferred(Column("extraction_data", Text), group=EXTRACTION_PAYLOAD)
+    extraction_data_frame = deferred(Column(LargeBinary), group=EXTRACTION_PAYLOAD)
+    bounding_box_data_text = deferred(Column("bounding_box_data", Text), group=EXTRACTION_PAYLOAD)
+    bounding_box_data_frame = deferred(Column(LargeBinary), group=EXTRACTION_PAYLOAD)
+    confidence_scores_text = deferred(Column("confidence_scores", Text), group=EXTRACTION_PAYLOAD)
+    confidence_scores_frame = deferred(Column(LargeBinary), group=EXTRACTION_PAYLOAD)
+    extraction_data = FramedText("extraction_data_text", "extraction_data_frame")
+    bounding_box_data = FramedText("bounding_box_data_text", "bounding_box_data_frame")
+    confidence_scores = FramedText("confidence_scores_text", "confidence_scores_frame")
     duplicate_flag = Column(Boolean)
     duplicate_file_id = Column(UUID(as_uuid=True))
     update_flag = Column(Boolean)
@@ -1,11 +1,15 @@
 import uuid
-from sqlalchemy import UUID, BigInteger, Column, Boolean, Text
+from sqlalchemy import UUID, BigInteger, Column, Boolean, Text, Index, text
 from src.domain.entities.base_entity import BaseEntity
 
 
 class FileActivity(BaseEntity):
     __tablename__ = "tbl_fileactivity"
-    __table_args__ = {"schema": "frame"}
+    __table_args__ = (
+        # Latest-first history per file (previous-state lookup on restore)
+        Index("ix_tbl_fileactivity_fileuid_created", "fileuid", text("created DESC")),
+        {"schema": "frame"},
+    )
 
     fileactivityid = Column(BigInteger, primary_key=True, autoincrement=True)
     fileuid = Column(UUID(as_uuid=True))
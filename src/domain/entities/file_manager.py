@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import TIMESTAMP, BigInteger, Column, String, Integer, DateTime, Boolean, Text
+from sqlalchemy import TIMESTAMP, BigInteger, Column, String, Integer, DateTime, Boolean, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 
 from .base_entity import BaseEntity
@@ -117,7 +117,13 @@ from .base_entity import BaseEntity
 
 class FileManager(BaseEntity):
     __tablename__ = 'tbl_file_manager'
-    __table_args__ = {'schema': 'frame'}
+    __table_args__ = (
+        # Backs the rule usage reconcile and the usage log lookups by rule
+        Index("ix_tbl_file_manager_rule", "rule"),
+        # Content-addressed duplicate detection on received files
+        Index("ix_tbl_file_manager_checksum", "checksum"),
+        {'schema': 'frame'},
+    )
 
     fileid = Column(BigInteger, primary_key=True, autoincrement=True)
     fileuid = Column(UUID(as_uuid=True), nullable=False, default=uuid.uuid4)
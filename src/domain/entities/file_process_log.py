@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, BigInteger
+from sqlalchemy import Column, String, Text, BigInteger, Index
 from sqlalchemy.dialects.postgresql import UUID
 from src.domain.entities.base_entity import BaseEntity
 from src.domain.enums.file_porcess_log_enums import FileProcessStatus, FileProcessStage
@@ -8,7 +8,11 @@ from src.domain.enums.sql_enum import SqlEnum
 
 class FileProcessLog(BaseEntity):
     __tablename__ = "tbl_file_process_log"
-    __table_args__ = {"schema": "frame"}
+    __table_args__ = (
+        # Keyset pagination of the rule usage log
+        Index("ix_tbl_file_process_log_ruleid_created", "ruleid", "created"),
+        {"schema": "frame"},
+    )
 
     fileprocesslogid = Column(BigInteger, primary_key=True, autoincrement=True)
 
@@ -0,0 +1,44 @@
+import uuid
+from sqlalchemy import Column, String, BigInteger, Integer, Boolean, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import UUID
+from src.domain.entities.base_entity import BaseEntity
+
+
+class UploadSession(BaseEntity):
+    __tablename__ = "tbl_upload_session"
+    __table_args__ = (
+        # Expired open sessions are purged periodically
+        Index("ix_tbl_upload_session_status_expireson", "status", "expireson"),
+        {"schema": "frame"},
+    )
+
+    uploadsessionid = Column(BigInteger, primary_key=True, autoincrement=True)
+    sessionuid = Column(UUID(as_uuid=True), nullable=False, default=uuid.uuid4, unique=True)
+    filename = Column(String(450), nullable=False)
+    type = Column(String(450))
+    harvestsource = Column(String(450))
+    haas = Column(Boolean, default=False)
+    totalsize = Column(BigInteger, nullable=False)
+    chunksize = Column(Integer, nullable=False)
+    checksum = Column(String(64), nullable=False)  # SHA-256 hex declared by the client
+    status = Column(String(50), nullable=False)
+    fileuid = Column(UUID(as_uuid=True), nullable=True)  # Set on finalize
+    expireson = Column(TIMESTAMP(7), nullable=False)
+
+    # isactive, created, createdby, updated, updatedby are inherited from BaseEntity
+
+
+class UploadSessionChunk(BaseEntity):
+    __tablename__ = "tbl_upload_session_chunk"
+    __table_args__ = (
+        # A chunk is recorded once however often it is retried
+        Index("ux_tbl_upload_session_chunk_session_index", "uploadsessionid", "chunkindex", unique=True),
+        {"schema": "frame"},
+    )
+
+    uploadsessionchunkid = Column(BigInteger, primary_key=True, autoincrement=True)
+    uploadsessionid = Column(BigInteger, nullable=False)
+    chunkindex = Column(Integer, nullable=False)
+    size = Column(Integer, nullable=False)
+
+    # isactive, created, createdby, updated, updatedby are inherited from BaseEntity
@@ -0,0 +1,24 @@
+from enum import Enum
+
+
+class BackgroundJobType(str, Enum):
+    Replay = "Replay"
+    Ignore = "Ignore"
+    Restore = "Restore"
+    Approve = "Approve"
+
+
+class BackgroundJobStatus(str, Enum):
+    Pending = "Pending"
+    Running = "Running"
+    Completed = "Completed"
+    Failed = "Failed"
+    Cancelled = "Cancelled"
+
+
+class BackgroundJobItemStatus(str, Enum):
+    Pending = "Pending"
+    Succeeded = "Succeeded"
+    Skipped = "Skipped"
+    Failed = "Failed"
+    Cancelled = "Cancelled"
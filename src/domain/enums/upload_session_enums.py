@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class UploadSessionStatus(str, Enum):
+    Open = "Open"
+    Completed = "Completed"
+    Aborted = "Aborted"
+    Expired = "Expired"
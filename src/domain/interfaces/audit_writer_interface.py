@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Any
+from sqlalchemy.orm import Session
+
+
+class IAuditWriter(ABC):
+    """Interface for the FileProcessLog / FileActivity audit writer"""
+
+    @abstractmethod
+    def add_process_log(self, db: Session, **values: Any) -> None:
+        """
+        Queue a FileProcessLog row in the session's current unit of work.
+        """
+        pass
+
+    @abstractmethod
+    def add_activity(self, db: Session, **values: Any) -> None:
+        """
+        Queue a FileActivity row in the session's current unit of work.
+        """
+        pass
+
+    @abstractmethod
+    def flush(self, db: Session) -> int:
+        """
+        Write queued rows now (inside the open transaction); returns the row count.
+        """
+        pass
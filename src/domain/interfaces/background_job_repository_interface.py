@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from src.domain.entities.background_job import BackgroundJob, BackgroundJobItem
+
+
+class IBackgroundJobRepository(ABC):
+    """Interface for BackgroundJob Repository"""
+
+    @abstractmethod
+    def create_job(
+        self, db: Session, job_type: str, fileuids: List[UUID], payload: Dict[str, Any], created_by: str
+    ) -> BackgroundJob:
+        """
+        Insert a job and one pending item per file (caller commits).
+        """
+        pass
+
+    @abstractmethod
+    def get_job(self, db: Session, jobuid: UUID) -> Optional[BackgroundJob]:
+        pass
+
+    @abstractmethod
+    def get_job_items(
+        self, db: Session, job_id: int, status: Optional[str], after_id: int, limit: int
+    ) -> List[BackgroundJobItem]:
+        pass
+
+    @abstractmethod
+    def claim_next_job(self, db: Session, owner: str, lease_until: datetime) -> Optional[BackgroundJob]:
+        """
+        Lock and lease the oldest pending job, or a running job whose lease expired.
+        """
+        pass
+
+    @abstractmethod
+    def lock_job(self, db: Session, job_id: int) -> Optional[BackgroundJob]:
+        """
+        Re-read a job with a row lock held for the rest of the transaction.
+        """
+        pass
+
+    @abstractmethod
+    def get_pending_items(self, db: Session, job_id: int, limit: int) -> List[BackgroundJobItem]:
+        pass
+
+    @abstractmethod
+    def record_item_outcomes(self, db: Session, job: BackgroundJob, outcomes: Dict[int, Any]) -> None:
+        """
+        Persist item outcomes ({item id: (status, message)}) and bump the job counters.
+        """
+        pass
+
+    @abstractmethod
+    def cancel_pending_items(self, db: Session, job: BackgroundJob) -> int:
+        pass
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import BinaryIO, Optional
+from uuid import UUID
+
+
+@dataclass
+class BlobProperties:
+    path: str
+    size: int
+    modified: datetime
+
+
+def build_blob_path(fileuid: UUID, received: datetime) -> str:
+    """
+    Storage path of a received file: {ddMonYYYY}/{fileuid}.
+    """
+    return f"{received.strftime('%d%b%Y')}/{fileuid}"
+
+
+class IBlobStorage(ABC):
+    """Storage for the bytes of received files, addressed by FileManager.filepath"""
+
+    @abstractmethod
+    def put(self, path: str, source: BinaryIO) -> int:
+        """
+        Stream source into the blob at path (replacing it) and return the byte count.
+        The blob only becomes visible once it is completely written.
+        """
+        pass
+
+    @abstractmethod
+    def open(self, path: str) -> BinaryIO:
+        """
+        Readable stream of the blob; raises FileNotFoundError if it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def head(self, path: str) -> Optional[BlobProperties]:
+        pass
+
+    @abstractmethod
+    def delete(self, path: str) -> bool:
+        pass
+
+    def local_path(self, path: str) -> Optional[str]:
+        """
+        Filesystem path of the blob, so downloads can be served zero-copy
+        (sendfile). Remote backends return None and are streamed via open().
+        """
+        return None
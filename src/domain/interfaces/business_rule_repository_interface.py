@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from sqlalchemy.orm import Session
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
 from src.infrastructure.database.base_repository import BaseRepository
 
 class IBusinessRuleRepository(BaseRepository, ABC):
@@ -25,7 +26,7 @@ class IBusinessRuleRepository(BaseRepository, ABC):
         pass
 
     @abstractmethod
-    def update_stage(self, db: Session) -> Any:
+    def update_stage(self, db: Session, audit_writer: IAuditWriter) -> Any:
         pass
 
     @abstractmethod
@@ -37,13 +38,30 @@ class IBusinessRuleRepository(BaseRepository, ABC):
         pass
 
     @abstractmethod
-    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str) -> Any:
+    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str,
+                                     prefix: Optional[str] = None, limit: Optional[int] = None) -> Any:
         pass
 
     @abstractmethod
-    def get_business_rule_log_data(self, db: Session, rule_id: str) -> Any:
+    def get_business_rule_log_data(self, db: Session, rule_id: str, page_size: Optional[int] = None, cursor: Optional[str] = None) -> Any:
         pass
 
     @abstractmethod
     def get_usage_log_by_rule_async(self, db: Session, input_model: Any) -> Any:
         pass
+
+    @abstractmethod
+    def reconcile_rule_usage(self, db: Session) -> int:
+        pass
+
+    @abstractmethod
+    def simulate_rule(self, db: Session, input_model: Any) -> Any:
+        pass
+
+    @abstractmethod
+    def import_rules(self, db: Session, rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def export_rules(self, db: Session, rule_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        pass
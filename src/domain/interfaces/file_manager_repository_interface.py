@@ -4,13 +4,14 @@ from src.domain.entities.extraction_file_detail import ExtractionFileDetail
 from src.domain.entities.file_manager import FileManager
 from typing import Optional
 from abc import abstractmethod
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Set
 from sqlalchemy.orm import Session
 from src.domain.dtos.file_manager_dto import FileManagerFilter
 from src.domain.dtos.update_extract_file_dto import (
     UpdateExtractFileRequest,
     ResponseObjectModel,
 )
+from src.utils.extraction_validator import ValidationPlan
 from uuid import UUID
 
 
@@ -37,6 +38,15 @@ class IFileManagerRepository:
         """
         raise NotImplementedError
 
+    def get_file_details_by_file_uids(self, db: Session, fileuids: List[UUID]) -> Dict:
+        """
+        Returns file details for many fileuids, keyed by fileuid.
+
+        Returns:
+            dict: {"total": int, "data": {fileuid: {"found": bool, "details": Optional[FileDetailsItem]}}}
+        """
+        raise NotImplementedError
+
     def get_manual_extraction_config_fields_by_id(
         self, db: Session, fileconfigurationid: int
     ) -> Dict:
@@ -89,6 +99,16 @@ class IFileManagerRepository:
     ) -> Optional[ExtractionFileDetail]:
         pass
 
+    @abstractmethod
+    def get_extraction_validation_plan(
+        self, db: Session, classification: str
+    ) -> Optional[ValidationPlan]:
+        """
+        Cached validation plan compiled from the active configuration named
+        classification, or None if it has no fields.
+        """
+        pass
+
     @abstractmethod
     def get_file_manager_by_fileuid(
         self, db: Session, fileuid: UUID
@@ -100,9 +120,11 @@ class IFileManagerRepository:
         pass
 
     @abstractmethod
-    def save_file_received(
-        self, db: Session, file: dict, is_manually: bool
-    ) -> ResponseObject:
+    def compact_extraction_payloads(self, db: Session, codec: str, batch_size: int) -> int:
+        pass
+
+    @abstractmethod
+    def save_files_received(self, db: Session, files: List[dict]) -> int:
         pass
 
     @abstractmethod
@@ -132,3 +154,27 @@ class IFileManagerRepository:
     @abstractmethod
     def update_file(self, db: Session, file: FileManager):
         pass
+
+    @abstractmethod
+    def get_files_by_fileuids(self, db: Session, fileuids: List[UUID]) -> List[FileManager]:
+        pass
+
+    @abstractmethod
+    def get_previous_states(self, db: Session, fileuids: List[UUID]) -> Dict[UUID, Any]:
+        pass
+
+    @abstractmethod
+    def bulk_update_files(self, db: Session, rows: List[Dict[str, Any]]):
+        pass
+
+    @abstractmethod
+    def update_files_by_ids(self, db: Session, fileids: List[int], values: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def get_original_files_by_checksums(self, db: Session, checksums: Set[str]) -> Dict[str, UUID]:
+        pass
+
+    @abstractmethod
+    def get_approval_checks(self, db: Session, fileuids: List[UUID]) -> Dict[UUID, Any]:
+        pass
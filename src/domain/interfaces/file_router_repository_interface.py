@@ -2,6 +2,7 @@ from typing import List, Any, Dict
 from sqlalchemy.orm import Session
 from uuid import UUID
 from src.domain.dtos.resolve_file_update_dto import ResolveFileUpdate
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
 
 
 class IFileRouterRepository:
@@ -22,6 +23,7 @@ class IFileRouterRepository:
         self,
         db: Session,
         resolveUpdate: ResolveFileUpdate,
+        audit_writer: IAuditWriter,
     ) -> Dict:
         """
         Resolves file updates
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+from src.domain.entities.upload_session import UploadSession
+
+
+class IUploadSessionRepository(ABC):
+    """Interface for UploadSession Repository"""
+
+    @abstractmethod
+    def create_session(self, db: Session, values: Dict[str, Any]) -> UploadSession:
+        pass
+
+    @abstractmethod
+    def get_session(
+        self, db: Session, sessionuid: UUID, for_update: bool = False
+    ) -> Optional[UploadSession]:
+        """
+        Active session by uid; for_update locks its row until the transaction ends.
+        """
+        pass
+
+    @abstractmethod
+    def record_chunk(self, db: Session, session: UploadSession, chunk_index: int, size: int) -> None:
+        """
+        Mark a chunk received; recording the same chunk again is a no-op.
+        """
+        pass
+
+    @abstractmethod
+    def reset_chunks(self, db: Session, session: UploadSession) -> None:
+        pass
+
+    @abstractmethod
+    def get_received_chunks(self, db: Session, session: UploadSession) -> List[int]:
+        pass
+
+    @abstractmethod
+    def get_expired_sessions(self, db: Session, now: datetime, limit: int) -> List[UploadSession]:
+        pass
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+from uuid import UUID
+
+
+class IUploadSpool(ABC):
+    """Storage for the bytes of in-progress upload sessions"""
+
+    @abstractmethod
+    def allocate(self, sessionuid: UUID, size: int) -> None:
+        """
+        Reserve the spool file for a session.
+        """
+        pass
+
+    @abstractmethod
+    def open_range(self, sessionuid: UUID, offset: int) -> BinaryIO:
+        """
+        Writable handle positioned at offset; closing it makes the write durable.
+        """
+        pass
+
+    @abstractmethod
+    def checksum(self, sessionuid: UUID) -> str:
+        """
+        SHA-256 hex digest of the spooled file.
+        """
+        pass
+
+    @abstractmethod
+    def open_read(self, sessionuid: UUID) -> BinaryIO:
+        """
+        Readable stream of a complete upload, for copying it into blob storage.
+        """
+        pass
+
+    @abstractmethod
+    def discard(self, sessionuid: UUID) -> None:
+        pass
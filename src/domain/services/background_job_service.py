@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.domain.dtos.background_job_dto import (
+    BackgroundJobItemResponse,
+    BackgroundJobItemsResponse,
+    BackgroundJobResponse,
+    CreateFileJobRequest,
+)
+from src.domain.enums.background_job_enums import BackgroundJobStatus
+from src.domain.interfaces.background_job_repository_interface import IBackgroundJobRepository
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackgroundJobService:
+    def __init__(self, repository: IBackgroundJobRepository):
+        self.repo = repository
+
+    def create_file_job(self, db: Session, request: CreateFileJobRequest) -> BackgroundJobResponse:
+        """
+        Queue a file batch; workers pick it up and process it in chunks.
+        """
+        updated_by = request.updatedby or "SYSTEM"
+        try:
+            job = self.repo.create_job(
+                db,
+                job_type=request.jobtype.value,
+                fileuids=request.fileuids,
+                payload={"comment": request.comment, "updatedby": updated_by},
+                created_by=updated_by,
+            )
+            db.commit()
+            logger.info(f"BackgroundJob: Queued {job.jobtype} job {job.jobuid} for {job.totalcount} file(s)")
+            return BackgroundJobResponse.model_validate(job)
+        except Exception as ex:
+            logger.error(f"BackgroundJob: Error occurred while creating job: {ex}", exc_info=True)
+            db.rollback()
+            raise
+
+    def get_job(self, db: Session, jobuid: UUID) -> Optional[BackgroundJobResponse]:
+        job = self.repo.get_job(db, jobuid)
+        return BackgroundJobResponse.model_validate(job) if job else None
+
+    def get_job_items(
+        self, db: Session, jobuid: UUID, status: Optional[str], cursor: int, limit: int
+    ) -> Optional[BackgroundJobItemsResponse]:
+        job = self.repo.get_job(db, jobuid)
+        if not job:
+            return None
+
+        items = self.repo.get_job_items(db, job.backgroundjobid, status, cursor, limit + 1)
+        next_cursor = items[limit - 1].backgroundjobitemid if len(items) > limit else None
+        return BackgroundJobItemsResponse(
+            items=[BackgroundJobItemResponse.model_validate(item) for item in items[:limit]],
+            nextcursor=next_cursor,
+        )
+
+    def cancel_job(self, db: Session, jobuid: UUID) -> Optional[BackgroundJobResponse]:
+        """
+        Pending jobs are cancelled immediately; running jobs stop after the current chunk.
+        """
+        job = self.repo.get_job(db, jobuid)
+        if not job:
+            return None
+
+        # Locked as the workers lock it, so a job cannot be claimed between this read and the commit
+        job = self.repo.lock_job(db, job.backgroundjobid)
+        if job.status == BackgroundJobStatus.Pending.value:
+            self.repo.cancel_pending_items(db, job)
+            job.status = BackgroundJobStatus.Cancelled.value
+            job.completedon = datetime.utcnow()
+        elif job.status == BackgroundJobStatus.Running.value:
+            job.cancelrequested = True
+        job.updated = datetime.utcnow()
+
+        db.commit()
+        return BackgroundJobResponse.model_validate(job)
@@ -1,10 +1,15 @@
-from typing import Any, Dict, List
+import json
+from typing import Any, Dict, Iterator, List, Optional
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
+from src.domain.dtos.business_rule_request import BusinessRuleRequest
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
 from src.domain.interfaces.business_rule_repository_interface import IBusinessRuleRepository
 
 class BusinessRuleService:
-    def __init__(self, repository: IBusinessRuleRepository):
+    def __init__(self, repository: IBusinessRuleRepository, audit_writer: IAuditWriter):
         self.repository = repository
+        self.audit_writer = audit_writer
 
     def save_rule(self, db: Session, rule: Dict[str, Any]) -> int:
         return self.repository.save_rule(db, rule)
@@ -22,7 +27,7 @@ class BusinessRuleService:
         return self.repository.toggle_rule(db, rule)
 
     def update_stage(self, db: Session) -> Any:
-        return self.repository.update_stage(db)
+        return self.repository.update_stage(db, self.audit_writer)
 
     def apply_business_rule_api(self, db: Session) -> int:
         return self.repository.apply_business_rule_api_async(db)
@@ -30,11 +35,44 @@ class BusinessRuleService:
     def get_business_rule_api(self, db: Session, input_data: Any) -> Any:
         return self.repository.get_business_rule_data(db, input_data)
 
-    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str) -> Any:
-        return self.repository.get_business_filter_by_field(db, filter_field, source_type, rule_type, content_type)
+    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str,
+                                     prefix: Optional[str] = None, limit: Optional[int] = None) -> Any:
+        return self.repository.get_business_filter_by_field(db, filter_field, source_type, rule_type, content_type, prefix, limit)
 
-    def get_business_rule_log(self, db: Session, rule_id: str) -> Any:
-        return self.repository.get_business_rule_log_data(db, rule_id)
+    def get_business_rule_log(self, db: Session, rule_id: str, page_size: Optional[int] = None, cursor: Optional[str] = None) -> Any:
+        return self.repository.get_business_rule_log_data(db, rule_id, page_size, cursor)
 
     def get_usage_log_by_rule_api(self, db: Session, input_model: Any) -> Any:
         return self.repository.get_usage_log_by_rule_async(db, input_model)
+
+    def reconcile_rule_usage(self, db: Session) -> int:
+        return self.repository.reconcile_rule_usage(db)
+
+    def simulate_rule(self, db: Session, input_model: Any) -> Any:
+        return self.repository.simulate_rule(db, input_model)
+
+    def import_rules(self, db: Session, content: bytes) -> Dict[str, Any]:
+        """
+        Parse a JSON lines payload (one rule per line) and import it as one batch.
+        Every line is validated before anything is written.
+        """
+        rules = []
+        errors = []
+        for line_number, line in enumerate(content.decode("utf-8-sig").splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                rules.append(BusinessRuleRequest.model_validate_json(line).model_dump())
+            except ValidationError as ex:
+                errors.append(f"Line {line_number}: {ex.errors()[0].get('msg')}")
+
+        if errors:
+            raise ValueError("; ".join(errors))
+        if not rules:
+            raise ValueError("No rules found in import file")
+
+        return self.repository.import_rules(db, rules)
+
+    def export_rules(self, db: Session, rule_type: Optional[str] = None) -> Iterator[str]:
+        for rule in self.repository.export_rules(db, rule_type):
+            yield json.dumps(rule) + "\n"
@@ -1,9 +1,12 @@
 from src.domain.dtos.file_manager_dto import ApproveFileRequest
-from typing import List, Set
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
+import io
 import uuid
 import base64
+import hashlib
 from uuid import UUID
 
 from fastapi import status
@@ -11,33 +14,59 @@ from sqlalchemy.orm import Session
 
 from src.infrastructure.logging.logger_manager import get_logger
 from src.domain.dtos.response_object import ResponseObject
-from src.domain.dtos.file_request_dto import FileRequestDTO
-from src.domain.dtos.file_manager_dto import FileManagerFilter, IgnoreFilesRequest
+from src.domain.dtos.file_request_dto import FileRequestDTO, FileUploadRequest
+from src.domain.dtos.file_manager_dto import (
+    ApproveFileResult,
+    ApproveFilesRequest,
+    FileManagerFilter,
+    IgnoreFilesRequest,
+)
 from src.domain.dtos.update_extract_file_dto import ResponseObjectModel
 from src.domain.enums.file_porcess_log_enums import (
-    FileFailureStage,
     FileProcessStatus,
     FileProcessStage,
 )
-from src.domain.entities.file_process_log import FileProcessLog
-from src.domain.entities.file_activity import FileActivity
 from src.domain.entities.file_manager import FileManager
 from src.domain.interfaces.file_manager_repository_interface import (
     IFileManagerRepository,
 )
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
+from src.domain.interfaces.blob_storage_interface import IBlobStorage, build_blob_path
+from src.domain.services.file_transition_engine import FileTransitionEngine
+from src.domain.enums.background_job_enums import BackgroundJobItemStatus
 from src.domain.dtos.file_manager_dto import FileManagerFilter, IgnoreFilesRequest
-from src.utils.datetime_utils import parse_datetime
-from src.utils.extraction_json_utils import (
-    are_investor_account_names_unique,
-    extract_portfolio_fields,
-)
+from src.utils.multipart_stream import SpooledUpload
+from src.utils.extraction_json_utils import ExtractionDocument
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class ReceivedFile:
+    """A file handed to receive_files(); open() returns a stream of its content."""
+
+    filename: str
+    checksum: Optional[str]
+    open: Callable[[], BinaryIO]
+    size: Optional[int] = None
+    file_uid: UUID = field(default_factory=uuid.uuid4)
+    # Outcome, set by receive_files()
+    duplicate_of: Optional[UUID] = None
+    error: Optional[str] = None
+
+
 class FileManagerService:
-    def __init__(self, repository: IFileManagerRepository):
+    def __init__(
+        self,
+        repository: IFileManagerRepository,
+        audit_writer: IAuditWriter,
+        storage: Optional[IBlobStorage] = None,
+        max_concurrent_writes: int = 8,
+    ):
         self.repo = repository
+        self.audit = audit_writer
+        self.storage = storage
+        self.max_concurrent_writes = max(max_concurrent_writes, 1)
         self.MAX_ALLOWED_SIZE = 1_073_741_824  # 1 GB
         self.MAX_FILE_COUNT = 50
 
@@ -55,6 +84,12 @@ class FileManagerService:
         """
         return self.repo.get_file_details_by_file_uid(db, fileuid)
 
+    def get_file_details_by_file_uids(self, db: Session, fileuids: List[UUID]):
+        """
+        Get file details for many fileuids at once, keyed by fileuid.
+        """
+        return self.repo.get_file_details_by_file_uids(db, fileuids)
+
     def get_manual_extraction_config_fields_by_id(
         self, db: Session, fileConfigurationId: int
     ):
@@ -104,7 +139,8 @@ class FileManagerService:
 
             self.repo.update_file(db, file_detail)
 
-            activity = FileActivity(
+            self.audit.add_activity(
+                db,
                 fileuid=fileuid,
                 status=file_detail.status,
                 stage=file_detail.stage,
@@ -115,7 +151,6 @@ class FileManagerService:
                 created=datetime.utcnow(),
                 isactive=True,
             )
-            self.repo.add_activity(db, activity)
 
             file_type = file_detail.filetypegenai or file_detail.filetypeprocessrule
 
@@ -134,20 +169,20 @@ class FileManagerService:
                 except ValueError:
                     pass
 
-            process_log = FileProcessLog(
+            self.audit.add_process_log(
+                db,
                 fileuid=file_detail.fileuid,
                 status=status_enum,
                 stage=stage_enum,
                 filetype=file_type,
                 fileprocessstage=file_detail.fileprocessstage,
                 ruleid=None,
-                remark=activity.comment,  # "Comment Added"
-                statuscomment=activity.statuscomment,  # User comment
+                remark=file_detail.statuscomment,  # "Comment Added"
+                statuscomment=file_detail.comments,  # User comment
                 createdby=createdby or "SYSTEM",
                 created=datetime.utcnow(),
                 isactive=True,
             )
-            self.repo.add_process_log(db, process_log)
 
             db.commit()
             logger.info(
@@ -170,18 +205,40 @@ class FileManagerService:
         BUSINESS LOGIC ONLY
         """
 
-        old_json = extract_file_detail.extraction_data
-        new_json = request.extraction_file_detail.extracteddata
+        # Each document is parsed once; the checks below share the parsed trees
+        old_document = ExtractionDocument(extract_file_detail.extraction_data)
+        new_document = ExtractionDocument(request.extraction_file_detail.extracteddata)
 
         # 1. Investor + Account uniqueness
-        if not are_investor_account_names_unique(new_json):
+        if not new_document.are_investor_account_names_unique():
             return ResponseObjectModel(
                 resultcode="ERROR",
                 resultmessage="Investor or Account name already exists",
             )
 
-        old_fields = extract_portfolio_fields(old_json)
-        new_fields = extract_portfolio_fields(new_json)
+        # 1b. Structure against the configuration's field tree (plan cached per configuration).
+        # How configuration fields map onto the document is not verified yet, so
+        # violations are logged and returned as warnings; they do not block the save.
+        classification = (
+            request.extraction_file_detail.classification
+            or extract_file_detail.classification
+        )
+        plan = (
+            self.repo.get_extraction_validation_plan(db, classification)
+            if classification
+            else None
+        )
+        warnings = []
+        if plan:
+            warnings = [
+                {"path": violation.path, "message": violation.message}
+                for violation in plan.validate(new_document.root)
+            ]
+            if warnings:
+                logger.warning(
+                    f"update_extract_file: {len(warnings)} violation(s) of the {classification} "
+                    f"configuration in {extract_file_detail.fileuid}: {warnings[:10]}"
+                )
 
         # 2. Configuration change
         is_configuration_changed = (
@@ -191,23 +248,12 @@ class FileManagerService:
         )
 
         # 3. Business date logic
-        old_date = (
-            parse_datetime(old_fields.transaction_date)
-            if extract_file_detail.classification in ("Distribution", "CapCall")
-            else parse_datetime(old_fields.period_ending_dt)
-        )
-
-        new_date = (
-            parse_datetime(new_fields.transaction_date)
-            if request.extraction_file_detail.classification
-            in ("Distribution", "CapCall")
-            else parse_datetime(new_fields.period_ending_dt)
-        )
-
-        is_modified = (
-            old_fields.investor != new_fields.investor
-            or old_fields.account != new_fields.account
-            or old_date != new_date
+        is_modified = bool(
+            old_document.diff_key_fields(
+                new_document,
+                extract_file_detail.classification,
+                request.extraction_file_detail.classification,
+            )
         )
 
         target_status = None
@@ -239,7 +285,7 @@ class FileManagerService:
             file_manager.reason = "File extracted and classified successfully"
 
         # 5. Update extraction detail
-        extract_file_detail.extraction_data = new_json
+        extract_file_detail.extraction_data = new_document.to_json()
         extract_file_detail.isupdate = True
         extract_file_detail.type = "File Manager UX"
         extract_file_detail.updatedby = request.updatedby
@@ -269,12 +315,18 @@ class FileManagerService:
         )
 
         return ResponseObjectModel(
-            resultcode="SUCCESS", resultmessage="Update File save successful"
+            resultcode="SUCCESS",
+            resultobject={"warnings": warnings} if warnings else None,
+            resultmessage="Update File save successful",
         )
 
     def file_retrieval(self, db: Session, request: FileRequestDTO):
         """
-        need to add the file activity and file upload to azure code - pending
+        Register base64-encoded files: validate the batch, store the content
+        and insert the rows and logs in one transaction (receive_files).
+        Returns a result per file, with an error for the ones that failed. As in
+        file_upload, a repeated filename is registered once and its later items
+        are reported with an error.
         """
         response = ResponseObject()
 
@@ -292,23 +344,34 @@ class FileManagerService:
 
         total_size = 0
         processed_names: Set[str] = set()
-        results = []
+        files = []
 
-        # ---------- size + duplicate validation ----------
+        # ---------- size + checksum + duplicate validation ----------
+        # Rejected items (invalid base64, repeated filename) are reported, not registered
         for item in request.files:
+            checksum = None
+            error = None
             try:
                 decoded = base64.b64decode(item.file)
             except Exception:
                 logger.error("Invalid base64 for file %s", item.filename)
-                continue
-
-            total_size += len(decoded)
-
-            if item.filename in processed_names:
-                logger.error("Duplicate detected: %s", item.filename)
-                continue
-
-            processed_names.add(item.filename)
+                error = "Invalid base64 content"
+            else:
+                total_size += len(decoded)
+                checksum = hashlib.sha256(decoded).hexdigest()
+                if item.filename in processed_names:
+                    logger.error("Duplicate detected: %s", item.filename)
+                    error = "Duplicate filename in request"
+                processed_names.add(item.filename)
+
+            files.append(
+                ReceivedFile(
+                    filename=item.filename,
+                    checksum=checksum,
+                    open=lambda content=item.file: io.BytesIO(base64.b64decode(content)),
+                    error=error,
+                )
+            )
 
         if total_size > self.MAX_ALLOWED_SIZE:
             response.result_code = str(status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -316,170 +379,362 @@ class FileManagerService:
             return response
 
         # ---------- processing ----------
-        for item in request.files:
-            file_uid = uuid.uuid4()
+        self.receive_files(
+            db, [f for f in files if not f.error],
+            request.type, request.harvest_source, request.haas, request.created_by,
+        )
+        results = [
+            {
+                "filename": f.filename,
+                "file_uid": None if f.error else str(f.file_uid),
+                "duplicatefileid": str(f.duplicate_of) if f.duplicate_of else None,
+                "error": f.error,
+            }
+            for f in files
+        ]
 
-            if not file_uid:
-                logger.error("Invalid doc_id for file %s", item.filename)
-                continue
+        response.result_code = str(status.HTTP_200_OK)
+        response.result_message = "files processed"
+        response.count = sum(1 for f in files if not f.error)
+        response.result_object = results
 
-            existing_file = self.repo.file_exists(db, file_uid)
-            if existing_file:
-                self._log(
-                    db,
-                    file=existing_file,
-                    status=FileProcessStatus.Duplicate,
-                    stage=FileProcessStage.New,
-                    message=f"File already exists with File ID: {file_uid}",
-                    comments=None,
-                    updated_by=request.created_by or "SYSTEM",
-                )
-                db.commit()
-                continue
+        return response
 
-            extension = item.filename.split(".")[-1] if "." in item.filename else None
-            folder_name = datetime.utcnow().strftime("%d%b%Y")
-
-            file_entity = {
-                "fileuid": file_uid,
-                "type": request.type,
-                "filename": item.filename,
-                "content": item.file,
-                "fileextension": extension,
-                "filepath": f"{folder_name}/{file_uid}",
-                "method": "Haas" if request.haas else "AUTOMATED",
-                "harvestsource": request.harvest_source,
-                "capturemethod": "Manual",
-                # "capture_system": "Manual", # not in the FileManager right now
-                "createdby": request.created_by or "SYSTEM",
-                "created": datetime.utcnow(),
-                "statusdate": datetime.utcnow(),
-                "isactive": True,
-            }
+    def file_upload(
+        self, db: Session, request: FileUploadRequest, uploads: List[SpooledUpload]
+    ) -> ResponseObject:
+        """
+        Register files received through the streaming multipart upload.
+        Count and total size were enforced, and size and checksum computed,
+        while the body streamed in; a repeated filename is registered once and
+        its later parts are reported with an error.
+        """
+        response = ResponseObject()
 
-            rows = self.repo.save_file_received(
-                db=db,
-                file=file_entity,
-                is_manually=True,
-            )
+        if not uploads:
+            response.result_code = str(status.HTTP_500_INTERNAL_SERVER_ERROR)
+            response.result_message = "File Detail null"
+            response.count = 0
+            response.result_object = None
+            return response
 
-            if rows:
-                results.append({"file_uid": str(file_uid)})
-                # Log success
-                self._log(
-                    db,
-                    file=FileManager(fileuid=file_uid),
-                    status=FileProcessStatus.NewFile,
-                    stage=FileProcessStage.New,
-                    message=f"File received: {item.filename}",
-                    comments=None,
-                    updated_by=request.created_by or "SYSTEM",
+        processed_names: Set[str] = set()
+        files = []
+        for upload in uploads:
+            error = None
+            if upload.filename in processed_names:
+                logger.error("Duplicate detected: %s", upload.filename)
+                error = "Duplicate filename in request"
+            processed_names.add(upload.filename)
+            files.append(
+                ReceivedFile(
+                    filename=upload.filename,
+                    checksum=upload.checksum,
+                    open=lambda upload=upload: upload.file,
+                    size=upload.size,
+                    error=error,
                 )
-                db.commit()
+            )
+
+        self.receive_files(
+            db, [f for f in files if not f.error],
+            request.type, request.harvest_source, request.haas, request.created_by,
+        )
+        results = [
+            {
+                "file_uid": None if f.error else str(f.file_uid),
+                "filename": f.filename,
+                "size": f.size,
+                "checksum": f.checksum,
+                "duplicatefileid": str(f.duplicate_of) if f.duplicate_of else None,
+                "error": f.error,
+            }
+            for f in files
+        ]
 
         response.result_code = str(status.HTTP_200_OK)
         response.result_message = "files processed"
-        response.count = len(results)
+        response.count = sum(1 for f in files if not f.error)
         response.result_object = results
 
         return response
 
-    async def replay_files(
-        self, db: Session, fileuids: List[UUID], comment: str, updatedby: str
-    ) -> int:
+    def receive_files(
+        self,
+        db: Session,
+        files: List["ReceivedFile"],
+        file_type: str,
+        harvest_source: str,
+        haas: bool,
+        created_by: Optional[str],
+    ) -> List["ReceivedFile"]:
         """
-        need to add the logs and password rule process
+        Store the content of a batch of received files and register them in
+        one transaction.
+
+        Content is written to blob storage concurrently and every file is
+        validated before anything is inserted; the valid files' FileManager
+        rows and their FileProcessLog and FileActivity rows then go in as one
+        multi-row INSERT per table with a single commit. Each distinct content
+        is stored once: a file matching an earlier file, already stored or in
+        this batch, is registered as Duplicate without a blob of its own.
+
+        Sets duplicate_of or error on every file and returns them in order.
         """
-        processed_count = 0
-        for uid in fileuids:
-            file = self.repo.get_file_by_fileuid(db, uid)
-            if not file:
+        originals = self.find_original_files(db, [f.checksum for f in files])
+        received_on = datetime.utcnow()
+
+        # Content key (checksum, or fileuid when unknown) -> file whose blob holds it
+        owners: Dict[object, ReceivedFile] = {}
+        for f in files:
+            key = f.checksum or f.file_uid
+            if key not in originals and key not in owners:
+                owners[key] = f
+        paths = {key: build_blob_path(owner.file_uid, received_on) for key, owner in owners.items()}
+        stored = self._put_blobs([(paths[key], owner.open) for key, owner in owners.items()])
+
+        # ---------- validation ----------
+        rows = []
+        for f in files:
+            key = f.checksum or f.file_uid
+            owner = owners.get(key)
+            if owner is not None and paths[key] not in stored:
+                f.error = "File content could not be stored"
+                logger.error("Content of %s could not be stored; file skipped", f.filename)
                 continue
 
-            old_status = file.status
+            f.duplicate_of = originals.get(key) or (owner.file_uid if owner is not f else None)
+            rows.append(
+                self._build_received_file(
+                    f, file_type, harvest_source, haas, created_by,
+                    file_path=paths[key] if owner is f else None,
+                    received_on=received_on,
+                )
+            )
 
-            # Apply your existing password rule
-            if (
-                file.reason
-                and "invalid_password" in file.reason.lower()
-                or not file.password
-            ):
-                # await self.apply_password_rule(file.fileuids)
-                pass
+        if not rows:
+            return files
 
-            target_status = None
-            target_stage = None
-
-            # Map FailureStage to new Status/Stage
-            if file.failurestage == "FailedLinking" and file.status == "Failed":
-                target_status = FileProcessStatus.Extract
-                target_stage = FileProcessStage.ExtractReceived
-                file.reason = "File replayed Failed Linked to Extract"
-            elif file.failurestage == "FailedExtraction" and file.status == "Failed":
-                target_status = FileProcessStatus.Captured
-                target_stage = FileProcessStage.DocReady
-                file.reason = "File replayed Failed Extracted to Captured"
-                file.replay = True
-            elif file.failurestage == "FailedIngestion" and file.status == "Failed":
-                target_status = FileProcessStatus.Approved
-                target_stage = FileProcessStage.Approved
-                file.reason = "File replayed Failed Ingestion to Approved"
-            elif file.failurestage == "FailedCapture" and file.status == "Failed":
-                target_status = FileProcessStatus.Captured
-                target_stage = FileProcessStage.DocReady
-                file.reason = "File replayed Failed Capture to Captured"
-            else:
-                continue
+        # ---------- insert ----------
+        try:
+            self.repo.save_files_received(db, rows)
+            for f in files:
+                if not f.error:
+                    self._log_received_file(db, f, created_by or "SYSTEM")
+            db.commit()
+        except Exception as ex:
+            logger.error(f"Error occurred while registering {len(rows)} received file(s): {ex}", exc_info=True)
+            db.rollback()
+            for f in files:
+                if not f.error:
+                    f.error = "File could not be registered"
+                    f.duplicate_of = None
+            for path in stored:
+                self.storage.delete(path)
 
-            file.status = target_status.value
-            file.stage = target_stage.value
-            file.status_comment = (
-                f"Replay: moved '{old_status}' to '{target_status.value}'"
-            )
-            file.comments = comment
-            file.failure_stage = None
-            file.updated = datetime.utcnow()
-            file.updated_by = updatedby or "SYSTEM"
+        return files
+
+    def get_file_blob(self, db: Session, fileuid: UUID) -> Optional[Tuple[str, str]]:
+        """
+        (filename, blob path) of a file's content. A duplicate has no blob of
+        its own and resolves to its original's.
+        """
+        file = self.repo.get_file_by_fileuid(db, fileuid)
+        if not file:
+            return None
 
-            self.repo.update_file(db, file)
+        path = file.filepath
+        if not path and file.duplicatefileid:
+            original = self.repo.get_file_by_fileuid(db, file.duplicatefileid)
+            path = original.filepath if original else None
+        return (file.filename, path) if path else None
 
-            # Save logs
+    def _put_blobs(self, blobs: List[Tuple[str, Callable[[], BinaryIO]]]) -> Set[str]:
+        """
+        Write blobs with at most max_concurrent_writes in flight; returns the
+        paths that were stored. Failures are logged, not raised.
+        """
+        if not blobs:
+            return set()
+        if self.storage is None:
+            raise RuntimeError("Blob storage is not configured")
+
+        def put(path: str, open_source: Callable[[], BinaryIO]) -> str:
+            with open_source() as source:
+                self.storage.put(path, source)
+            return path
+
+        stored: Set[str] = set()
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent_writes, len(blobs))) as executor:
+            futures = {executor.submit(put, path, open_source): path for path, open_source in blobs}
+            for future in as_completed(futures):
+                try:
+                    stored.add(future.result())
+                except Exception as e:
+                    logger.error(f"Failed to store blob {futures[future]}: {e}", exc_info=True)
+        return stored
+
+    def _build_received_file(
+        self,
+        file: "ReceivedFile",
+        file_type: str,
+        harvest_source: str,
+        haas: bool,
+        created_by: Optional[str],
+        file_path: Optional[str],
+        received_on: datetime,
+    ) -> dict:
+        """
+        FileManager row of a received file. A file whose SHA-256 matches an
+        earlier file is stored as Duplicate with duplicatefileid set to the
+        original. Every row carries the same keys so the batch is one INSERT.
+        """
+        extension = file.filename.split(".")[-1] if "." in file.filename else None
+        duplicate_comment = (
+            f"File already exists with File ID: {file.duplicate_of}" if file.duplicate_of else None
+        )
+
+        return {
+            "fileuid": file.file_uid,
+            "type": file_type,
+            "filename": file.filename,
+            "fileextension": extension,
+            "filepath": file_path,
+            "method": "Haas" if haas else "AUTOMATED",
+            "harvestsource": harvest_source,
+            "capturemethod": "Manual",
+            # "capture_system": "Manual", # not in the FileManager right now
+            "checksum": file.checksum,
+            "status": FileProcessStatus.Duplicate.value if file.duplicate_of else None,
+            "duplicatefileid": file.duplicate_of,
+            "statuscomment": duplicate_comment,
+            "createdby": created_by or "SYSTEM",
+            "created": received_on,
+            "statusdate": received_on,
+            "isactive": True,
+        }
+
+    def _log_received_file(self, db: Session, file: "ReceivedFile", created_by: str) -> None:
+        if file.duplicate_of:
+            logger.info(f"Duplicate detected: {file.filename} matches file {file.duplicate_of}")
             self._log(
                 db,
-                file=file,
-                status=target_status,
-                stage=target_stage,
-                message=file.status_comment,
-                comments=comment,
-                updated_by=updatedby,
+                file=FileManager(fileuid=file.file_uid),
+                status=FileProcessStatus.Duplicate,
+                stage=FileProcessStage.New,
+                message=f"File already exists with File ID: {file.duplicate_of}",
+                comments=None,
+                updated_by=created_by,
+            )
+        else:
+            self._log(
+                db,
+                file=FileManager(fileuid=file.file_uid),
+                status=FileProcessStatus.NewFile,
+                stage=FileProcessStage.New,
+                message=f"File received: {file.filename}",
+                comments=None,
+                updated_by=created_by,
             )
 
-            processed_count += 1
+    def find_original_files(self, db: Session, checksums: List[Optional[str]]) -> Dict[str, UUID]:
+        """
+        Map each already-stored checksum to the fileuid of its original file,
+        with one indexed lookup for the whole batch.
+        """
+        return self.repo.get_original_files_by_checksums(db, {c for c in checksums if c})
 
-        return processed_count
+    async def replay_files(
+        self, db: Session, fileuids: List[UUID], comment: str, updatedby: str
+    ) -> int:
+        """
+        Replay failed files back to the stage matching their failure stage.
+        All files are fetched, transitioned and logged as one batch.
+        """
+        try:
+            outcomes = self.replay_files_chunk(db, fileuids, comment, updatedby or "SYSTEM")
+            db.commit()
+            return self._count_succeeded(outcomes)
+        except Exception as ex:
+            logger.error(f"ReplayFiles: Error occurred while replaying files: {ex}", exc_info=True)
+            db.rollback()
+            raise
 
     async def update_file_status(self, db: Session, request: IgnoreFilesRequest) -> int:
-        result = 0
         updated_by = request.updated_by or "SYSTEM"
-
         fileuids = self._parse_fileuids(request.fileuids)
 
-        for fileuid in fileuids:
-            file = self.repo.get_file(db, fileuid)
-            if not file:
-                continue
+        if request.status not in (FileProcessStatus.Ignored.value, FileProcessStatus.InProgress.value):
+            return 0
 
-            if request.status == FileProcessStatus.Ignored.value:
-                self._move_to_ignored(db, file, updated_by, request.comments)
-                result += 1
-                continue
+        try:
+            outcomes = self.update_file_status_chunk(db, fileuids, request.status, request.comments, updated_by)
+            db.commit()
+            return self._count_succeeded(outcomes)
+        except Exception as ex:
+            logger.error(f"UpdateFileStatus: Error occurred while updating file status: {ex}", exc_info=True)
+            db.rollback()
+            raise
 
-            if request.status == FileProcessStatus.InProgress.value:
-                if self._restore_from_ignored(db, file, updated_by, request.comments):
-                    result += 1
+    # ======================================================================
+    # BATCH TRANSITIONS (no commit; used by the endpoints and background jobs)
+    # ======================================================================
+    def replay_files_chunk(
+        self, db: Session, fileuids: List[UUID], comment: Optional[str], updated_by: str
+    ) -> Dict[UUID, Tuple[str, Optional[str]]]:
+        engine = FileTransitionEngine(self.repo, self.audit)
+        files = self.repo.get_files_by_fileuids(db, fileuids)
+        transitions = engine.plan_replay(files, comment, updated_by)
+        engine.apply(db, transitions, comment, updated_by)
+        return self._transition_outcomes(fileuids, files, transitions, "File is not eligible for replay")
+
+    def update_file_status_chunk(
+        self, db: Session, fileuids: List[UUID], status: str, comments: Optional[str], updated_by: str
+    ) -> Dict[UUID, Tuple[str, Optional[str]]]:
+        engine = FileTransitionEngine(self.repo, self.audit)
+        files = self.repo.get_files_by_fileuids(db, fileuids)
+
+        if status == FileProcessStatus.Ignored.value:
+            transitions = engine.plan_ignore(files, updated_by)
+            not_applied = "File could not be moved to Ignored"
+        elif status == FileProcessStatus.InProgress.value:
+            previous_states = self.repo.get_previous_states(db, [f.fileuid for f in files])
+            transitions = engine.plan_restore(files, previous_states, updated_by)
+            not_applied = "No previous state to restore"
+        else:
+            raise ValueError(f"Unsupported status: {status}")
+
+        engine.apply(db, transitions, comments, updated_by)
+        return self._transition_outcomes(fileuids, files, transitions, not_applied)
+
+    def approve_files_chunk(
+        self, db: Session, fileuids: List[UUID], comment: Optional[str], updated_by: str
+    ) -> Dict[UUID, Tuple[str, Optional[str]]]:
+        return {
+            fileuid: (
+                BackgroundJobItemStatus.Succeeded.value
+                if result.resultcode == "SUCCESS"
+                else BackgroundJobItemStatus.Failed.value,
+                result.resultmessage,
+            )
+            for fileuid, result in self._approve_files(db, fileuids, comment, updated_by).items()
+        }
+
+    def _transition_outcomes(self, fileuids, files, transitions, not_applied_message):
+        found = {f.fileuid for f in files}
+        applied = {t.file.fileuid: t.message for t in transitions}
+        outcomes = {}
+        for fileuid in fileuids:
+            if fileuid in applied:
+                outcomes[fileuid] = (BackgroundJobItemStatus.Succeeded.value, applied[fileuid])
+            elif fileuid in found:
+                outcomes[fileuid] = (BackgroundJobItemStatus.Skipped.value, not_applied_message)
+            else:
+                outcomes[fileuid] = (BackgroundJobItemStatus.Skipped.value, "File not found")
+        return outcomes
 
-        db.commit()
-        return result
+    def _count_succeeded(self, outcomes) -> int:
+        return sum(1 for status, _ in outcomes.values() if status == BackgroundJobItemStatus.Succeeded.value)
 
     async def approve_file(
         self, db: Session, request: ApproveFileRequest
@@ -488,73 +743,11 @@ class FileManagerService:
         Approve a file for ingestion.
         """
         try:
-            # 1. Get file detail
-            file_detail = self.repo.get_file(db, request.fileUid)
-            if not file_detail:
-                logger.warning(
-                    f"ApproveFile: File with fileUid {request.fileUid} not found."
-                )
-                return ResponseObjectModel(
-                    resultcode="ERROR", resultmessage="File detail not found."
-                )
-
-            # 2. Check if has linked account
-            extract_files = self.repo.get_extract_files_by_file_uid(db, request.fileUid)
-            linked_files = [x for x in extract_files if x.islinked and not x.isignored]
-
-            if not linked_files:
-                logger.warning(
-                    f"ApproveFile: No active linked extract file found for fileUid {request.fileUid}."
-                )
-                return ResponseObjectModel(
-                    resultcode="ERROR",
-                    resultmessage="Please link at least one account before approving the file.",
-                )
-
-            # 3. Check for duplicates by account_sid
-            from collections import Counter
-
-            account_sids = [x.account_sid for x in linked_files if x.account_sid]
-            sid_counts = Counter(account_sids)
-            duplicate_sid = next(
-                (sid for sid, count in sid_counts.items() if count > 1), None
-            )
-
-            if duplicate_sid:
-                return ResponseObjectModel(
-                    resultcode="400",
-                    resultmessage=f"SID: {duplicate_sid} is linked to multiple accounts. Either ignore the SID or change the linked SID for the duplicated account.",
-                )
-
-            # 4. Update file status
-            file_detail.status = FileProcessStatus.Approved.value
-            file_detail.statusdate = datetime.utcnow()
-            file_detail.stage = FileProcessStage.Approved.value
-            file_detail.reason = "File is ready for ingestion."
-            file_detail.updatedby = request.updatedby or "SYSTEM"
-            file_detail.updated = datetime.utcnow()
-            file_detail.statuscomment = "File approved successfully."
-
-            self.repo.update_file(db, file_detail)
-
-            # 5. Save logs
-            self._log(
-                db,
-                file=file_detail,
-                status=FileProcessStatus.Approved,
-                stage=FileProcessStage.Approved,
-                message="File approved successfully.",
-                comments=request.comment,
-                updated_by=request.updatedby or "SYSTEM",
-                process_message="Manual file approved.",
-            )
-
-            db.commit()
-            logger.info(f"ApproveFile: File approved for fileUid {file_detail.fileuid}")
-
-            return ResponseObjectModel(
-                resultcode="SUCCESS", resultmessage="File approved successfully."
-            )
+            result = self._approve_file(db, request)
+            if result.resultcode == "SUCCESS":
+                db.commit()
+                logger.info(f"ApproveFile: File approved for fileUid {request.fileUid}")
+            return result
 
         except Exception as ex:
             logger.error(
@@ -567,131 +760,131 @@ class FileManagerService:
                 resultmessage="An error occurred while approving the file. Please try again later.",
             )
 
-    # ======================================================================
-    # IGNORED
-    # ======================================================================
-    def _move_to_ignored(self, db, file, updated_by, comments):
-        now = datetime.utcnow()
+    async def approve_files(
+        self, db: Session, request: ApproveFilesRequest
+    ) -> List[ApproveFileResult]:
+        """
+        Approve a batch of files: one grouped validation query, one UPDATE for
+        the valid files and a single commit. Returns a result per file.
+        """
+        updated_by = request.updatedby or "SYSTEM"
+        try:
+            results = self._approve_files(db, request.fileuids, request.comment, updated_by)
+            db.commit()
+        except Exception as ex:
+            logger.error(
+                f"ApproveFiles: Error occurred while approving {len(request.fileuids)} file(s): {ex}",
+                exc_info=True,
+            )
+            db.rollback()
+            results = {
+                fileuid: ResponseObjectModel(
+                    resultcode="ERROR",
+                    resultmessage="An error occurred while approving the file. Please try again later.",
+                )
+                for fileuid in request.fileuids
+            }
 
-        file.status = FileProcessStatus.Ignored.value
-        file.stage = FileProcessStage.Ignored
-        file.statusdate = now
-        file.statuscomment = "Manually moved to Ignored"
-        file.reason = "File manually moved to Ignored"
-        file.ignoredby = updated_by
-        file.ignoredon = now
-        file.updated = now
-        file.updatedby = updated_by
-        file.failurestage = None
+        return [
+            ApproveFileResult(
+                fileuid=fileuid,
+                resultcode=result.resultcode,
+                resultmessage=result.resultmessage,
+            )
+            for fileuid, result in results.items()
+        ]
 
-        self.repo.update_file(db, file)
+    def _approve_file(
+        self, db: Session, request: ApproveFileRequest
+    ) -> ResponseObjectModel:
+        """
+        Validate and approve one file without committing.
+        Validation failures return an error result before anything is written.
+        """
+        return self._approve_files(
+            db, [request.fileUid], request.comment, request.updatedby or "SYSTEM"
+        )[request.fileUid]
 
-        self._log(
-            db,
-            file=file,
-            status=FileProcessStatus.Ignored,
-            stage=FileProcessStage.Ignored,
-            message="Manually moved to Ignored",
-            comments=comments,
-            updated_by=updated_by,
-        )
+    def _approve_files(
+        self, db: Session, fileuids: List[UUID], comment: Optional[str], updated_by: str
+    ) -> Dict[UUID, ResponseObjectModel]:
+        """
+        Validate and approve files without committing.
+        """
+        fileuids = list(dict.fromkeys(fileuids))
+        files = {f.fileuid: f for f in self.repo.get_files_by_fileuids(db, fileuids)}
+        checks = self.repo.get_approval_checks(db, list(files))
 
-    # ======================================================================
-    # RESTORE FROM IGNORED (STATE MACHINE)
-    # ======================================================================
-    def _restore_from_ignored(self, db, file, updated_by, comments) -> bool:
-        prev = self._get_previous_state(db, file.fileuid)
-        if not prev:
-            return False
+        results = {}
+        approved = []
+        for fileuid in fileuids:
+            # 1. File must exist
+            file_detail = files.get(fileuid)
+            if not file_detail:
+                logger.warning(f"ApproveFile: File with fileUid {fileuid} not found.")
+                results[fileuid] = ResponseObjectModel(
+                    resultcode="ERROR", resultmessage="File detail not found."
+                )
+                continue
 
-        # -------- Failure-specific transitions --------
-        if prev.status == FileProcessStatus.Failed.value and prev.failurestage in [
-            e.value for e in FileFailureStage
-        ]:
-            message = f"File process from Ignored to {prev.failurestage}"
-            self._apply_restore(
-                db,
-                file=file,
-                status=FileProcessStatus.Failed,
-                stage=FileProcessStage(prev.stage),
-                failure_stage=prev.failurestage,
-                message=message,
-                comments=comments,
-                updated_by=updated_by,
-            )
-            return True
+            # 2. At least one linked account
+            check = checks.get(fileuid)
+            if not check or not check.linkedcount:
+                logger.warning(
+                    f"ApproveFile: No active linked extract file found for fileUid {fileuid}."
+                )
+                results[fileuid] = ResponseObjectModel(
+                    resultcode="ERROR",
+                    resultmessage="Please link at least one account before approving the file.",
+                )
+                continue
 
-        # -------- Captured → DocReady --------
-        if (
-            prev.status == FileProcessStatus.Captured.value
-            and prev.stage == FileProcessStage.DocReady.value
-        ):
-            self._apply_restore(
-                db,
-                file=file,
-                status=FileProcessStatus.Captured,
-                stage=FileProcessStage.DocReady,
-                message="File process from Ignored to Captured",
-                comments=comments,
-                updated_by=updated_by,
+            # 3. No SID linked to more than one account
+            if check.duplicatesid:
+                results[fileuid] = ResponseObjectModel(
+                    resultcode="400",
+                    resultmessage=f"SID: {check.duplicatesid} is linked to multiple accounts. Either ignore the SID or change the linked SID for the duplicated account.",
+                )
+                continue
+
+            approved.append(file_detail)
+            results[fileuid] = ResponseObjectModel(
+                resultcode="SUCCESS", resultmessage="File approved successfully."
             )
-            return True
 
-        # -------- Default (includes Ingestion In Progress → Approved) --------
-        new_status = (
-            FileProcessStatus.Approved
-            if prev.status == "Ingestion In Progress"
-            else FileProcessStatus(prev.status)
-        )
+        if not approved:
+            return results
 
-        self._apply_restore(
+        # 4. Update file status
+        now = datetime.utcnow()
+        self.repo.update_files_by_ids(
             db,
-            file=file,
-            status=new_status,
-            stage=FileProcessStage(prev.stage),
-            message=f"File process from Ignored to {new_status.value}",
-            comments=comments,
-            updated_by=updated_by,
+            [f.fileid for f in approved],
+            {
+                "status": FileProcessStatus.Approved.value,
+                "statusdate": now,
+                "stage": FileProcessStage.Approved.value,
+                "reason": "File is ready for ingestion.",
+                "updatedby": updated_by,
+                "updated": now,
+                "statuscomment": "File approved successfully.",
+            },
         )
-        return True
-
-    # ======================================================================
-    # SHARED RESTORE LOGIC (no duplication, same behavior)
-    # ======================================================================
-    def _apply_restore(
-        self,
-        db,
-        file,
-        status,
-        stage,
-        message,
-        comments,
-        updated_by,
-        failure_stage=None,
-    ):
-        now = datetime.utcnow()
 
-        file.status = status.value
-        file.stage = stage
-        file.statusdate = now
-        file.updated = now
-        file.updatedby = updated_by
-        file.failurestage = failure_stage
-        file.reason = message
-        file.statuscomment = message
+        # 5. Save logs
+        for file_detail in approved:
+            self._log(
+                db,
+                file=file_detail,
+                status=FileProcessStatus.Approved,
+                stage=FileProcessStage.Approved,
+                message="File approved successfully.",
+                comments=comment,
+                updated_by=updated_by,
+                process_message="Manual file approved.",
+            )
 
-        self.repo.update_file(db, file)
-
-        self._log(
-            db,
-            file=file,
-            status=status,
-            stage=stage,
-            message=message,
-            comments=comments,
-            updated_by=updated_by,
-            failure_stage=failure_stage,
-        )
+        return results
 
     # ======================================================================
     # LOGGING (ProcessLog + Activity)
@@ -717,58 +910,36 @@ class FileManagerService:
         file_process_stage = getattr(file, "fileprocessstage", None)
 
         # FileProcessLog: statuscomment is the system message
-        self.repo.add_process_log(
+        self.audit.add_process_log(
             db,
-            FileProcessLog(
-                fileuid=file.fileuid,
-                status=status,
-                stage=stage,
-                filetype=file_type,
-                fileprocessstage=file_process_stage,
-                createdby=updated_by,
-                statuscomment=process_message or message,
-                created=now,
-                updated=now,
-                isactive=True,
-            ),
+            fileuid=file.fileuid,
+            status=status,
+            stage=stage,
+            filetype=file_type,
+            fileprocessstage=file_process_stage,
+            createdby=updated_by,
+            statuscomment=process_message or message,
+            created=now,
+            updated=now,
+            isactive=True,
         )
 
         # FileActivity: statuscomment is the user comment, comment is the system message
-        self.repo.add_activity(
+        self.audit.add_activity(
             db,
-            FileActivity(
-                fileuid=file.fileuid,
-                status=status.value,
-                stage=stage.value,
-                failurestage=failure_stage,
-                statuscomment=comments,  # User comment
-                comment=message,  # System action message
-                createdby=updated_by,
-                iscommented=True,
-                created=now,
-                updated=now,
-                isactive=True,
-            ),
+            fileuid=file.fileuid,
+            status=status.value,
+            stage=stage.value,
+            failurestage=failure_stage,
+            statuscomment=comments,  # User comment
+            comment=message,  # System action message
+            createdby=updated_by,
+            iscommented=True,
+            created=now,
+            updated=now,
+            isactive=True,
         )
 
-    # ======================================================================
-    # ACTIVITY HISTORY
-    # ======================================================================
-    def _get_previous_state(self, db, fileuid):
-        activities = self.repo.get_file_activities(db, fileuid)
-        if not activities:
-            return None
-
-        grouped = defaultdict(list)
-        for a in activities:
-            grouped[(a.fileuid, a.status, a.stage)].append(a)
-
-        deduped = [max(group, key=lambda x: x.created) for group in grouped.values()]
-
-        deduped.sort(key=lambda x: x.created, reverse=True)
-
-        return deduped[1] if len(deduped) > 1 else None
-
     # ======================================================================
     # UTIL
     # ======================================================================
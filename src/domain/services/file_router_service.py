@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
 from src.domain.interfaces.file_router_repository_interface import IFileRouterRepository
 from src.domain.dtos.resolve_file_update_dto import ResolveFileUpdate
 from uuid import UUID
@@ -6,8 +7,9 @@ from typing import Dict
 
 
 class FileRouterService:
-    def __init__(self, repository: IFileRouterRepository):
+    def __init__(self, repository: IFileRouterRepository, audit_writer: IAuditWriter):
         self.repo = repository
+        self.audit_writer = audit_writer
 
     def get_multiple_entities_or_investor(self, db: Session, file_uid: UUID):
         """
@@ -24,4 +26,4 @@ class FileRouterService:
         """
         Resolves file updates
         """
-        return self.repo.resolve_file_update(db, resolveUpdate)
+        return self.repo.resolve_file_update(db, resolveUpdate, self.audit_writer)
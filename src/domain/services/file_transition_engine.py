@@ -0,0 +1,258 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.domain.entities.file_manager import FileManager
+from src.domain.enums.file_porcess_log_enums import (
+    FileFailureStage,
+    FileProcessStatus,
+    FileProcessStage,
+)
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
+from src.domain.interfaces.file_manager_repository_interface import (
+    IFileManagerRepository,
+)
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+# Replay: failure stage of a Failed file -> (status, stage, reason, replay flag)
+REPLAY_TRANSITIONS = {
+    FileFailureStage.FailedLinking: (
+        FileProcessStatus.Extract,
+        FileProcessStage.ExtractReceived,
+        "File replayed Failed Linked to Extract",
+        None,
+    ),
+    FileFailureStage.FailedExtraction: (
+        FileProcessStatus.Captured,
+        FileProcessStage.DocReady,
+        "File replayed Failed Extracted to Captured",
+        True,
+    ),
+    FileFailureStage.FailedIngestion: (
+        FileProcessStatus.Approved,
+        FileProcessStage.Approved,
+        "File replayed Failed Ingestion to Approved",
+        None,
+    ),
+    FileFailureStage.FailedCapture: (
+        FileProcessStatus.Captured,
+        FileProcessStage.DocReady,
+        "File replayed Failed Capture to Captured",
+        None,
+    ),
+}
+
+# Restore from Ignored: previous status that maps to a different status
+RESTORE_STATUS_OVERRIDES = {
+    "Ingestion In Progress": FileProcessStatus.Approved,
+}
+
+
+def parse_failure_stage(value: Optional[str]) -> Optional[FileFailureStage]:
+    """
+    Resolve a stored failure stage, accepting both the enum value ("Failed Linking")
+    and the member name ("FailedLinking") used by older rows.
+    """
+    if not value:
+        return None
+    try:
+        return FileFailureStage(value)
+    except ValueError:
+        return FileFailureStage.__members__.get(value)
+
+
+@dataclass
+class FileTransition:
+    file: FileManager
+    status: FileProcessStatus
+    stage: FileProcessStage
+    message: str
+    changes: Dict[str, Any] = field(default_factory=dict)
+    failure_stage: Optional[str] = None
+    process_message: Optional[str] = None
+
+
+class FileTransitionEngine:
+    """
+    Computes file status/stage transitions in memory and applies them as one
+    bulk UPDATE; the process log and activity rows go through the audit writer.
+    """
+
+    def __init__(self, repository: IFileManagerRepository, audit_writer: IAuditWriter):
+        self.repo = repository
+        self.audit = audit_writer
+
+    # ======================================================================
+    # PLANNING
+    # ======================================================================
+    def plan_replay(self, files: Iterable[FileManager], comment: Optional[str], updated_by: str) -> List[FileTransition]:
+        now = datetime.utcnow()
+        transitions = []
+        for file in files:
+            if file.status != FileProcessStatus.Failed.value:
+                continue
+            mapping = REPLAY_TRANSITIONS.get(parse_failure_stage(file.failurestage))
+            if not mapping:
+                continue
+
+            # password rule process is still pending for invalid-password files
+
+            target_status, target_stage, reason, replay = mapping
+            message = f"Replay: moved '{file.status}' to '{target_status.value}'"
+            changes = {
+                "status": target_status.value,
+                "stage": target_stage.value,
+                "reason": reason,
+                "statuscomment": message,
+                "comments": comment,
+                "failurestage": None,
+                "updated": now,
+                "updatedby": updated_by,
+            }
+            if replay is not None:
+                changes["replay"] = replay
+
+            transitions.append(FileTransition(file, target_status, target_stage, message, changes))
+        return transitions
+
+    def plan_ignore(self, files: Iterable[FileManager], updated_by: str) -> List[FileTransition]:
+        now = datetime.utcnow()
+        message = "Manually moved to Ignored"
+        return [
+            FileTransition(
+                file,
+                FileProcessStatus.Ignored,
+                FileProcessStage.Ignored,
+                message,
+                {
+                    "status": FileProcessStatus.Ignored.value,
+                    "stage": FileProcessStage.Ignored.value,
+                    "statusdate": now,
+                    "statuscomment": message,
+                    "reason": "File manually moved to Ignored",
+                    "ignoredby": updated_by,
+                    "ignoredon": now,
+                    "updated": now,
+                    "updatedby": updated_by,
+                    "failurestage": None,
+                },
+            )
+            for file in files
+        ]
+
+    def plan_restore(self, files: Iterable[FileManager], previous_states: Dict[Any, Any], updated_by: str) -> List[FileTransition]:
+        """
+        previous_states maps fileuid to the state before the current one
+        (an object with status, stage and failurestage).
+        """
+        now = datetime.utcnow()
+        failure_stage_values = [e.value for e in FileFailureStage]
+        transitions = []
+
+        for file in files:
+            prev = previous_states.get(file.fileuid)
+            if not prev:
+                continue
+
+            failure_stage = None
+            try:
+                if prev.status == FileProcessStatus.Failed.value and prev.failurestage in failure_stage_values:
+                    # Failure-specific transitions
+                    status = FileProcessStatus.Failed
+                    stage = FileProcessStage(prev.stage)
+                    failure_stage = prev.failurestage
+                    message = f"File process from Ignored to {prev.failurestage}"
+                elif (
+                    prev.status == FileProcessStatus.Captured.value
+                    and prev.stage == FileProcessStage.DocReady.value
+                ):
+                    status = FileProcessStatus.Captured
+                    stage = FileProcessStage.DocReady
+                    message = "File process from Ignored to Captured"
+                else:
+                    # Default (includes Ingestion In Progress -> Approved)
+                    status = RESTORE_STATUS_OVERRIDES.get(prev.status) or FileProcessStatus(prev.status)
+                    stage = FileProcessStage(prev.stage)
+                    message = f"File process from Ignored to {status.value}"
+            except ValueError:
+                logger.warning(
+                    f"FileTransitionEngine: Cannot restore {file.fileuid} to unknown state {prev.status}/{prev.stage}"
+                )
+                continue
+
+            transitions.append(
+                FileTransition(
+                    file,
+                    status,
+                    stage,
+                    message,
+                    {
+                        "status": status.value,
+                        "stage": stage.value,
+                        "statusdate": now,
+                        "updated": now,
+                        "updatedby": updated_by,
+                        "failurestage": failure_stage,
+                        "reason": message,
+                        "statuscomment": message,
+                    },
+                    failure_stage=failure_stage,
+                )
+            )
+        return transitions
+
+    # ======================================================================
+    # APPLY
+    # ======================================================================
+    def apply(self, db: Session, transitions: List[FileTransition], comments: Optional[str], updated_by: str) -> int:
+        """
+        Persist the planned transitions in the caller's transaction.
+        """
+        if not transitions:
+            return 0
+
+        now = datetime.utcnow()
+        file_rows = []
+
+        for transition in transitions:
+            file = transition.file
+            file_rows.append({"fileid": file.fileid, **transition.changes})
+
+            # FileProcessLog: statuscomment is the system message
+            self.audit.add_process_log(
+                db,
+                fileuid=file.fileuid,
+                status=transition.status,
+                stage=transition.stage,
+                filetype=file.filetypegenai or file.filetypeprocessrule,
+                fileprocessstage=file.fileprocessstage,
+                createdby=updated_by,
+                statuscomment=transition.process_message or transition.message,
+                created=now,
+                updated=now,
+                isactive=True,
+            )
+
+            # FileActivity: statuscomment is the user comment, comment is the system message
+            self.audit.add_activity(
+                db,
+                fileuid=file.fileuid,
+                status=transition.status.value,
+                stage=transition.stage.value,
+                failurestage=transition.failure_stage,
+                statuscomment=comments,
+                comment=transition.message,
+                createdby=updated_by,
+                iscommented=True,
+                created=now,
+                updated=now,
+                isactive=True,
+            )
+
+        self.repo.bulk_update_files(db, file_rows)
+        return len(transitions)
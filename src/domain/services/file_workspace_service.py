@@ -0,0 +1,112 @@
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from src.domain.dtos.account_file_data_dto import AccountFileDataResponse
+from src.domain.dtos.extract_file_dto import ExtractFile
+from src.domain.dtos.file_account_validation_dto import FileAccountValidation
+from src.domain.dtos.file_activity_dto import FileActivity
+from src.domain.dtos.file_details_dto import FileDetailsResponse
+from src.domain.dtos.file_workspace_dto import WorkspaceSection
+from src.domain.services.account_master_service import AccountMasterService
+from src.domain.services.file_account_validation_service import FileAccountValidationService
+from src.domain.services.file_activity_service import FileActivityService
+from src.domain.services.file_manager_service import FileManagerService
+from src.domain.services.file_router_service import FileRouterService
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Loader of one section and the response model of its standalone endpoint (None: returned as is)
+SectionLoader = Tuple[Callable[[Session, UUID], Any], Optional[TypeAdapter]]
+
+
+class FileWorkspaceService:
+    """
+    Everything the review UI shows for a file, in one call.
+
+    The requested sections are independent reads, so each one runs in a
+    worker thread with its own session. At most max_concurrent_sections run
+    at once, which bounds the pooled connections one request can hold. A
+    section that fails is reported in errors without failing the others.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        file_manager_service: FileManagerService,
+        file_activity_service: FileActivityService,
+        validation_service: FileAccountValidationService,
+        account_master_service: AccountMasterService,
+        file_router_service: FileRouterService,
+        max_concurrent_sections: int = 3,
+    ):
+        self.session_factory = session_factory
+        self.max_concurrent_sections = max(max_concurrent_sections, 1)
+        self.loaders: Dict[WorkspaceSection, SectionLoader] = {
+            WorkspaceSection.details: (
+                file_manager_service.get_file_details_by_file_uid,
+                TypeAdapter(FileDetailsResponse),
+            ),
+            WorkspaceSection.extraction: (file_manager_service.get_extract_file_api, None),
+            WorkspaceSection.activity: (
+                lambda db, fileuid: file_activity_service.get_file_activity_logs(db, fileuid) or [],
+                TypeAdapter(List[FileActivity]),
+            ),
+            WorkspaceSection.account_validation: (
+                lambda db, fileuid: validation_service.get_file_account_details(db, fileuid) or [],
+                TypeAdapter(List[FileAccountValidation]),
+            ),
+            WorkspaceSection.account_data: (
+                lambda db, fileuid: account_master_service.get_account_data_by_file_uid(db, fileuid) or [],
+                TypeAdapter(List[AccountFileDataResponse]),
+            ),
+            WorkspaceSection.extraction_data: (
+                file_router_service.get_multiple_entities_or_investor,
+                TypeAdapter(List[ExtractFile]),
+            ),
+        }
+
+    async def get_workspace(
+        self, fileuid: UUID, sections: Optional[Iterable[WorkspaceSection]] = None
+    ) -> Dict:
+        """
+        Load the requested sections (all of them by default) for fileuid.
+
+        Returns:
+            dict: {"fileuid": UUID, "sections": {section: data}, "errors": {section: str}}
+        """
+        requested = list(dict.fromkeys(sections)) if sections else list(self.loaders)
+        slots = asyncio.Semaphore(self.max_concurrent_sections)
+
+        async def load(section: WorkspaceSection):
+            async with slots:
+                return await asyncio.to_thread(self._load_section, section, fileuid)
+
+        results = await asyncio.gather(*(load(section) for section in requested))
+
+        workspace = {"fileuid": fileuid, "sections": {}, "errors": {}}
+        for section, data, error in results:
+            if error is None:
+                workspace["sections"][section] = data
+            else:
+                workspace["errors"][section] = error
+        return workspace
+
+    def _load_section(self, section: WorkspaceSection, fileuid: UUID) -> Tuple[WorkspaceSection, Any, Optional[str]]:
+        loader, adapter = self.loaders[section]
+        db = self.session_factory()
+        try:
+            result = loader(db, fileuid)
+            if adapter is not None:
+                result = adapter.dump_python(adapter.validate_python(result, from_attributes=True))
+            return section, jsonable_encoder(result), None
+        except Exception as ex:
+            logger.error(f"FileWorkspace: section {section.value} failed for {fileuid}: {ex}", exc_info=True)
+            return section, None, f"Failed to load {section.value}"
+        finally:
+            db.close()
@@ -0,0 +1,267 @@
+import asyncio
+import math
+import uuid
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.domain.dtos.upload_session_dto import CreateUploadSessionRequest, UploadSessionResponse
+from src.domain.entities.upload_session import UploadSession
+from src.domain.enums.upload_session_enums import UploadSessionStatus
+from src.domain.interfaces.upload_session_repository_interface import IUploadSessionRepository
+from src.domain.interfaces.upload_spool_interface import IUploadSpool
+from src.domain.services.file_manager_service import FileManagerService, ReceivedFile
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Body bytes collected before each spool write (one worker thread hop per write)
+CHUNK_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class UploadSessionService:
+    """
+    Resumable uploads: the client opens a session with the file's size and
+    SHA-256, PUTs fixed-size chunks in any order (retries are idempotent) and
+    finalizes once every chunk is in. Chunk bytes are spooled durably and the
+    received chunks are recorded in the database, so a session survives a
+    restart and the client only re-sends what is missing.
+    """
+
+    def __init__(
+        self,
+        repository: IUploadSessionRepository,
+        spool: IUploadSpool,
+        file_service: FileManagerService,
+        chunk_size: int,
+        max_size: int,
+        ttl_hours: int,
+    ):
+        self.repo = repository
+        self.spool = spool
+        self.file_service = file_service
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        self.ttl = timedelta(hours=ttl_hours)
+
+    def create_session(self, db: Session, request: CreateUploadSessionRequest) -> UploadSessionResponse:
+        if request.totalsize > self.max_size:
+            raise ValueError(f"File size exceeds the {self.max_size} byte limit")
+
+        now = datetime.utcnow()
+        try:
+            session = self.repo.create_session(
+                db,
+                {
+                    "filename": request.filename,
+                    "type": request.type,
+                    "harvestsource": request.harvest_source,
+                    "haas": request.haas,
+                    "totalsize": request.totalsize,
+                    "chunksize": self.chunk_size,
+                    "checksum": request.checksum.lower(),
+                    "status": UploadSessionStatus.Open.value,
+                    "expireson": now + self.ttl,
+                    "createdby": request.created_by or "SYSTEM",
+                    "created": now,
+                    "isactive": True,
+                },
+            )
+            self.spool.allocate(session.sessionuid, session.totalsize)
+            db.commit()
+        except Exception as ex:
+            logger.error(f"UploadSession: Error occurred while creating session: {ex}", exc_info=True)
+            db.rollback()
+            raise
+
+        logger.info(f"UploadSession: Opened {session.sessionuid} for {session.filename} ({session.totalsize} bytes)")
+        return self._to_response(db, session)
+
+    def get_session(self, db: Session, sessionuid: UUID) -> Optional[UploadSessionResponse]:
+        session = self.repo.get_session(db, sessionuid)
+        return self._to_response(db, session) if session else None
+
+    async def write_chunk(
+        self, db: Session, sessionuid: UUID, chunk_index: int, body: AsyncIterator[bytes]
+    ) -> Optional[UploadSessionResponse]:
+        """
+        Write chunk chunk_index from the request body stream. A chunk that is
+        already recorded is not rewritten, so a retried PUT cannot damage it.
+
+        The body is read on the event loop; the database calls and the spool
+        writes (fsynced on close) run in worker threads.
+        """
+        prepared = await asyncio.to_thread(self._prepare_chunk, db, sessionuid, chunk_index)
+        if prepared is None:
+            return None
+        session, offset, expected = prepared
+
+        if expected is None:
+            async for _ in body:
+                pass
+            return await asyncio.to_thread(self._to_response, db, session)
+
+        written = 0
+        buffer = bytearray()
+        handle = await asyncio.to_thread(self.spool.open_range, session.sessionuid, offset)
+        try:
+            async for data in body:
+                written += len(data)
+                if written > expected:
+                    raise ValueError(f"Chunk {chunk_index} must be exactly {expected} bytes")
+                buffer += data
+                if len(buffer) >= CHUNK_WRITE_BUFFER_SIZE:
+                    await asyncio.to_thread(handle.write, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(handle.write, bytes(buffer))
+        finally:
+            await asyncio.to_thread(handle.close)
+
+        if written != expected:
+            raise ValueError(f"Chunk {chunk_index} must be exactly {expected} bytes, received {written}")
+
+        return await asyncio.to_thread(self._record_chunk, db, session, chunk_index, written)
+
+    def _prepare_chunk(
+        self, db: Session, sessionuid: UUID, chunk_index: int
+    ) -> Optional[Tuple[UploadSession, int, Optional[int]]]:
+        """
+        (session, offset, expected size) for a chunk write; the expected size
+        is None when the chunk is already recorded.
+        """
+        session = self.repo.get_session(db, sessionuid)
+        if not session:
+            return None
+        self._ensure_open(session)
+
+        chunk_count = self._chunk_count(session)
+        if not 0 <= chunk_index < chunk_count:
+            raise ValueError(f"Chunk index must be between 0 and {chunk_count - 1}")
+
+        offset = chunk_index * session.chunksize
+        if chunk_index in set(self.repo.get_received_chunks(db, session)):
+            return session, offset, None
+        return session, offset, min(session.chunksize, session.totalsize - offset)
+
+    def _record_chunk(
+        self, db: Session, session: UploadSession, chunk_index: int, size: int
+    ) -> UploadSessionResponse:
+        self.repo.record_chunk(db, session, chunk_index, size)
+        session.updated = datetime.utcnow()
+        db.commit()
+        return self._to_response(db, session)
+
+    def finalize(self, db: Session, sessionuid: UUID) -> Optional[UploadSessionResponse]:
+        """
+        Verify the checksum, copy the file into blob storage and register it
+        (FileManager row + NewFile log), then free the spool file. Finalizing a
+        completed session again returns it unchanged.
+
+        The session row stays locked until the commit, so concurrent finalize
+        calls are serialized and only the first one registers the file.
+        """
+        session = self.repo.get_session(db, sessionuid, for_update=True)
+        if not session:
+            return None
+        if session.status == UploadSessionStatus.Completed.value:
+            return self._to_response(db, session)
+        self._ensure_open(session)
+
+        missing = self._chunk_count(session) - len(self.repo.get_received_chunks(db, session))
+        if missing:
+            raise ValueError(f"{missing} chunk(s) have not been uploaded yet")
+
+        if self.spool.checksum(session.sessionuid) != session.checksum:
+            # Any chunk may be the bad one; start the byte upload over
+            self.repo.reset_chunks(db, session)
+            db.commit()
+            raise ValueError("Checksum mismatch; upload all chunks again")
+
+        file_uid = uuid.uuid4()
+
+        # Committed together with the FileManager row by receive_files
+        session.status = UploadSessionStatus.Completed.value
+        session.fileuid = file_uid
+        session.updated = datetime.utcnow()
+        try:
+            (received,) = self.file_service.receive_files(
+                db,
+                [
+                    ReceivedFile(
+                        filename=session.filename,
+                        checksum=session.checksum,
+                        open=lambda: self.spool.open_read(session.sessionuid),
+                        size=session.totalsize,
+                        file_uid=file_uid,
+                    )
+                ],
+                file_type=session.type,
+                harvest_source=session.harvestsource,
+                haas=session.haas,
+                created_by=session.createdby,
+            )
+            if received.error:
+                raise RuntimeError(f"File {file_uid}: {received.error}")
+        except Exception as ex:
+            logger.error(f"UploadSession: Error occurred while finalizing {sessionuid}: {ex}", exc_info=True)
+            db.rollback()
+            raise
+
+        self.spool.discard(session.sessionuid)
+
+        logger.info(f"UploadSession: Finalized {sessionuid} as file {file_uid}")
+        return self._to_response(db, session)
+
+    def abort(self, db: Session, sessionuid: UUID) -> Optional[UploadSessionResponse]:
+        session = self.repo.get_session(db, sessionuid)
+        if not session:
+            return None
+        if session.status == UploadSessionStatus.Open.value:
+            self._close(session, UploadSessionStatus.Aborted)
+            db.commit()
+        return self._to_response(db, session)
+
+    def purge_expired(self, db: Session, limit: int = 100) -> int:
+        """
+        Expire open sessions past their deadline and free their spool files.
+        """
+        sessions = self.repo.get_expired_sessions(db, datetime.utcnow(), limit)
+        for session in sessions:
+            self._close(session, UploadSessionStatus.Expired)
+        db.commit()
+        return len(sessions)
+
+    def _close(self, session: UploadSession, status: UploadSessionStatus) -> None:
+        session.status = status.value
+        session.updated = datetime.utcnow()
+        self.spool.discard(session.sessionuid)
+
+    def _ensure_open(self, session: UploadSession) -> None:
+        if session.status != UploadSessionStatus.Open.value:
+            raise ValueError(f"Upload session is {session.status}")
+        if session.expireson < datetime.utcnow():
+            raise ValueError("Upload session has expired")
+
+    def _chunk_count(self, session: UploadSession) -> int:
+        return math.ceil(session.totalsize / session.chunksize)
+
+    def _to_response(self, db: Session, session: UploadSession) -> UploadSessionResponse:
+        chunk_count = self._chunk_count(session)
+        received = set(self.repo.get_received_chunks(db, session))
+        return UploadSessionResponse(
+            sessionuid=session.sessionuid,
+            filename=session.filename,
+            status=session.status,
+            totalsize=session.totalsize,
+            chunksize=session.chunksize,
+            chunkcount=chunk_count,
+            receivedcount=len(received),
+            missingchunks=[i for i in range(chunk_count) if i not in received]
+            if session.status == UploadSessionStatus.Open.value
+            else [],
+            fileuid=session.fileuid,
+            expireson=session.expireson,
+        )
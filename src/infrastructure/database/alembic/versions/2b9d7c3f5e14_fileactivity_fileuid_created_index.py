@@ -0,0 +1,28 @@
+"""fileactivity_fileuid_created_index
+
+Revision ID: 2b9d7c3f5e14
+Revises: 8f4e6b1a9c53
+Create Date: 2026-10-19 13:58:30.472016
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b9d7c3f5e14'
+down_revision: Union[str, Sequence[str], None] = '8f4e6b1a9c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tbl_fileactivity_fileuid_created', 'tbl_fileactivity', ['fileuid', sa.text('created DESC')], unique=False, schema='frame')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tbl_fileactivity_fileuid_created', table_name='tbl_fileactivity', schema='frame')
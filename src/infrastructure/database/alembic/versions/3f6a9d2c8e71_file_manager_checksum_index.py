@@ -0,0 +1,28 @@
+"""file_manager_checksum_index
+
+Revision ID: 3f6a9d2c8e71
+Revises: e8c2b5a71d94
+Create Date: 2026-10-19 16:05:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a9d2c8e71'
+down_revision: Union[str, Sequence[str], None] = 'e8c2b5a71d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tbl_file_manager_checksum', 'tbl_file_manager', ['checksum'], unique=False, schema='frame')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tbl_file_manager_checksum', table_name='tbl_file_manager', schema='frame')
@@ -0,0 +1,42 @@
+"""rule_usage_counters
+
+Revision ID: 5e8b2f0c4d61
+Revises: a3c91e5d7b20
+Create Date: 2026-10-19 10:03:17.224905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b2f0c4d61'
+down_revision: Union[str, Sequence[str], None] = 'a3c91e5d7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tbl_file_manager_rule', 'tbl_file_manager', ['rule'], unique=False, schema='frame')
+
+    # Seed the denormalized counters from the current file assignments
+    op.execute("""
+        UPDATE frame.tbl_business_rule AS r
+        SET usage = COALESCE(c.cnt, 0)
+        FROM frame.tbl_business_rule AS b
+        LEFT JOIN (
+            SELECT rule, COUNT(fileid) AS cnt
+            FROM frame.tbl_file_manager
+            WHERE rule IS NOT NULL
+            GROUP BY rule
+        ) AS c ON c.rule = b.uniqueruleid
+        WHERE r.businessruleid = b.businessruleid
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tbl_file_manager_rule', table_name='tbl_file_manager', schema='frame')
@@ -0,0 +1,47 @@
+"""compressed_extraction_payloads
+
+Revision ID: 7a1e4c9b2d58
+Revises: 3f6a9d2c8e71
+Create Date: 2026-10-19 17:12:08.530614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1e4c9b2d58'
+down_revision: Union[str, Sequence[str], None] = '3f6a9d2c8e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PAYLOAD_COLUMNS = ('extraction_data', 'bounding_box_data', 'confidence_scores')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Frames live beside the text columns, which keep their type; they stay
+    # NULL until the compaction job is enabled and moves text into them
+    for column in PAYLOAD_COLUMNS:
+        op.add_column(
+            'tbl_extractionfiledetail',
+            sa.Column(f'{column}_frame', sa.LargeBinary(), nullable=True),
+            schema='frame',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Frames cannot be decoded in SQL: run the compaction job with
+    # extraction_payload_compression = "none" first, which moves them back to text
+    conditions = " OR ".join(f"{column}_frame IS NOT NULL" for column in PAYLOAD_COLUMNS)
+    framed = op.get_bind().execute(
+        sa.text(f"SELECT count(*) FROM frame.tbl_extractionfiledetail WHERE {conditions}")
+    ).scalar()
+    if framed:
+        raise RuntimeError(f"{framed} row(s) still hold compressed payloads; decompress them before downgrading")
+
+    for column in PAYLOAD_COLUMNS:
+        op.drop_column('tbl_extractionfiledetail', f'{column}_frame', schema='frame')
@@ -0,0 +1,30 @@
+"""rule_log_keyset_indexes
+
+Revision ID: 8f4e6b1a9c53
+Revises: c71d4a9e2b38
+Create Date: 2026-10-19 12:41:08.119734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f4e6b1a9c53'
+down_revision: Union[str, Sequence[str], None] = 'c71d4a9e2b38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tbl_file_process_log_ruleid_created', 'tbl_file_process_log', ['ruleid', 'created'], unique=False, schema='frame')
+    op.create_index('ix_tbl_business_rule_log_uniqueruleid_created', 'tbl_business_rule_log', ['uniqueruleid', 'created'], unique=False, schema='frame')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tbl_business_rule_log_uniqueruleid_created', table_name='tbl_business_rule_log', schema='frame')
+    op.drop_index('ix_tbl_file_process_log_ruleid_created', table_name='tbl_file_process_log', schema='frame')
@@ -0,0 +1,64 @@
+"""business_rule_expression_columns
+
+Revision ID: a3c91e5d7b20
+Revises: 69402493fec9
+Create Date: 2026-10-19 09:12:41.508311
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5d7b20'
+down_revision: Union[str, Sequence[str], None] = '69402493fec9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PATTERN_COLUMNS = {
+    'filenamepattern': 'FileName',
+    'senderaddresspattern': 'SenderAddress',
+    'subjectpattern': 'Subject',
+    'emailbodypattern': 'EmailBody',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tbl_business_rule', sa.Column('ruleexpressionsjson', postgresql.JSONB(astext_type=sa.Text()), nullable=True), schema='frame')
+
+    # Backfill in Python: legacy rows may hold non-JSON text, which is left as NULL
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT businessruleid, ruleexpressions FROM frame.tbl_business_rule WHERE ruleexpressions IS NOT NULL"
+    )).fetchall()
+    updates = []
+    for rule_id, expressions in rows:
+        try:
+            parsed = json.loads(expressions)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(parsed, dict):
+            updates.append({'id': rule_id, 'payload': json.dumps(parsed)})
+    if updates:
+        conn.execute(sa.text(
+            "UPDATE frame.tbl_business_rule SET ruleexpressionsjson = CAST(:payload AS JSONB) WHERE businessruleid = :id"
+        ), updates)
+
+    for column_name, key in PATTERN_COLUMNS.items():
+        op.add_column('tbl_business_rule', sa.Column(column_name, sa.Text(), sa.Computed(f"ruleexpressionsjson ->> '{key}'", persisted=True), nullable=True), schema='frame')
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column_name in PATTERN_COLUMNS:
+        op.create_index(f'ix_tbl_business_rule_{column_name}_trgm', 'tbl_business_rule', [column_name], unique=False, schema='frame', postgresql_using='gin', postgresql_ops={column_name: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column_name in PATTERN_COLUMNS:
+        op.drop_index(f'ix_tbl_business_rule_{column_name}_trgm', table_name='tbl_business_rule', schema='frame')
+        op.drop_column('tbl_business_rule', column_name, schema='frame')
+    op.drop_column('tbl_business_rule', 'ruleexpressionsjson', schema='frame')
@@ -0,0 +1,52 @@
+"""business_rule_id_sequences
+
+Revision ID: c71d4a9e2b38
+Revises: 5e8b2f0c4d61
+Create Date: 2026-10-19 11:20:52.631447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71d4a9e2b38'
+down_revision: Union[str, Sequence[str], None] = '5e8b2f0c4d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RULE_ID_PREFIXES = ("IG", "CN", "PW", "ETL")
+
+
+def _sync_sequence(sequence_name: str, number_regex: str, like_pattern: str) -> None:
+    # Start each sequence after the highest number already in use
+    op.execute(f"""
+        SELECT setval(
+            'frame.{sequence_name}',
+            GREATEST(COALESCE(MAX(CAST(substring(uniqueruleid FROM '{number_regex}') AS BIGINT)), 0), 1),
+            COALESCE(MAX(CAST(substring(uniqueruleid FROM '{number_regex}') AS BIGINT)), 0) > 0
+        )
+        FROM frame.tbl_business_rule
+        WHERE uniqueruleid LIKE '{like_pattern}'
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for prefix in RULE_ID_PREFIXES:
+        sequence_name = f"seq_business_rule_{prefix.lower()}"
+        op.execute(sa.schema.CreateSequence(sa.Sequence(sequence_name, schema='frame')))
+        op.execute(sa.schema.CreateSequence(sa.Sequence(f"{sequence_name}_clone", schema='frame')))
+
+        _sync_sequence(sequence_name, f"^{prefix}([0-9]+)$", f"{prefix}%")
+        _sync_sequence(f"{sequence_name}_clone", "-CLONE([0-9]+)$", f"{prefix}%-CLONE%")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for prefix in RULE_ID_PREFIXES:
+        sequence_name = f"seq_business_rule_{prefix.lower()}"
+        op.execute(sa.schema.DropSequence(sa.Sequence(f"{sequence_name}_clone", schema='frame')))
+        op.execute(sa.schema.DropSequence(sa.Sequence(sequence_name, schema='frame')))
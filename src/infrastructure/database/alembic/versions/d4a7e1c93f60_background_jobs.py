@@ -0,0 +1,72 @@
+"""background_jobs
+
+Revision ID: d4a7e1c93f60
+Revises: 2b9d7c3f5e14
+Create Date: 2026-10-19 14:41:12.806353
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e1c93f60'
+down_revision: Union[str, Sequence[str], None] = '2b9d7c3f5e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tbl_background_job',
+    sa.Column('backgroundjobid', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('jobuid', sa.UUID(), nullable=False),
+    sa.Column('jobtype', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('totalcount', sa.Integer(), nullable=True),
+    sa.Column('processedcount', sa.Integer(), nullable=True),
+    sa.Column('succeededcount', sa.Integer(), nullable=True),
+    sa.Column('failedcount', sa.Integer(), nullable=True),
+    sa.Column('skippedcount', sa.Integer(), nullable=True),
+    sa.Column('cancelrequested', sa.Boolean(), nullable=True),
+    sa.Column('leaseowner', sa.String(length=255), nullable=True),
+    sa.Column('leaseexpires', sa.TIMESTAMP(timezone=7), nullable=True),
+    sa.Column('startedon', sa.TIMESTAMP(timezone=7), nullable=True),
+    sa.Column('completedon', sa.TIMESTAMP(timezone=7), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created', sa.TIMESTAMP(timezone=7), nullable=False),
+    sa.Column('createdby', sa.String(length=255), nullable=True),
+    sa.Column('updated', sa.TIMESTAMP(timezone=7), nullable=True),
+    sa.Column('updatedby', sa.String(length=255), nullable=True),
+    sa.Column('isactive', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('backgroundjobid'),
+    sa.UniqueConstraint('jobuid'),
+    schema='frame'
+    )
+    op.create_index('ix_tbl_background_job_status', 'tbl_background_job', ['status', 'backgroundjobid'], unique=False, schema='frame')
+    op.create_table('tbl_background_job_item',
+    sa.Column('backgroundjobitemid', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('backgroundjobid', sa.BigInteger(), nullable=False),
+    sa.Column('fileuid', sa.UUID(), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('created', sa.TIMESTAMP(timezone=7), nullable=False),
+    sa.Column('createdby', sa.String(length=255), nullable=True),
+    sa.Column('updated', sa.TIMESTAMP(timezone=7), nullable=True),
+    sa.Column('updatedby', sa.String(length=255), nullable=True),
+    sa.Column('isactive', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('backgroundjobitemid'),
+    schema='frame'
+    )
+    op.create_index('ix_tbl_background_job_item_job_status', 'tbl_background_job_item', ['backgroundjobid', 'status', 'backgroundjobitemid'], unique=False, schema='frame')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tbl_background_job_item_job_status', table_name='tbl_background_job_item', schema='frame')
+    op.drop_table('tbl_background_job_item', schema='frame')
+    op.drop_index('ix_tbl_background_job_status', table_name='tbl_background_job', schema='frame')
+    op.drop_table('tbl_background_job', schema='frame')
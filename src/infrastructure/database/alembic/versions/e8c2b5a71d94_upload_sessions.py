@@ -0,0 +1,67 @@
+"""upload_sessions
+
+Revision ID: e8c2b5a71d94
+Revises: d4a7e1c93f60
+Create Date: 2026-10-19 15:22:47.193520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c2b5a71d94'
+down_revision: Union[str, Sequence[str], None] = 'd4a7e1c93f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tbl_upload_session',
+    sa.Column('uploadsessionid', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('sessionuid', sa.UUID(), nullable=False),
+    sa.Column('filename', sa.String(length=450), nullable=False),
+    sa.Column('type', sa.String(length=450), nullable=True),
+    sa.Column('harvestsource', sa.String(length=450), nullable=True),
+    sa.Column('haas', sa.Boolean(), nullable=True),
+    sa.Column('totalsize', sa.BigInteger(), nullable=False),
+    sa.Column('chunksize', sa.Integer(), nullable=False),
+    sa.Column('checksum', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('fileuid', sa.UUID(), nullable=True),
+    sa.Column('expireson', sa.TIMESTAMP(timezone=7), nullable=False),
+    sa.Column('created', sa.TIMESTAMP(timezone=7), nullable=False),
+    sa.Column('createdby', sa.String(length=255), nullable=True),
+    sa.Column('updated', sa.TIMESTAMP(timezone=7), nullable=True),
+    sa.Column('updatedby', sa.String(length=255), nullable=True),
+    sa.Column('isactive', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('uploadsessionid'),
+    sa.UniqueConstraint('sessionuid'),
+    schema='frame'
+    )
+    op.create_index('ix_tbl_upload_session_status_expireson', 'tbl_upload_session', ['status', 'expireson'], unique=False, schema='frame')
+    op.create_table('tbl_upload_session_chunk',
+    sa.Column('uploadsessionchunkid', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('uploadsessionid', sa.BigInteger(), nullable=False),
+    sa.Column('chunkindex', sa.Integer(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('created', sa.TIMESTAMP(timezone=7), nullable=False),
+    sa.Column('createdby', sa.String(length=255), nullable=True),
+    sa.Column('updated', sa.TIMESTAMP(timezone=7), nullable=True),
+    sa.Column('updatedby', sa.String(length=255), nullable=True),
+    sa.Column('isactive', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('uploadsessionchunkid'),
+    schema='frame'
+    )
+    op.create_index('ux_tbl_upload_session_chunk_session_index', 'tbl_upload_session_chunk', ['uploadsessionid', 'chunkindex'], unique=True, schema='frame')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_tbl_upload_session_chunk_session_index', table_name='tbl_upload_session_chunk', schema='frame')
+    op.drop_table('tbl_upload_session_chunk', schema='frame')
+    op.drop_index('ix_tbl_upload_session_status_expireson', table_name='tbl_upload_session', schema='frame')
+    op.drop_table('tbl_upload_session', schema='frame')
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from src.domain.entities.file_activity import FileActivity
+from src.domain.entities.file_process_log import FileProcessLog
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+AUDIT_BUFFER_KEY = "audit_buffer"
+AUDIT_LISTENER_KEY = "audit_listeners"
+# Rows per INSERT statement; keeps bind parameters well under driver limits
+AUDIT_INSERT_BATCH_SIZE = 1000
+
+
+class AuditWriter(IAuditWriter):
+    """
+    Buffers FileProcessLog and FileActivity rows on the session and writes them
+    as one multi-row INSERT per table right before the session commits.
+
+    The rows belong to the caller's transaction: they are committed with the
+    state change they describe and discarded if the session rolls back. Code
+    that reads the audit tables back inside the same unit of work must call
+    flush() first.
+    """
+
+    def add_process_log(self, db: Session, **values: Any) -> None:
+        self._buffer(db)[FileProcessLog].append(self._row(values))
+
+    def add_activity(self, db: Session, **values: Any) -> None:
+        self._buffer(db)[FileActivity].append(self._row(values))
+
+    def flush(self, db: Session) -> int:
+        buffer = db.info.pop(AUDIT_BUFFER_KEY, None)
+        if not buffer:
+            return 0
+
+        written = 0
+        for entity, rows in buffer.items():
+            if not rows:
+                continue
+            rows = self._normalize(entity, rows)
+            for start in range(0, len(rows), AUDIT_INSERT_BATCH_SIZE):
+                db.execute(insert(entity).values(rows[start:start + AUDIT_INSERT_BATCH_SIZE]))
+            written += len(rows)
+        return written
+
+    def _buffer(self, db: Session) -> Dict[Any, List[Dict[str, Any]]]:
+        buffer = db.info.get(AUDIT_BUFFER_KEY)
+        if buffer is None:
+            buffer = db.info[AUDIT_BUFFER_KEY] = {FileProcessLog: [], FileActivity: []}
+            if not db.info.get(AUDIT_LISTENER_KEY):
+                event.listen(db, "before_commit", self._flush_before_commit)
+                event.listen(db, "after_soft_rollback", self._discard_after_rollback)
+                db.info[AUDIT_LISTENER_KEY] = True
+        return buffer
+
+    def _flush_before_commit(self, db: Session) -> None:
+        written = self.flush(db)
+        if written:
+            logger.debug(f"AuditWriter: Wrote {written} audit row(s)")
+
+    def _discard_after_rollback(self, db: Session, previous_transaction) -> None:
+        # A savepoint rollback leaves the outer transaction (and its rows) alive
+        if not db.in_transaction():
+            db.info.pop(AUDIT_BUFFER_KEY, None)
+
+    def _row(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        row = dict(values)
+        row.setdefault("created", datetime.utcnow())
+        row.setdefault("isactive", True)
+        return row
+
+    def _normalize(self, entity, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        A multi-row VALUES needs the same keys in every row; fill gaps with the
+        column's scalar default (as the ORM would) or NULL.
+        """
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        if all(len(row) == len(columns) for row in rows):
+            return rows
+
+        table_columns = entity.__table__.c
+        defaults = {}
+        for key in columns:
+            default = table_columns[key].default
+            defaults[key] = default.arg if default is not None and default.is_scalar else None
+        return [{key: row.get(key, defaults[key]) for key in columns} for row in rows]
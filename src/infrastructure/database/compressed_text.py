@@ -0,0 +1,35 @@
+"""
+Codec selection for compressed extraction payloads.
+
+Frames and the codecs themselves live with the entities
+(src.domain.entities.compressed_payload); this module resolves the codec
+configured in settings.extraction_payload_compression for the compaction job.
+"""
+
+from typing import Optional
+
+from src.core.settings import settings
+from src.domain.entities.compressed_payload import CODEC_MARKERS, zstandard
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+_zstd_fallback_logged = False
+
+
+def resolve_codec(codec: Optional[str] = None) -> str:
+    """
+    Codec actually used by the compaction job; zstd falls back to zlib when
+    the zstandard package is not installed.
+    """
+    global _zstd_fallback_logged
+
+    codec = (codec or settings.extraction_payload_compression or "none").lower()
+    if codec not in CODEC_MARKERS:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    if codec == "zstd" and zstandard is None:
+        if not _zstd_fallback_logged:
+            logger.warning("zstandard is not installed; compressing payloads with zlib instead")
+            _zstd_fallback_logged = True
+        return "zlib"
+    return codec
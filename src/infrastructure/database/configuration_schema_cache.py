@@ -0,0 +1,103 @@
+"""
+Configuration schemas (a classification's FileConfiguration and its active
+fields) and the validation plans compiled from them, shared by every file of
+that classification. Read by the extraction review screen and by manual
+extraction updates, invalidated by every file configuration write.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.domain.dtos.extract_file_dto import FileConfigurationFieldDTO
+from src.domain.entities.file_configuration import FileConfiguration
+from src.domain.entities.file_configuration_field import FileConfigurationField
+from src.utils.extraction_validator import ValidationPlan, compile_validation_plan
+from src.utils.versioned_cache import VersionedCache
+
+CONFIGURATION_SCHEMA_CACHE = VersionedCache(ttl_seconds=600, max_entries=512)
+
+
+@dataclass(frozen=True)
+class ConfigurationSchema:
+    configuration_id: int
+    fields: List[FileConfigurationFieldDTO]
+    object_fields: List[FileConfigurationFieldDTO]
+
+
+def get_configuration_schema(db: Session, classification: str) -> Optional[ConfigurationSchema]:
+    """
+    Schema of the active configuration named classification, or None if there is none.
+    """
+    return CONFIGURATION_SCHEMA_CACHE.get_or_load(
+        classification, lambda: _load_configuration_schema(db, classification)
+    )
+
+
+def get_validation_plan(db: Session, classification: str) -> Optional[ValidationPlan]:
+    """
+    Compiled validation plan of the active configuration named classification,
+    or None if there is none.
+    """
+    return CONFIGURATION_SCHEMA_CACHE.get_or_load(
+        ("validation_plan", classification),
+        lambda: _load_validation_plan(db, classification),
+    )
+
+
+def invalidate_configuration_schemas() -> None:
+    CONFIGURATION_SCHEMA_CACHE.invalidate()
+
+
+def _load_configuration_schema(db: Session, classification: str) -> Optional[ConfigurationSchema]:
+    file_configuration = (
+        db.query(FileConfiguration)
+        .filter(
+            FileConfiguration.configurationname == classification,
+            FileConfiguration.isactive == True,
+        )
+        .first()
+    )
+    if not file_configuration:
+        return None
+
+    fields = [
+        FileConfigurationFieldDTO.model_validate(f)
+        for f in db.query(FileConfigurationField)
+        .filter(
+            FileConfigurationField.fileconfigurationid == file_configuration.fileid,
+            FileConfigurationField.isactive == True,
+        )
+        .all()
+    ]
+    return ConfigurationSchema(
+        configuration_id=file_configuration.fileid,
+        fields=fields,
+        object_fields=[f for f in fields if f.datatype == "Object"],
+    )
+
+
+def _load_validation_plan(db: Session, classification: str) -> Optional[ValidationPlan]:
+    # Compiled from the configuration the schema uses, even when the name is active more than once
+    schema = get_configuration_schema(db, classification)
+    if schema is None:
+        return None
+
+    rows = (
+        db.query(
+            FileConfigurationField.fileconfigurationfieldid,
+            FileConfigurationField.parentfieldid,
+            FileConfigurationField.fieldname,
+            FileConfigurationField.datatype,
+            FileConfigurationField.mandatory,
+        )
+        .filter(
+            FileConfigurationField.fileconfigurationid == schema.configuration_id,
+            FileConfigurationField.isactive == True,
+        )
+        .all()
+    )
+    if not rows:
+        return None
+    return compile_validation_plan(rows)
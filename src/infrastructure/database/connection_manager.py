@@ -41,6 +41,8 @@ def init_db():
     from src.domain import entities   # noqa
     with engine.begin() as conn:
         conn.execute(text("CREATE SCHEMA IF NOT EXISTS frame"))
+        # Trigram operator classes back the business-rule search indexes
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
 
 
@@ -0,0 +1,152 @@
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, insert, or_, update
+from sqlalchemy.orm import Session
+
+from src.domain.entities.background_job import BackgroundJob, BackgroundJobItem
+from src.domain.enums.background_job_enums import BackgroundJobItemStatus, BackgroundJobStatus
+from src.domain.interfaces.background_job_repository_interface import IBackgroundJobRepository
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Item outcome -> job counter column
+OUTCOME_COUNTERS = {
+    BackgroundJobItemStatus.Succeeded.value: "succeededcount",
+    BackgroundJobItemStatus.Failed.value: "failedcount",
+    BackgroundJobItemStatus.Skipped.value: "skippedcount",
+}
+
+
+class BackgroundJobRepository(IBackgroundJobRepository):
+    """PostgreSQL implementation of BackgroundJob repository"""
+
+    def create_job(
+        self, db: Session, job_type: str, fileuids: List[UUID], payload: Dict[str, Any], created_by: str
+    ) -> BackgroundJob:
+        now = datetime.utcnow()
+        # Duplicate fileuids in one request are processed once
+        unique_fileuids = list(dict.fromkeys(fileuids))
+
+        job = BackgroundJob(
+            jobtype=job_type,
+            status=BackgroundJobStatus.Pending.value,
+            payload=payload,
+            totalcount=len(unique_fileuids),
+            processedcount=0,
+            succeededcount=0,
+            failedcount=0,
+            skippedcount=0,
+            cancelrequested=False,
+            createdby=created_by,
+            created=now,
+            isactive=True,
+        )
+        db.add(job)
+        db.flush()
+
+        db.execute(
+            insert(BackgroundJobItem),
+            [
+                {
+                    "backgroundjobid": job.backgroundjobid,
+                    "fileuid": fileuid,
+                    "status": BackgroundJobItemStatus.Pending.value,
+                    "createdby": created_by,
+                    "created": now,
+                    "isactive": True,
+                }
+                for fileuid in unique_fileuids
+            ],
+        )
+        return job
+
+    def get_job(self, db: Session, jobuid: UUID) -> Optional[BackgroundJob]:
+        return db.query(BackgroundJob).filter(BackgroundJob.jobuid == jobuid).first()
+
+    def get_job_items(
+        self, db: Session, job_id: int, status: Optional[str], after_id: int, limit: int
+    ) -> List[BackgroundJobItem]:
+        query = db.query(BackgroundJobItem).filter(
+            BackgroundJobItem.backgroundjobid == job_id,
+            BackgroundJobItem.backgroundjobitemid > after_id,
+        )
+        if status:
+            query = query.filter(BackgroundJobItem.status == status)
+        return query.order_by(BackgroundJobItem.backgroundjobitemid).limit(limit).all()
+
+    def claim_next_job(self, db: Session, owner: str, lease_until: datetime) -> Optional[BackgroundJob]:
+        now = datetime.utcnow()
+        job = (
+            db.query(BackgroundJob)
+            .filter(
+                or_(
+                    BackgroundJob.status == BackgroundJobStatus.Pending.value,
+                    and_(
+                        BackgroundJob.status == BackgroundJobStatus.Running.value,
+                        BackgroundJob.leaseexpires < now,
+                    ),
+                )
+            )
+            .order_by(BackgroundJob.backgroundjobid)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if not job:
+            return None
+
+        if job.status == BackgroundJobStatus.Running.value:
+            logger.warning(f"BackgroundJob: Resuming job {job.jobuid} after lease of {job.leaseowner} expired")
+
+        job.status = BackgroundJobStatus.Running.value
+        job.leaseowner = owner
+        job.leaseexpires = lease_until
+        job.startedon = job.startedon or now
+        job.updated = now
+        return job
+
+    def lock_job(self, db: Session, job_id: int) -> Optional[BackgroundJob]:
+        return (
+            db.query(BackgroundJob)
+            .filter(BackgroundJob.backgroundjobid == job_id)
+            .populate_existing()
+            .with_for_update()
+            .first()
+        )
+
+    def get_pending_items(self, db: Session, job_id: int, limit: int) -> List[BackgroundJobItem]:
+        return self.get_job_items(db, job_id, BackgroundJobItemStatus.Pending.value, 0, limit)
+
+    def record_item_outcomes(self, db: Session, job: BackgroundJob, outcomes: Dict[int, Any]) -> None:
+        if not outcomes:
+            return
+
+        now = datetime.utcnow()
+        db.execute(
+            update(BackgroundJobItem),
+            [
+                {"backgroundjobitemid": item_id, "status": status, "message": message, "updated": now}
+                for item_id, (status, message) in outcomes.items()
+            ],
+        )
+
+        counts = Counter(status for status, _ in outcomes.values())
+        job.processedcount = (job.processedcount or 0) + len(outcomes)
+        for status, column in OUTCOME_COUNTERS.items():
+            if counts[status]:
+                setattr(job, column, (getattr(job, column) or 0) + counts[status])
+        job.updated = now
+
+    def cancel_pending_items(self, db: Session, job: BackgroundJob) -> int:
+        return db.execute(
+            update(BackgroundJobItem)
+            .where(
+                BackgroundJobItem.backgroundjobid == job.backgroundjobid,
+                BackgroundJobItem.status == BackgroundJobItemStatus.Pending.value,
+            )
+            .values(status=BackgroundJobItemStatus.Cancelled.value, updated=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
@@ -1,21 +1,24 @@
 
 from src.domain.dtos.business_rule_request import BusinessRuleRequest
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 import json
-import re
 import uuid
 import datetime
+from collections import Counter
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, text, String, cast, and_, or_, func, literal_column, desc, asc, JSON, case
+from sqlalchemy import desc, text, String, cast, and_, or_, func, literal_column, desc, asc, JSON, case, select, update, exists, bindparam, tuple_
 from sqlalchemy.dialects.postgresql import JSONB
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
 from src.domain.interfaces.business_rule_repository_interface import IBusinessRuleRepository
 from src.infrastructure.logging.logger_manager import get_logger
-from src.domain.entities.business_rule import BusinessRule
+from src.domain.entities.business_rule import BusinessRule, RULE_ID_SEQUENCES, RULE_CLONE_SEQUENCES
 from src.domain.entities.business_rule_log import BusinessRuleLog
 from src.domain.entities.file_manager import FileManager
 from src.domain.entities.file_process_log import FileProcessLog
-from src.domain.entities.file_activity import FileActivity
 from src.domain.entities.master_configuration_type import MasterConfigurationType
+from src.utils.rule_matcher import RuleMatcher, parse_file_metadata
+from src.utils.keyset_cursor import encode_cursor, decode_cursor
+from src.utils.ttl_cache import TTLCache
 from src.domain.enums.business_rule_enums import (
     BusinessRuleTypes, ChangeType, FileProcessStage, 
     FileProcessingState, FileProcessStatus
@@ -23,6 +26,23 @@ from src.domain.enums.business_rule_enums import (
 
 logger = get_logger(__name__)
 
+# Rule expression keys exposed on the rule grid, mapped to their generated columns
+RULE_EXPRESSION_COLUMNS = {
+    "FileName": BusinessRule.filenamepattern,
+    "SenderAddress": BusinessRule.senderaddresspattern,
+    "Subject": BusinessRule.subjectpattern,
+    "EmailBody": BusinessRule.emailbodypattern,
+}
+
+# Usage log totals per rule; the grid tolerates a briefly stale count
+USAGE_LOG_COUNT_CACHE = TTLCache(ttl_seconds=60)
+
+# Distinct filter values per (field, rule type, source type, content type); cleared on every rule write
+FACET_CACHE = TTLCache(ttl_seconds=300)
+
+# Rule log page size when only a Cursor is sent
+DEFAULT_RULE_LOG_PAGE_SIZE = 50
+
 class BusinessRuleRepository(IBusinessRuleRepository):
     def __init__(self):
         super().__init__(model=BusinessRule)
@@ -39,12 +59,37 @@ class BusinessRuleRepository(IBusinessRuleRepository):
         else:
             raise ValueError("Invalid RuleType")
 
+    def _allocate_rule_numbers(self, db: Session, prefix: str, count: int, clone: bool = False) -> List[int]:
+        """
+        Reserve a block of rule numbers from the per-prefix sequence in one round trip.
+        """
+        sequence = (RULE_CLONE_SEQUENCES if clone else RULE_ID_SEQUENCES)[prefix]
+        return list(db.execute(
+            select(sequence.next_value()).select_from(func.generate_series(1, count))
+        ).scalars())
+
+    def _parse_rule_expressions(self, rule_expressions: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Validate a rule expression payload and return it as a dict for the JSONB column.
+        Raises ValueError when the payload is not a JSON object.
+        """
+        if not rule_expressions:
+            return None
+        try:
+            parsed = json.loads(rule_expressions)
+        except (TypeError, json.JSONDecodeError) as ex:
+            raise ValueError(f"Rule expressions must be valid JSON: {ex}") from ex
+        if not isinstance(parsed, dict):
+            raise ValueError("Rule expressions must be a JSON object")
+        return parsed
+
     def save_rule(self, db: Session, rule_data: Dict[str, Any]) -> int:
         try:
             # Map Dict to Entity
             rule = BusinessRule(
                 ruletype=rule_data.get('ruletype'),
                 ruleexpressions=rule_data.get('ruleexpressions'),
+                ruleexpressionsjson=self._parse_rule_expressions(rule_data.get('ruleexpressions')),
                 isactive=rule_data.get('isactive'),
                 # createdby=rule_data.get('createdby'),
                 created=datetime.datetime.utcnow(),
@@ -56,22 +101,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             )
             
             prefix = self._get_rule_type_prefix(rule.ruletype)
-            
-            # Fetch last rule of same type
-            last_rule = db.query(BusinessRule).filter(
-                BusinessRule.ruletype == rule.ruletype,
-                BusinessRule.uniqueruleid.isnot(None),
-                ~BusinessRule.uniqueruleid.contains("-CLONE"),
-                BusinessRule.uniqueruleid.startswith(prefix)
-            ).order_by(desc(BusinessRule.uniqueruleid)).first()
-
-            next_number = 1
-            if last_rule and last_rule.uniqueruleid:
-                try:
-                    last_number_str = last_rule.uniqueruleid[len(prefix):]
-                    next_number = int(last_number_str) + 1
-                except ValueError:
-                    pass
+            next_number = self._allocate_rule_numbers(db, prefix, 1)[0]
 
             rule.uniqueruleid = f"{prefix}{next_number:04d}"
 
@@ -89,6 +119,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             db.add(new_rule_log)
             db.add(rule)
             db.commit()
+            FACET_CACHE.clear()
             return 1
         except Exception as ex:
             logger.error(f"Rule: Error occurred while inserting Rule: {ex}", exc_info=True)
@@ -106,7 +137,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                 return 0
 
             old_expressions_json = json.loads(rule_db.ruleexpressions) if rule_db.ruleexpressions else {}
-            new_expressions_json = json.loads(rule_data.get('ruleexpressions', '{}'))
+            new_expressions_json = self._parse_rule_expressions(rule_data.get('ruleexpressions', '{}')) or {}
             
             rule_log_message = self._generate_rule_log_message_json(old_expressions_json, new_expressions_json)
 
@@ -128,11 +159,13 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                 rule_db.groupcode = rule_data['groupcode']
             
             rule_db.ruleexpressions = rule_data.get('ruleexpressions')
+            rule_db.ruleexpressionsjson = new_expressions_json
             rule_db.updated = datetime.datetime.utcnow()
             rule_db.updatedby = rule_data.get('updatedby', "SYSTEM")
 
             db.add(new_rule_log)
             db.commit()
+            FACET_CACHE.clear()
             return 1
         except Exception as ex:
             logger.error(f"Rule: Error occurred while updating Rule: {ex}", exc_info=True)
@@ -177,18 +210,8 @@ class BusinessRuleRepository(IBusinessRuleRepository):
         try:
             rule_type = rule_data.get('ruletype')
             prefix = self._get_rule_type_prefix(rule_type)
-            
-            latest_clone = db.query(BusinessRule).filter(
-                BusinessRule.uniqueruleid.contains("CLONE"),
-                BusinessRule.uniqueruleid.startswith(prefix)
-            ).order_by(desc(BusinessRule.created)).first()
-            
-            incremented_number = 1
-            if latest_clone and latest_clone.uniqueruleid:
-                match = re.search(r"CLONE(\d+)$", latest_clone.uniqueruleid)
-                if match:
-                    incremented_number = int(match.group(1)) + 1
-                    
+            incremented_number = self._allocate_rule_numbers(db, prefix, 1, clone=True)[0]
+
             original_unique_id = rule_data.get('uniqueruleid')
             new_unique_id = f"{original_unique_id}-CLONE{incremented_number:04d}"
             
@@ -196,6 +219,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                 uniqueruleid=new_unique_id,
                 ruletype=rule_type,
                 ruleexpressions=rule_data.get('ruleexpressions'),
+                ruleexpressionsjson=self._parse_rule_expressions(rule_data.get('ruleexpressions')),
                 isactive=rule_data.get('isactive', True),
                 createdby=rule_data.get('createdby', "SYSTEM"),
                 created=datetime.datetime.utcnow(),
@@ -220,12 +244,95 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             db.add(new_rule_log)
             db.add(rule)
             db.commit()
+            FACET_CACHE.clear()
             return 1
         except Exception as ex:
             logger.error(f"Error occurred while cloning the rule: {ex}", exc_info=True)
             db.rollback()
             return 0
 
+    def import_rules(self, db: Session, rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many rules and their creation logs in a single transaction.
+        Unique ids are allocated in one block per prefix; nothing is kept if any row fails.
+        """
+        prefixes = [self._get_rule_type_prefix(rule_data.get('ruletype')) for rule_data in rules]
+        expressions = [self._parse_rule_expressions(rule_data.get('ruleexpressions')) for rule_data in rules]
+
+        try:
+            allocated = {
+                prefix: iter(self._allocate_rule_numbers(db, prefix, prefixes.count(prefix)))
+                for prefix in set(prefixes)
+            }
+
+            now = datetime.datetime.utcnow()
+            new_rules = []
+            new_logs = []
+            for rule_data, prefix, expressions_json in zip(rules, prefixes, expressions):
+                unique_id = f"{prefix}{next(allocated[prefix]):04d}"
+                is_active = rule_data.get('isactive', True)
+                new_rules.append(BusinessRule(
+                    uniqueruleid=unique_id,
+                    ruletype=rule_data.get('ruletype'),
+                    ruleexpressions=rule_data.get('ruleexpressions'),
+                    ruleexpressionsjson=expressions_json,
+                    isactive=is_active,
+                    createdby="SYSTEM",
+                    created=now,
+                    updated=now,
+                    password=rule_data.get('password'),
+                    groupcode=rule_data.get('groupcode'),
+                    filetypeid=rule_data.get('filetypeid'),
+                    sourceid=rule_data.get('sourceid'),
+                    reasonfortoggle=rule_data.get('reasonfortoggle'),
+                    usage=0
+                ))
+                new_logs.append(BusinessRuleLog(
+                    uniqueruleid=unique_id,
+                    changetype=ChangeType.Added,
+                    ruleexpressions=rule_data.get('ruleexpressions'),
+                    rulelogmessage="The Rule is enabled" if is_active else "The Rule is disabled",
+                    rulelogtitle="Rule Imported",
+                    createdby="SYSTEM",
+                    created=now,
+                    isactive=True
+                ))
+
+            db.add_all(new_rules)
+            db.add_all(new_logs)
+            db.commit()
+            FACET_CACHE.clear()
+            logger.info(f"Rule: Imported {len(new_rules)} rule(s).")
+            return {
+                "ImportedCount": len(new_rules),
+                "UniqueRuleIds": [rule.uniqueruleid for rule in new_rules]
+            }
+        except Exception as ex:
+            logger.error(f"Rule: Error occurred while importing rules: {ex}", exc_info=True)
+            db.rollback()
+            raise
+
+    def export_rules(self, db: Session, rule_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rules in id order for JSON lines export.
+        """
+        query = db.query(BusinessRule)
+        if rule_type:
+            query = query.filter(BusinessRule.ruletype == rule_type)
+
+        for rule in query.order_by(BusinessRule.businessruleid).yield_per(500):
+            yield {
+                "uniqueruleid": rule.uniqueruleid,
+                "ruletype": rule.ruletype,
+                "ruleexpressions": rule.ruleexpressions,
+                "isactive": rule.isactive,
+                "password": rule.password,
+                "groupcode": rule.groupcode,
+                "reasonfortoggle": rule.reasonfortoggle,
+                "filetypeid": rule.filetypeid,
+                "sourceid": rule.sourceid
+            }
+
     def get_business_rules_api(self, db: Session) -> List[Any]:
         # Implementation depends on return type, assuming basic list matching Entity
         # Check 'GetBusinessRuleApi' stored proc logic from C# if specific cols needed
@@ -259,6 +366,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                 
                 db.add(new_rule_log)
                 db.commit()
+                FACET_CACHE.clear()
                 return rule_log_title
             
             return "Error occured while toggling rule"
@@ -266,19 +374,27 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             logger.error(f"Rule : Error occured while toggling rule: {ex}", exc_info=True)
             return "Error occured while toggling rule"
 
-    def update_stage(self, db: Session) -> Any:
+    def update_stage(self, db: Session, audit_writer: IAuditWriter) -> Any:
         try:
             # Fetch Files
             files = db.query(FileManager).filter(
                 FileManager.stage == FileProcessStage.DocReady.value
             ).all()
 
-            classification_rules = self._get_business_rules(db, BusinessRuleTypes.Classification)
-            ignore_rules = self._get_business_rules(db, BusinessRuleTypes.Ignore)
+            # Compile each rule set once for the whole batch
+            classification_matcher = RuleMatcher(self._get_business_rules(db, BusinessRuleTypes.Classification))
+            ignore_matcher = RuleMatcher(self._get_business_rules(db, BusinessRuleTypes.Ignore))
+
+            # Rule assigned to each file before this pass, used to keep rule usage counters in step
+            original_rules = {file.fileid: file.rule for file in files}
 
             for file in files:
+                metadata = parse_file_metadata(file.file_metadata)
+                if file.file_metadata and metadata is None:
+                    logger.error(f"BUSINESS RULE : Error parsing metadata for file {file.fileuid}")
+
                 # 1. Classification
-                matched_class_rule = self._get_matching_classification_rule(file, classification_rules)
+                matched_class_rule = classification_matcher.match(metadata, file.harvestsource)
                 
                 if matched_class_rule and matched_class_rule.filetypeid:
                     if file.stage != FileProcessStage.Classified.value:
@@ -297,7 +413,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                             file.businessruleapplieddate = datetime.datetime.utcnow()
 
                 # 2. Ignore
-                ignore_rule = self._is_rule_applied(file, ignore_rules)
+                ignore_rule = ignore_matcher.match(metadata, file.harvestsource)
                 
                 if ignore_rule:
                     if file.stage != FileProcessStage.Ignored.value:
@@ -312,18 +428,18 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                         file.statuscomment = "File match With ignored Rule"
                         file.businessruleapplieddate = datetime.datetime.utcnow()
                         
-                        self._log_file_process(db, file, ignore_rule.uniqueruleid, "File match With ignored Rule", FileProcessStatus.Ignored.value)
+                        self._log_file_process(db, audit_writer, file, ignore_rule.uniqueruleid, "File match With ignored Rule", FileProcessStatus.Ignored.value)
 
                 elif file.stage == FileProcessStage.Classified.value:
                     logger.info(f"BUSINESS RULE : File {file.fileuid} moved to InProgress.")
                     file.statuscomment = "File match With Classified Rule"
                     file.businessruleapplieddate = datetime.datetime.utcnow()
                     
-                    self._log_file_process(db, file, ignore_rule.uniqueruleid if ignore_rule else None, "File match With Classified Rule", file.status)
+                    self._log_file_process(db, audit_writer, file, ignore_rule.uniqueruleid if ignore_rule else None, "File match With Classified Rule", file.status)
                     
                     file.stage = FileProcessStage.ExtractReady.value
                     
-                    self._log_file_process(db, file, ignore_rule.uniqueruleid if ignore_rule else None, "File is ExtractReady", file.status)
+                    self._log_file_process(db, audit_writer, file, ignore_rule.uniqueruleid if ignore_rule else None, "File is ExtractReady", file.status)
                     
                 else:
                     logger.info(f"BUSINESS RULE : File {file.fileuid} is not match on classified and ignore.")
@@ -333,115 +449,97 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                     file.statuscomment = "File Not match with classified and ignore."
                     file.businessruleapplieddate = datetime.datetime.utcnow()
                     
-                    self._log_file_process(db, file, None, "File Not match with classified and ignore.", file.status)
+                    self._log_file_process(db, audit_writer, file, None, "File Not match with classified and ignore.", file.status)
                     
                     file.stage = FileProcessStage.ExtractReady.value
-                    self._log_file_process(db, file, None, "File is ExtractReady", file.status)
+                    self._log_file_process(db, audit_writer, file, None, "File is ExtractReady", file.status)
+
+            self._apply_usage_deltas(db, original_rules, files)
 
             db.commit()
+            FACET_CACHE.clear()
             return files
         except Exception as ex:
             logger.error(f"BUSINESS RULE : Error occurred while updating Status: {ex}", exc_info=True)
             db.rollback()
             return None
 
-    def _get_business_rules(self, db: Session, rule_type: str) -> List[BusinessRule]:
-        return db.query(BusinessRule).filter(BusinessRule.ruletype == rule_type).all()
+    def _apply_usage_deltas(self, db: Session, original_rules: Dict[int, Optional[str]], files: List[FileManager]) -> None:
+        """
+        Adjust the denormalized usage counters for files whose rule changed in this pass.
+        Runs in the caller's transaction, so counters commit together with the file updates.
+        """
+        deltas = Counter()
+        for file in files:
+            previous_rule = original_rules.get(file.fileid)
+            if previous_rule == file.rule:
+                continue
+            if previous_rule:
+                deltas[previous_rule] -= 1
+            if file.rule:
+                deltas[file.rule] += 1
+
+        params = [{"b_rule": rule, "b_delta": delta} for rule, delta in deltas.items() if delta]
+        if not params:
+            return
+
+        rule_table = BusinessRule.__table__
+        db.execute(
+            update(rule_table)
+            .where(rule_table.c.uniqueruleid == bindparam("b_rule"))
+            .values(usage=func.coalesce(rule_table.c.usage, 0) + bindparam("b_delta")),
+            params
+        )
 
-    def _get_matching_classification_rule(self, file: FileManager, rules: List[BusinessRule]) -> Optional[BusinessRule]:
-        if not file.file_metadata:
-            return None
-        
+    def reconcile_rule_usage(self, db: Session) -> int:
+        """
+        Recompute the usage counters from tbl_file_manager and correct any drift.
+        Returns the number of rules whose counter was changed.
+        """
         try:
-            metadata = json.loads(file.file_metadata)
-        except json.JSONDecodeError:
-            logger.error(f"BUSINESS RULE : Error parsing metadata for file {file.fileuid}")
-            return None
-        
-        if file.harvestsource == "Email":
-             return self._has_matching_email_rules(metadata, rules)
-        else:
-             file_name = metadata.get("File_Name")
-             if file_name:
-                 return self._check_for_matching_rule(file_name, rules)
-        return None
+            rule_table = BusinessRule.__table__
+            usage_counts = (
+                select(FileManager.rule.label("rule"), func.count(FileManager.fileid).label("usage"))
+                .where(FileManager.rule.isnot(None))
+                .group_by(FileManager.rule)
+                .subquery()
+            )
 
-    def _is_rule_applied(self, file: FileManager, rules: List[BusinessRule]) -> Optional[BusinessRule]:
-        if not file.file_metadata:
-            return None
-        
-        try:
-            metadata = json.loads(file.file_metadata)
-        except:
-             return None
+            # Rules referenced by files
+            corrected = db.execute(
+                update(rule_table)
+                .where(
+                    rule_table.c.uniqueruleid == usage_counts.c.rule,
+                    rule_table.c.usage.is_distinct_from(usage_counts.c.usage)
+                )
+                .values(usage=usage_counts.c.usage)
+            ).rowcount
+
+            # Rules no longer referenced by any file
+            corrected += db.execute(
+                update(rule_table)
+                .where(
+                    func.coalesce(rule_table.c.usage, 0) != 0,
+                    ~exists().where(FileManager.rule == rule_table.c.uniqueruleid)
+                )
+                .values(usage=0)
+            ).rowcount
 
-        if file.harvestsource == "Email":
-            return self._has_matching_email_rules(metadata, rules)
-        else:
-            file_name = metadata.get("File_Name")
-            if file_name:
-                return self._check_for_matching_rule(file_name, rules)
-        return None
-
-    def _has_matching_email_rules(self, metadata: Dict, rules: List[BusinessRule]) -> Optional[BusinessRule]:
-        # metadata keys based on C#
-        subject = metadata.get("Subject")
-        sender = metadata.get("To") # C# uses 'To' for SenderAddress? code says SenderAddress = parsedMetadata["To"]
-        body = metadata.get("Email_Body")
-        filename = metadata.get("File_Name")
-
-        for rule in rules:
-            if (self._contains_pattern(rule.ruleexpressions, subject) or
-                self._contains_pattern(rule.ruleexpressions, sender) or
-                self._contains_pattern(rule.ruleexpressions, body) or
-                self._contains_pattern(rule.ruleexpressions, filename)):
-                return rule
-        return None
-
-    def _check_for_matching_rule(self, file_name: str, rules: List[BusinessRule]) -> Optional[BusinessRule]:
-        for rule in rules:
-            if not rule.ruleexpressions:
-                continue
-            
-            # Note: C# code parses ruleExpression just to check FileName key presence?
-            # It actually calls ContainsPattern with isEmail=false (default is true)
-            # which does specific 'FileName' key check
-            if self._contains_pattern(rule.ruleexpressions, file_name, is_email=False):
-                return rule
-        return None
-
-    def _contains_pattern(self, rule_data: str, file_data: str, is_email: bool = True) -> bool:
-        if not rule_data or not file_data:
-            return False
-            
-        try:
-            rule_dict = json.loads(rule_data)
-        except:
-            return False
-
-        if not is_email:
-            # File Only Check
-            if "FileName" in rule_dict:
-                pattern = rule_dict["FileName"]
-                if pattern:
-                    # Convert wildcard * to regex .*
-                    regex_pattern = pattern.replace("*", ".*")
-                    if re.search(regex_pattern, file_data, re.IGNORECASE):
-                        return True
-            return False
-
-        # Email Check (Iterate all keys)
-        for key, pattern in rule_dict.items():
-            if not pattern:
-                continue
-            regex_pattern = pattern.replace("*", ".*")
-            if re.search(regex_pattern, file_data, re.IGNORECASE):
-                return True
-        
-        return False
+            db.commit()
+            FACET_CACHE.clear()
+            logger.info(f"BUSINESS RULE : Usage reconcile corrected {corrected} rule(s).")
+            return corrected
+        except Exception as ex:
+            logger.error(f"BUSINESS RULE : Error occurred while reconciling rule usage: {ex}", exc_info=True)
+            db.rollback()
+            raise
+
+    def _get_business_rules(self, db: Session, rule_type: str) -> List[BusinessRule]:
+        return db.query(BusinessRule).filter(BusinessRule.ruletype == rule_type).all()
 
-    def _log_file_process(self, db: Session, file: FileManager, rule_id: Optional[str], comment: str, status: Optional[str]):
-        log = FileProcessLog(
+    def _log_file_process(self, db: Session, audit_writer: IAuditWriter, file: FileManager, rule_id: Optional[str], comment: str, status: Optional[str]):
+        audit_writer.add_process_log(
+            db,
             fileuid=file.fileuid,
             stage=file.stage,
             status=status,
@@ -451,7 +549,8 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             created=datetime.datetime.utcnow(),
             isactive=True
         )
-        activity = FileActivity(
+        audit_writer.add_activity(
+            db,
             fileuid=file.fileuid,
             status=status,
             stage=file.stage,
@@ -460,8 +559,6 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             created=datetime.datetime.utcnow(),
             isactive=True
         )
-        db.add(log)
-        db.add(activity)
 
     def apply_business_rule_api_async(self, db: Session) -> int:
         # Calls Stored Proc in C# : EXECUTE [alts].[ProcessingRule]
@@ -489,18 +586,12 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             SourceTypeAlias = aliased(MasterConfigurationType, name="SourceType")
             FileTypeAlias = aliased(MasterConfigurationType, name="FileType")
 
-            usage_subquery = db.query(func.count(FileManager.fileid)).filter(
-                FileManager.rule == BusinessRule.uniqueruleid
-            ).correlate(BusinessRule).as_scalar().label("Usage")
+            # Usage is the denormalized counter maintained by update_stage and the reconcile job
+            usage_column = func.coalesce(BusinessRule.usage, 0)
 
-            # JSON extraction helpers
+            # Rule expression keys come from the generated columns, no per-row JSON parsing
             def get_json_v(field):
-                # We use a CASE statement to avoid casting non-JSON strings to JSONB, which would fail.
-                # Heuristic: If it starts with '{', we try to cast and extract.
-                return case(
-                    (BusinessRule.ruleexpressions.like('{%'), cast(BusinessRule.ruleexpressions, JSONB).op('->>')(field)),
-                    else_=''
-                )
+                return RULE_EXPRESSION_COLUMNS[field]
 
             # Define columns to select
             query = db.query(
@@ -522,7 +613,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                 BusinessRule.password.label("Password"),
                 BusinessRule.groupcode.label("GroupCode"),
                 FileTypeAlias.displayname.label("FileType"),
-                usage_subquery
+                usage_column.label("Usage")
             )
 
             # Left Joins
@@ -629,7 +720,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             elif sc == 'created':
                 query = query.order_by(sort_order_fn(BusinessRule.created))
             elif sc == 'usage':
-                query = query.order_by(sort_order_fn(usage_subquery))
+                query = query.order_by(sort_order_fn(usage_column))
             elif sc == 'createdby':
                 query = query.order_by(sort_order_fn(BusinessRule.createdby))
             elif sc == 'updated':
@@ -691,9 +782,33 @@ class BusinessRuleRepository(IBusinessRuleRepository):
              logger.error(f"Error retrieving Business Data: {ex}", exc_info=True)
              return {"ResultObject": [], "Count": 0, "ResultCode": 500, "ResultMessage": str(ex)}
 
-    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str) -> Any:
+    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str,
+                                     prefix: Optional[str] = None, limit: Optional[int] = None) -> Any:
+        """
+        Distinct values for a rule grid column filter, optionally narrowed to a prefix.
+        The full distinct set is cached per filter and reused while the user types.
+        """
+        cache_key = (filter_field, rule_type, source_type, content_type)
+        values = FACET_CACHE.get(cache_key)
+        if values is None:
+            values = self._get_filter_values(db, filter_field, source_type, rule_type, content_type)
+            if values is None:
+                return {"value": []}
+            FACET_CACHE.set(cache_key, values)
+
+        if prefix:
+            prefix = prefix.casefold()
+            values = [val for val in values if val.casefold().startswith(prefix)]
+        if limit:
+            values = values[:limit]
+
+        # Format response: {"value": [{filter_field: val}]}
+        return {"value": [{filter_field: val} for val in values]}
+
+    def _get_filter_values(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str) -> Optional[List[str]]:
         """
         Implementation of GetBusinessFilterByField matching SQL Stored Procedure logic.
+        Returns the sorted distinct values, or None when the field is unknown or the query fails.
         """
         try:
             from sqlalchemy.orm import aliased
@@ -702,19 +817,16 @@ class BusinessRuleRepository(IBusinessRuleRepository):
             FileTypeAlias = aliased(MasterConfigurationType, name="FileType")
 
             # Determine the value expression
-            if filter_field in ['Subject', 'EmailBody', 'SenderAddress']:
-                # JSON_VALUE equivalent in Postgres with resilience
-                value_expression = case(
-                    (BusinessRule.ruleexpressions.like('{%'), cast(BusinessRule.ruleexpressions, JSONB).op('->>')(filter_field)),
-                    else_=''
-                ).label("FilterValue")
+            if filter_field in RULE_EXPRESSION_COLUMNS:
+                # JSON_VALUE equivalent, served by the generated rule expression columns
+                value_expression = RULE_EXPRESSION_COLUMNS[filter_field].label("FilterValue")
             else:
                 # Direct column access
                 if hasattr(BusinessRule, filter_field.lower()):
                     value_expression = getattr(BusinessRule, filter_field.lower()).label("FilterValue")
                 else:
                     logger.warning(f"Field {filter_field} not found on BusinessRule model.")
-                    return {"value": []}
+                    return None
 
             # Build query
             query = db.query(value_expression).distinct()
@@ -753,7 +865,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                      pass
 
             # Exclude NULL and empty strings
-            if filter_field in ['Subject', 'EmailBody', 'SenderAddress']:
+            if filter_field in RULE_EXPRESSION_COLUMNS:
                 filters.append(value_expression.isnot(None))
                 filters.append(value_expression != '')
             else:
@@ -764,43 +876,70 @@ class BusinessRuleRepository(IBusinessRuleRepository):
 
             results = query.all()
 
-            # Format response: {"value": [{filter_field: val}]}
-            values_list = []
-            for r in results:
-                val = r[0]
-                if val is not None:
-                    values_list.append({filter_field: str(val)})
-
-            return {"value": values_list}
+            return sorted({str(r[0]) for r in results if r[0] is not None}, key=str.casefold)
 
         except Exception as ex:
             logger.error(f"Error in get_business_filter_by_field: {ex}", exc_info=True)
-            return {"value": []}
-
-    def get_business_rule_log_data(self, db: Session, rule_id: str) -> List[Dict[str, Any]]:
-        results = (
-            db.query(BusinessRuleLog)
-            .filter(BusinessRuleLog.uniqueruleid == rule_id)
-            .order_by(desc(BusinessRuleLog.created))
-            .all()
-        )
-        
-        log_list = []
-        for log in results:
-            log_list.append({
-                "BusinessRuleLogId": log.businessrulelogid,
-                "UniqueRuleId": log.uniqueruleid,
-                "ChangeType": log.changetype,
-                "RuleExpressions": log.ruleexpressions,
-                "RuleLogMessage": log.rulelogmessage,
-                "RuleLogTitle": log.rulelogtitle,
-                "Created": log.created.isoformat() if log.created else None,
-                "CreatedBy": log.createdby,
-                "Updated": log.updated.isoformat() if log.updated else None,
-                "UpdatedBy": log.updatedby,
-                "IsActive": log.isactive
-            })
-        return log_list
+            return None
+
+    def get_business_rule_log_data(self, db: Session, rule_id: str, page_size: Optional[int] = None, cursor: Optional[str] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Logs of a rule, newest first. Without page_size or cursor every log is
+        returned as a list; otherwise one keyset page is returned with the
+        cursor of the next one.
+        """
+        paged = page_size is not None or cursor is not None
+        query = db.query(BusinessRuleLog).filter(BusinessRuleLog.uniqueruleid == rule_id)
+        query = query.order_by(desc(BusinessRuleLog.created), desc(BusinessRuleLog.businessrulelogid))
+
+        if not paged:
+            return [self._to_business_rule_log(log) for log in query.all()]
+
+        page_size = page_size or DEFAULT_RULE_LOG_PAGE_SIZE
+        # Keyset pagination on (created, id), newest first
+        if cursor:
+            cursor_created, cursor_id = decode_cursor(cursor)
+            query = query.filter(
+                tuple_(BusinessRuleLog.created, BusinessRuleLog.businessrulelogid) < tuple_(cursor_created, cursor_id)
+            )
+
+        results = query.limit(page_size + 1).all()
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        return {
+            "ResultObject": [self._to_business_rule_log(log) for log in results],
+            "NextCursor": encode_cursor(results[-1].created, results[-1].businessrulelogid) if has_more else None
+        }
+
+    @staticmethod
+    def _to_business_rule_log(log: BusinessRuleLog) -> Dict[str, Any]:
+        return {
+            "BusinessRuleLogId": log.businessrulelogid,
+            "UniqueRuleId": log.uniqueruleid,
+            "ChangeType": log.changetype,
+            "RuleExpressions": log.ruleexpressions,
+            "RuleLogMessage": log.rulelogmessage,
+            "RuleLogTitle": log.rulelogtitle,
+            "Created": log.created.isoformat() if log.created else None,
+            "CreatedBy": log.createdby,
+            "Updated": log.updated.isoformat() if log.updated else None,
+            "UpdatedBy": log.updatedby,
+            "IsActive": log.isactive
+        }
+
+    def _get_usage_log_count(self, db: Session, rule_id: Optional[str]) -> int:
+        # Same join and filter as the page query, so logs without a file are not counted;
+        # cached briefly, so paging never recounts
+        def count_usage():
+            query = db.query(func.count(FileProcessLog.fileprocesslogid)).join(
+                FileManager, FileProcessLog.fileuid == FileManager.fileuid
+            )
+            if rule_id:
+                query = query.filter(FileProcessLog.ruleid == rule_id)
+            return query.scalar()
+
+        return USAGE_LOG_COUNT_CACHE.get_or_set(rule_id, count_usage)
 
     def get_usage_log_by_rule_async(self, db: Session, input_model: Any) -> Any:
         try:
@@ -819,20 +958,27 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                  rule_id = input_model.get('UniqueRuleId')
                  if rule_id:
                      query = query.filter(FileProcessLog.ruleid == rule_id)
-                 
-                 # Sorting
-                 sort_col = input_model.get('SortColumn')
-                 sort_order = input_model.get('SortOrder', 'asc')
-                 # Add sort logic if needed
-                 
-                 # Pagination
-                 page_index = int(input_model.get('PageIndex', 1))
+
                  page_size = int(input_model.get('PageSize', 10))
-                 offset = (page_index - 1) * page_size
-                 
-                 total_records = query.count()
-                 results = query.offset(offset).limit(page_size).all()
-                 
+                 page_index = int(input_model.get('PageIndex', 1))
+                 cursor = input_model.get('Cursor')
+
+                 # Keyset pagination on (created, id), newest first; PageIndex is kept for older callers
+                 if cursor:
+                     cursor_created, cursor_id = decode_cursor(cursor)
+                     query = query.filter(
+                         tuple_(FileProcessLog.created, FileProcessLog.fileprocesslogid) < tuple_(cursor_created, cursor_id)
+                     )
+                 query = query.order_by(desc(FileProcessLog.created), desc(FileProcessLog.fileprocesslogid))
+                 if not cursor and page_index > 1:
+                     query = query.offset((page_index - 1) * page_size)
+
+                 results = query.limit(page_size + 1).all()
+                 has_more = len(results) > page_size
+                 results = results[:page_size]
+
+                 total_records = self._get_usage_log_count(db, rule_id)
+
                  # Map to result list
                  usage_logs = []
                  for log, fname, ftype in results:
@@ -845,14 +991,88 @@ class BusinessRuleRepository(IBusinessRuleRepository):
                          "FileUID": log.fileuid,
                          "UniqueRuleId": log.ruleid
                      })
-                     
+
+                 next_cursor = None
+                 if has_more:
+                     last_log = results[-1][0]
+                     next_cursor = encode_cursor(last_log.created, last_log.fileprocesslogid)
+
                  return {
                      "ResultObject": usage_logs,
                      "Count": total_records,
+                     "NextCursor": next_cursor,
                      "ResultCode": 200
                  }
 
             return {"ResultObject": [], "Count": 0, "ResultCode": 200}
+        except ValueError:
+            raise
         except Exception as ex:
             logger.error(f"Usage Log : Error retrieving usage log data: {ex}", exc_info=True)
             return {"ResultObject": [], "Count": 0, "ResultCode": 500}
+
+    def simulate_rule(self, db: Session, input_model: Any) -> Any:
+        """
+        Dry-run a candidate rule against the files created in a date window.
+        Files are streamed in keyset chunks by fileid and nothing is written.
+        """
+        from src.domain.dtos.business_rule_api_input import SimulateBusinessRuleInput
+
+        if isinstance(input_model, dict):
+            input_model = SimulateBusinessRuleInput(**input_model)
+
+        if input_model.RuleType not in (BusinessRuleTypes.Ignore.value, BusinessRuleTypes.Classification.value):
+            raise ValueError("Only Ignore and Classification rules can be simulated")
+        if input_model.ToDate < input_model.FromDate:
+            raise ValueError("ToDate must not be before FromDate")
+        if not self._parse_rule_expressions(input_model.RuleExpressions):
+            raise ValueError("Rule expressions are required")
+
+        candidate = BusinessRule(
+            uniqueruleid="SIMULATION",
+            ruletype=input_model.RuleType,
+            ruleexpressions=input_model.RuleExpressions
+        )
+        matcher = RuleMatcher([candidate])
+
+        window_start = datetime.datetime.combine(input_model.FromDate, datetime.time.min)
+        window_end = datetime.datetime.combine(input_model.ToDate + datetime.timedelta(days=1), datetime.time.min)
+
+        scanned_count = 0
+        matched_count = 0
+        matched_by_source = Counter()
+        sample_fileuids = []
+        last_file_id = 0
+
+        while True:
+            chunk = db.query(
+                FileManager.fileid,
+                FileManager.fileuid,
+                FileManager.harvestsource,
+                FileManager.file_metadata
+            ).filter(
+                FileManager.created >= window_start,
+                FileManager.created < window_end,
+                FileManager.fileid > last_file_id
+            ).order_by(FileManager.fileid).limit(input_model.ChunkSize).all()
+
+            if not chunk:
+                break
+
+            for row in chunk:
+                scanned_count += 1
+                if matcher.match(parse_file_metadata(row.file_metadata), row.harvestsource):
+                    matched_count += 1
+                    matched_by_source[row.harvestsource or "Unknown"] += 1
+                    if len(sample_fileuids) < input_model.SampleSize:
+                        sample_fileuids.append(str(row.fileuid))
+
+            last_file_id = chunk[-1].fileid
+
+        logger.info(f"BUSINESS RULE : Simulation matched {matched_count} of {scanned_count} file(s).")
+        return {
+            "ScannedCount": scanned_count,
+            "MatchedCount": matched_count,
+            "MatchedByHarvestSource": dict(matched_by_source),
+            "SampleFileUids": sample_fileuids
+        }
@@ -27,6 +27,7 @@ from src.infrastructure.database.query_builders.update_file_configuration_query_
 from src.domain.interfaces.file_configure_repository_interface import IFileConfigurationRepository
 from src.domain.dtos.file_configuration_dto import FileConfiguration as FileConfigurationDTO, FileConfigurationField
 from src.infrastructure.database.query_builders.save_file_configuration_query_builder import SaveFileConfigurationQueryBuilder
+from src.infrastructure.database.configuration_schema_cache import invalidate_configuration_schemas
 from src.infrastructure.logging.logger_manager import get_logger
 from uuid import UUID
 logger = get_logger(__name__)
@@ -98,6 +99,7 @@ class FileConfigurationRepository(IFileConfigurationRepository):
             )
 
             query_builder.commit()
+            invalidate_configuration_schemas()
             await self._send_to_external_api(configuration)
 
             logger.info("FileConfiguration saved and sent externally")
@@ -185,6 +187,7 @@ class FileConfigurationRepository(IFileConfigurationRepository):
 
             # 5. Commit transaction
             query_builder.commit()
+            invalidate_configuration_schemas()
 
             # 6. Send the updated configuration to external API
             await self._send_to_external_api(existing_config)
@@ -224,6 +227,7 @@ class FileConfigurationRepository(IFileConfigurationRepository):
             file_config_result.updatedby = fileConfiguration.updated_by
 
             query_builder.update_file_configuration_in_db()
+            invalidate_configuration_schemas()
 
             #Log changes if any
             if changes:
@@ -7,10 +7,11 @@ from typing import Optional
 from datetime import datetime
 from src.domain.dtos.file_request_dto import FileRequestDTO
 from src.domain.entities.file_manager import FileManager
-from src.domain.entities.extraction_file_detail import ExtractionFileDetail
-from typing import List, Any, Dict
+from src.domain.entities.extraction_file_detail import EXTRACTION_PAYLOAD, ExtractionFileDetail
+from typing import List, Any, Dict, Set
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.orm import Session, undefer, undefer_group
 
 from src.domain.dtos.extract_file_dto import FileSecurityMappingDTO
 from src.domain.interfaces.file_manager_repository_interface import (
@@ -31,10 +32,17 @@ from src.infrastructure.database.query_builders.file_details_query_builder impor
 from src.infrastructure.database.query_builders.file_details_result_enricher import (
     FileDetailsResultEnricher,
 )
+from src.domain.entities.compressed_payload import CODEC_MARKERS, compress_text, decompress_text
+from src.infrastructure.database.configuration_schema_cache import (
+    get_configuration_schema,
+    get_validation_plan,
+)
 from src.infrastructure.logging.logger_manager import get_logger
+from src.utils.extraction_validator import ValidationPlan
 from src.domain.dtos.file_details_dto import FileDetailsResponse
 from uuid import UUID
 from src.domain.dtos.extract_file_dto import (
+    EXTRACTION_PAYLOAD_FIELDS,
     ExtractionFileField,
     ExtractionFileDetailDTO,
     FileConfigurationFieldDTO,
@@ -121,6 +129,37 @@ class FileManagerRepository(IFileManagerRepository):
             logger.error(f"GetFileDetailsByFileUID error: {ex}", exc_info=True)
             raise
 
+    def get_file_details_by_file_uids(
+        self, db: Session, fileuids: List[UUID]
+    ) -> Dict:
+        """
+        File details of many files: one query for the files and one for the
+        SLA thresholds of their configurations. Every requested fileuid is in
+        the result, with found=False when there is no such file.
+        """
+        try:
+            fileuids = list(dict.fromkeys(fileuids))
+            logger.info(f"GetFileDetailsByFileUIDs: {len(fileuids)} fileuid(s)")
+
+            query_builder = FileDetailsQueryBuilder(db, file_uids=fileuids)
+            query_builder.build_query()
+            files = query_builder.get_all()
+
+            enricher = FileDetailsResultEnricher(db)
+            details_by_uid = {
+                details["fileuid"]: details for details in enricher.enrich_many(files)
+            }
+
+            data = {
+                uid: {"found": uid in details_by_uid, "details": details_by_uid.get(uid)}
+                for uid in fileuids
+            }
+            return {"total": len(details_by_uid), "data": data}
+
+        except Exception as ex:
+            logger.error(f"GetFileDetailsByFileUIDs error: {ex}", exc_info=True)
+            raise
+
     def get_manual_extraction_config_fields_by_id(
         self, db: Session, fileConfigurationId: int
     ):
@@ -196,18 +235,15 @@ class FileManagerRepository(IFileManagerRepository):
         """
         try:
             from src.domain.entities.extraction_file_detail import ExtractionFileDetail
-            from src.domain.entities.file_configuration import FileConfiguration
-            from src.domain.entities.file_configuration_field import (
-                FileConfigurationField,
-            )
 
             logger.info(f"GetExtractFileApi: fileuid={fileuid}")
 
             extraction_file_field = ExtractionFileField()
 
-            # 1. Get active ExtractionFileDetail
+            # 1. Get active ExtractionFileDetail, with the payloads the screen shows
             item = (
                 db.query(ExtractionFileDetail)
+                .options(undefer_group(EXTRACTION_PAYLOAD))
                 .filter(
                     ExtractionFileDetail.fileuid == fileuid,
                     ExtractionFileDetail.isactive == True,
@@ -216,55 +252,27 @@ class FileManagerRepository(IFileManagerRepository):
             )
 
             if item:
-                extraction_file_field.extraction_file_detail = (
-                    ExtractionFileDetailDTO.model_validate(item)
+                # The DTO is built without the payloads; the stored texts are added
+                # to the dumped result as they are, never copied through pydantic
+                extraction_file_field.extraction_file_detail = ExtractionFileDetailDTO.model_validate(
+                    {
+                        name: getattr(item, name)
+                        for name in ExtractionFileDetailDTO.model_fields
+                        if name not in EXTRACTION_PAYLOAD_FIELDS
+                    }
                 )
 
-                # 2. Configuration logic
+                # 2-4. Configuration, its active fields and the Object-typed subset,
+                # shared by every file of the classification (cached)
                 if item.classification and item.classification.strip():
-                    file_configuration = (
-                        db.query(FileConfiguration)
-                        .filter(
-                            FileConfiguration.configurationname == item.classification,
-                            FileConfiguration.isactive == True,
-                        )
-                        .first()
-                    )
-
-                    if file_configuration:
-                        extraction_file_field.configuration_id = (
-                            file_configuration.fileconfigurationid
-                        )
+                    schema = get_configuration_schema(db, item.classification)
 
-                        # 3. Get all active configuration fields
-                        file_configuration_fields = (
-                            db.query(FileConfigurationField)
-                            .filter(
-                                FileConfigurationField.fileconfigurationid
-                                == file_configuration.fileconfigurationid,
-                                FileConfigurationField.isactive == True,
-                            )
-                            .all()
-                        )
-
-                        if file_configuration_fields:
-                            extraction_file_field.file_configuration_fields = [
-                                FileConfigurationFieldDTO.model_validate(f)
-                                for f in file_configuration_fields
-                            ]
-
-                            # 4. Object datatype fields
-                            object_fields = [
-                                f
-                                for f in file_configuration_fields
-                                if f.datatype == "Object"
-                            ]
-
-                            if object_fields:
-                                extraction_file_field.object_fields = [
-                                    FileConfigurationFieldDTO.model_validate(f)
-                                    for f in object_fields
-                                ]
+                    if schema:
+                        extraction_file_field.configuration_id = schema.configuration_id
+                        if schema.fields:
+                            extraction_file_field.file_configuration_fields = list(schema.fields)
+                        if schema.object_fields:
+                            extraction_file_field.object_fields = list(schema.object_fields)
 
                     # 5. Security mappings (always assign when classification matches)
                     if item.classification in ("Rage", "BrokerageMSBilling"):
@@ -286,7 +294,11 @@ class FileManagerRepository(IFileManagerRepository):
                     extraction_file_field.update_file_id = str(update_file[0])
 
             logger.info("DATABASE: Retrieved Extraction file details.")
-            return extraction_file_field.model_dump()
+            result = extraction_file_field.model_dump()
+            if item:
+                for name in EXTRACTION_PAYLOAD_FIELDS:
+                    result["extraction_file_detail"][name] = getattr(item, name)
+            return result
 
         except Exception as ex:
             logger.error(
@@ -346,8 +358,10 @@ class FileManagerRepository(IFileManagerRepository):
 
             logger.info(f"GetExtractFilesByFileUIDAsync: fileuid={fileuid}")
 
+            # extracteddata is part of the response; ingestionlog stays deferred
             results = (
                 db.query(ExtractFile)
+                .options(undefer(ExtractFile.extracteddata))
                 .filter(ExtractFile.fileuid == fileuid, ExtractFile.isactive == True)
                 .all()
             )
@@ -415,11 +429,21 @@ class FileManagerRepository(IFileManagerRepository):
             db.rollback()
             raise
 
+    def get_extraction_validation_plan(
+        self, db: Session, classification: str
+    ) -> Optional[ValidationPlan]:
+        return get_validation_plan(db, classification)
+
     def get_active_extraction_file_detail(
         self, db: Session, fileuid: UUID
     ) -> ExtractionFileDetail | None:
+        # The update diffs extraction_data; the box and confidence payloads are not needed
         return (
             db.query(ExtractionFileDetail)
+            .options(
+                undefer(ExtractionFileDetail.extraction_data_text),
+                undefer(ExtractionFileDetail.extraction_data_frame),
+            )
             .filter(
                 ExtractionFileDetail.fileuid == fileuid,
                 ExtractionFileDetail.isactive == True,
@@ -432,33 +456,70 @@ class FileManagerRepository(IFileManagerRepository):
     ) -> FileManager | None:
         return db.query(FileManager).filter(FileManager.fileuid == fileuid).first()
 
+    def compact_extraction_payloads(self, db: Session, codec: str, batch_size: int) -> int:
+        """
+        Move one batch of extraction payloads into the given codec's frames, or
+        back to the text columns for "none" (commits). Returns the number of
+        rows rewritten; 0 when done.
+        """
+        payloads = (
+            (ExtractionFileDetail.extraction_data_text, ExtractionFileDetail.extraction_data_frame),
+            (ExtractionFileDetail.bounding_box_data_text, ExtractionFileDetail.bounding_box_data_frame),
+            (ExtractionFileDetail.confidence_scores_text, ExtractionFileDetail.confidence_scores_frame),
+        )
+        if codec == "none":
+            stale = or_(*(frame.isnot(None) for _, frame in payloads))
+        else:
+            marker = CODEC_MARKERS[codec]
+            stale = or_(*(
+                or_(text.isnot(None), and_(frame.isnot(None), func.get_byte(frame, 0) != marker))
+                for text, frame in payloads
+            ))
+
+        rows = (
+            db.query(ExtractionFileDetail.recid, *(column for payload in payloads for column in payload))
+            .filter(stale)
+            .order_by(ExtractionFileDetail.recid)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not rows:
+            db.rollback()
+            return 0
+
+        values = []
+        for row in rows:
+            value = {"recid": row.recid}
+            for text_column, frame_column in payloads:
+                # Text written since the last compaction wins over an older frame
+                text = getattr(row, text_column.key)
+                frame = getattr(row, frame_column.key)
+                if text is None and frame is not None:
+                    text = decompress_text(frame)
+                if codec == "none" or text is None:
+                    value[text_column.key], value[frame_column.key] = text, None
+                else:
+                    value[text_column.key], value[frame_column.key] = None, compress_text(text, codec)
+            values.append(value)
+
+        db.execute(update(ExtractionFileDetail), values)
+        db.commit()
+        return len(rows)
+
     def file_exists(self, db, fileuid: UUID):
         return db.query(FileManager).filter(FileManager.fileuid == fileuid).first()
 
-    def save_file_received(self, db, file: dict, is_manually: bool):
-
-        # folder_name = datetime.utcnow().strftime("%d%b%Y")
-
-        # # Structured vs unstructured logic
-        # if file.get("category") == "Structured":
-        #     file_name = file["filename"]
-        # else:
-        #     file_name = str(file["fileuid"])
-
-        # # 🔹 Azure upload (THIS WAS MISSING)
-        # blob_path = self.uploader.upload_base64(
-        #     base64_content=file["content"],
-        #     file_name=file_name,
-        #     folder=folder_name,
-        # )
-
-        # Update file path after upload
-        # file["file_path"] = blob_path
-        file.pop("content", None)  # store this file on the azure devops
-        entity = FileManager(**file)
-        db.add(entity)
-        db.commit()
-        return 1
+    def save_files_received(self, db: Session, files: List[dict]) -> int:
+        """
+        Insert a batch of received files as one multi-row INSERT
+        (insertmanyvalues); the caller commits. Goes through the Core table so
+        None values are sent as NULL instead of splitting the batch by key set.
+        """
+        if not files:
+            return 0
+        db.execute(insert(FileManager.__table__), files)
+        return len(files)
 
     # def save_document_activity(self, db, fileuid, status_comment: str):
     #     activity = DocumentActivity(
@@ -502,3 +563,144 @@ class FileManagerRepository(IFileManagerRepository):
     def get_file(self, db: Session, fileuid: UUID):
         return self.get_file_by_fileuid(db, fileuid)
 
+
+    def get_files_by_fileuids(self, db: Session, fileuids: List[UUID]) -> List[FileManager]:
+        if not fileuids:
+            return []
+        return (
+            db.query(FileManager)
+            .filter(FileManager.fileuid.in_(fileuids), FileManager.isactive == True)
+            .all()
+        )
+
+    def get_previous_states(self, db: Session, fileuids: List[UUID]) -> Dict[UUID, Any]:
+        """
+        Previous distinct (status, stage) of each file, computed in SQL:
+        keep the latest activity per (status, stage), rank those states by
+        recency, and return the second one. Served by (fileuid, created DESC).
+        """
+        if not fileuids:
+            return {}
+
+        group_rank = func.row_number().over(
+            partition_by=(FileActivity.fileuid, FileActivity.status, FileActivity.stage),
+            order_by=(FileActivity.created.desc(), FileActivity.fileactivityid.desc()),
+        ).label("group_rank")
+        latest_states = (
+            select(
+                FileActivity.fileuid,
+                FileActivity.status,
+                FileActivity.stage,
+                FileActivity.failurestage,
+                FileActivity.created,
+                FileActivity.fileactivityid,
+                group_rank,
+            )
+            .where(FileActivity.fileuid.in_(fileuids), FileActivity.isactive == True)
+            .subquery()
+        )
+
+        state_rank = func.row_number().over(
+            partition_by=latest_states.c.fileuid,
+            order_by=(latest_states.c.created.desc(), latest_states.c.fileactivityid.desc()),
+        ).label("state_rank")
+        ranked_states = (
+            select(
+                latest_states.c.fileuid,
+                latest_states.c.status,
+                latest_states.c.stage,
+                latest_states.c.failurestage,
+                latest_states.c.created,
+                state_rank,
+            )
+            .where(latest_states.c.group_rank == 1)
+            .subquery()
+        )
+
+        rows = db.execute(select(ranked_states).where(ranked_states.c.state_rank == 2)).all()
+        return {row.fileuid: row for row in rows}
+
+    def bulk_update_files(self, db: Session, rows: List[Dict[str, Any]]):
+        """
+        Bulk UPDATE by primary key; every row must carry fileid.
+        """
+        if rows:
+            db.execute(update(FileManager), rows)
+
+    def update_files_by_ids(self, db: Session, fileids: List[int], values: Dict[str, Any]):
+        """
+        Apply the same column values to many files in one UPDATE.
+        """
+        if fileids:
+            db.execute(update(FileManager).where(FileManager.fileid.in_(fileids)).values(**values))
+
+    def get_original_files_by_checksums(self, db: Session, checksums: Set[str]) -> Dict[str, UUID]:
+        """
+        Originals (files not themselves marked duplicate) by SHA-256, probed
+        through ix_tbl_file_manager_checksum; the oldest wins if several exist.
+        """
+        if not checksums:
+            return {}
+
+        rows = (
+            db.query(FileManager.checksum, FileManager.fileuid)
+            .filter(
+                FileManager.checksum.in_(checksums),
+                FileManager.duplicatefileid.is_(None),
+                FileManager.isactive == True,
+            )
+            .order_by(FileManager.fileid)
+            .all()
+        )
+        originals: Dict[str, UUID] = {}
+        for row in rows:
+            originals.setdefault(row.checksum, row.fileuid)
+        return originals
+
+    def get_approval_checks(self, db: Session, fileuids: List[UUID]) -> Dict[UUID, Any]:
+        """
+        Approval prerequisites per file, aggregated in SQL so extracteddata is
+        never loaded: the number of active linked extract rows (linkedcount)
+        and the lowest account SID linked more than once (duplicatesid).
+        Files without any linked row are absent from the result.
+        """
+        from src.domain.entities.extract_file import ExtractFile
+
+        if not fileuids:
+            return {}
+
+        sid_groups = (
+            select(
+                ExtractFile.fileuid,
+                ExtractFile.account_sid,
+                func.count().label("sidcount"),
+            )
+            .where(
+                ExtractFile.fileuid.in_(fileuids),
+                ExtractFile.isactive == True,
+                ExtractFile.islinked == True,
+                ExtractFile.isignored == False,
+            )
+            .group_by(ExtractFile.fileuid, ExtractFile.account_sid)
+            .subquery()
+        )
+
+        duplicate_sid = case(
+            (
+                and_(
+                    sid_groups.c.sidcount > 1,
+                    sid_groups.c.account_sid.isnot(None),
+                    sid_groups.c.account_sid != "",
+                ),
+                sid_groups.c.account_sid,
+            )
+        )
+
+        rows = db.execute(
+            select(
+                sid_groups.c.fileuid,
+                func.sum(sid_groups.c.sidcount).label("linkedcount"),
+                func.min(duplicate_sid).label("duplicatesid"),
+            ).group_by(sid_groups.c.fileuid)
+        ).all()
+        return {row.fileuid: row for row in rows}
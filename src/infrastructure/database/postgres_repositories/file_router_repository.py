@@ -1,12 +1,12 @@
 from typing import List, Dict
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
+from src.domain.interfaces.audit_writer_interface import IAuditWriter
 from src.domain.interfaces.file_router_repository_interface import IFileRouterRepository
 from src.domain.entities.extract_file import ExtractFile
 from src.infrastructure.logging.logger_manager import get_logger
 from src.domain.dtos.resolve_file_update_dto import ResolveFileUpdate
 from src.domain.entities.file_manager import FileManager
-from src.domain.entities.file_activity import FileActivity
 from src.infrastructure.database.query_builders.resolve_update_query_builder import ResolveUpdateQueryBuilder
 from datetime import datetime, timezone
 
@@ -41,7 +41,10 @@ class FileRouterRepository(IFileRouterRepository):
         try:
             logger.info(f"Fetching ExtractFile records for file_uid: {file_uid}")
 
-            results = db.query(ExtractFile).filter(
+            # extracteddata is part of the response; ingestionlog stays deferred
+            results = db.query(ExtractFile).options(
+                undefer(ExtractFile.extracteddata)
+            ).filter(
                 ExtractFile.fileuid == file_uid
             ).all()
 
@@ -55,6 +58,7 @@ class FileRouterRepository(IFileRouterRepository):
         self,
         db: Session,
         resolveUpdate: ResolveFileUpdate,
+        audit_writer: IAuditWriter,
     ) -> Dict:
         """
         Resolves file updates
@@ -62,6 +66,7 @@ class FileRouterRepository(IFileRouterRepository):
         Args:
             db (Session): The database session.
             resolveUpdate (ResolveFileUpdate): An object contains selected fileuid and ignored fileuid.
+            audit_writer (IAuditWriter): Queues the file activities for the commit.
 
         Returns:
             An object indicating the result of the resolution.
@@ -98,6 +103,7 @@ class FileRouterRepository(IFileRouterRepository):
                 self._process_updated_file(
                     db,
                     query_builder,
+                    audit_writer,
                     selected_file,
                     ignored_file,
                     resolveUpdate.updatedby,
@@ -111,10 +117,8 @@ class FileRouterRepository(IFileRouterRepository):
                     "Update file discarded"
                 )
 
-                query_builder.add_file_activities(
-                    self._build_selected_activity(selected_file, ignored_file, resolveUpdate.updatedby),
-                    self._build_ignored_activity(selected_file, ignored_file, resolveUpdate.updatedby)
-                )
+                audit_writer.add_activity(db, **self._build_selected_activity(selected_file, ignored_file, resolveUpdate.updatedby))
+                audit_writer.add_activity(db, **self._build_ignored_activity(selected_file, ignored_file, resolveUpdate.updatedby))
 
             db.commit()
 
@@ -133,6 +137,7 @@ class FileRouterRepository(IFileRouterRepository):
             self,
             db: Session,
             query_builder: ResolveUpdateQueryBuilder,
+            audit_writer: IAuditWriter,
             selected_file: FileManager,
             ignored_file: FileManager,
             updated_by: str,
@@ -142,10 +147,8 @@ class FileRouterRepository(IFileRouterRepository):
         selected_file.updatefileid = None
         query_builder.update_file(selected_file)
 
-        query_builder.add_file_activities(
-            self._build_selected_activity(selected_file, ignored_file, updated_by),
-            self._build_ignored_activity(selected_file, ignored_file, updated_by)
-        )
+        audit_writer.add_activity(db, **self._build_selected_activity(selected_file, ignored_file, updated_by))
+        audit_writer.add_activity(db, **self._build_ignored_activity(selected_file, ignored_file, updated_by))
 
         query_builder.move_file_to_ignore(
             ignored_file,
@@ -157,8 +160,8 @@ class FileRouterRepository(IFileRouterRepository):
             db.flush()
 
 
-    def _build_selected_activity(self, selected_file: FileManager, ignored_file: FileManager, updated_by: str):
-        return FileActivity(
+    def _build_selected_activity(self, selected_file: FileManager, ignored_file: FileManager, updated_by: str) -> Dict:
+        return dict(
             status="Extract",
             stage=selected_file.stage,
             statuscomment=(
@@ -174,8 +177,8 @@ class FileRouterRepository(IFileRouterRepository):
         )
     
 
-    def _build_ignored_activity(self, selected_file: FileManager, ignored_file: FileManager, updated_by: str):
-        return FileActivity(
+    def _build_ignored_activity(self, selected_file: FileManager, ignored_file: FileManager, updated_by: str) -> Dict:
+        return dict(
             status="Ignored",
             stage="Ignored",
             statuscomment=(
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.domain.entities.upload_session import UploadSession, UploadSessionChunk
+from src.domain.enums.upload_session_enums import UploadSessionStatus
+from src.domain.interfaces.upload_session_repository_interface import IUploadSessionRepository
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+class UploadSessionRepository(IUploadSessionRepository):
+    """PostgreSQL implementation of UploadSession repository"""
+
+    def create_session(self, db: Session, values: Dict[str, Any]) -> UploadSession:
+        session = UploadSession(**values)
+        db.add(session)
+        db.flush()
+        return session
+
+    def get_session(
+        self, db: Session, sessionuid: UUID, for_update: bool = False
+    ) -> Optional[UploadSession]:
+        query = db.query(UploadSession).filter(
+            UploadSession.sessionuid == sessionuid, UploadSession.isactive == True
+        )
+        if for_update:
+            query = query.with_for_update()
+        return query.first()
+
+    def record_chunk(self, db: Session, session: UploadSession, chunk_index: int, size: int) -> None:
+        db.execute(
+            insert(UploadSessionChunk)
+            .values(
+                uploadsessionid=session.uploadsessionid,
+                chunkindex=chunk_index,
+                size=size,
+                created=datetime.utcnow(),
+                isactive=True,
+            )
+            .on_conflict_do_nothing(index_elements=["uploadsessionid", "chunkindex"])
+        )
+
+    def reset_chunks(self, db: Session, session: UploadSession) -> None:
+        db.execute(
+            delete(UploadSessionChunk).where(
+                UploadSessionChunk.uploadsessionid == session.uploadsessionid
+            )
+        )
+
+    def get_received_chunks(self, db: Session, session: UploadSession) -> List[int]:
+        rows = (
+            db.query(UploadSessionChunk.chunkindex)
+            .filter(UploadSessionChunk.uploadsessionid == session.uploadsessionid)
+            .order_by(UploadSessionChunk.chunkindex)
+            .all()
+        )
+        return [row.chunkindex for row in rows]
+
+    def get_expired_sessions(self, db: Session, now: datetime, limit: int) -> List[UploadSession]:
+        return (
+            db.query(UploadSession)
+            .filter(
+                UploadSession.status == UploadSessionStatus.Open.value,
+                UploadSession.expireson < now,
+            )
+            .order_by(UploadSession.expireson)
+            .limit(limit)
+            .all()
+        )
@@ -1,21 +1,31 @@
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 from sqlalchemy.orm import Session
 from src.domain.entities.file_manager import FileManager
 
 class FileDetailsQueryBuilder:
-    """Builds the base query for File details by FileUID."""
+    """Builds the base query for File details by FileUID (or by a list of FileUIDs)."""
 
-    def __init__(self, db: Session, file_uid: str):
+    def __init__(self, db: Session, file_uid: Optional[str] = None, file_uids: Optional[List[UUID]] = None):
         self.db = db
         self.file_uid = file_uid
+        self.file_uids = file_uids
         self._query = None
 
     def build_query(self):
         # Build the base select from FileManager
-        self._query = self.db.query(FileManager).filter(
-            FileManager.fileuid == self.file_uid
-        )
+        if self.file_uids is not None:
+            self._query = self.db.query(FileManager).filter(
+                FileManager.fileuid.in_(self.file_uids)
+            )
+        else:
+            self._query = self.db.query(FileManager).filter(
+                FileManager.fileuid == self.file_uid
+            )
         return self
 
     def get_one(self):
-        return self._query.one_or_none()
\ No newline at end of file
+        return self._query.one_or_none()
+
+    def get_all(self):
+        return self._query.all()
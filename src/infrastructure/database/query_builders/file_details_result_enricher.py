@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Tuple
+from typing import Iterable, List, Optional, Dict, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -16,12 +16,14 @@ class FileDetailsResultEnricher:
     def __init__(self, db: Session):
         self.db = db
 
-    def enrich(self, file: FileManager) -> Optional[Dict]:
+    def enrich(self, file: FileManager, sla_days: Optional[int] = None) -> Optional[Dict]:
         """
         Transform a FileManager entity into a dictionary representation of FileDetailsItem.
 
         Args:
             file (FileManager): The file entity to enrich.
+            sla_days (Optional[int]): SLA threshold already resolved for the file;
+                looked up from its configuration when not given.
 
         Returns:
             Optional[Dict]: The enriched file details as a dictionary, or None if input is invalid.
@@ -33,7 +35,8 @@ class FileDetailsResultEnricher:
         age = self._calculate_age(file)
 
         # 2. Calculate SLA Details
-        sla_days = self._get_sla_threshold_days(file)
+        if sla_days is None:
+            sla_days = self._get_sla_threshold_days(file)
         age_sla_display, sla_status = self._determine_sla_status(age, sla_days)
 
         # 3. Construct DTO
@@ -106,6 +109,18 @@ class FileDetailsResultEnricher:
 
         return details_item.model_dump()
 
+    def enrich_many(self, files: Iterable[FileManager]) -> List[Dict]:
+        """
+        Enrich several files, resolving the SLA thresholds of all their
+        configurations with a single query.
+        """
+        files = list(files)
+        sla_days_by_configuration = self._get_sla_threshold_days_map(files)
+        return [
+            self.enrich(file, sla_days_by_configuration.get(self._get_sla_configuration_name(file), 0))
+            for file in files
+        ]
+
     def _calculate_age(self, file: FileManager) -> int:
         """
         Calculate the age of the file in days.
@@ -121,14 +136,7 @@ class FileDetailsResultEnricher:
         """
         Determine the SLA day threshold based on file status and type.
         """
-        # Select configuration name based on status
-        completed_statuses = {"Linked", "Approved", "Ingested", "Completed", "Ignored"}
-        config_name = (
-            file.filetypegenai
-            if file.status in completed_statuses
-            else file.filetypeproceesrule
-        )
-
+        config_name = self._get_sla_configuration_name(file)
         if not config_name:
             return 0
 
@@ -143,6 +151,39 @@ class FileDetailsResultEnricher:
 
         return config.sla_days if config else 0
 
+    def _get_sla_threshold_days_map(self, files: List[FileManager]) -> Dict[str, int]:
+        """
+        SLA day thresholds of the active configurations used by files, by configuration name.
+        """
+        config_names = {
+            name for name in (self._get_sla_configuration_name(file) for file in files) if name
+        }
+        if not config_names:
+            return {}
+
+        sla_days: Dict[str, int] = {}
+        for name, days in (
+            self.db.query(FileConfiguration.configurationname, FileConfiguration.sla_days)
+            .filter(
+                FileConfiguration.configurationname.in_(config_names),
+                FileConfiguration.isactive == True,
+            )
+            .order_by(FileConfiguration.fileid)
+        ):
+            # Keep one row per name if a configuration name is active more than once
+            sla_days.setdefault(name, days or 0)
+        return sla_days
+
+    @staticmethod
+    def _get_sla_configuration_name(file: FileManager) -> Optional[str]:
+        # Select configuration name based on status
+        completed_statuses = {"Linked", "Approved", "Ingested", "Completed", "Ignored"}
+        return (
+            file.filetypegenai
+            if file.status in completed_statuses
+            else file.filetypeprocessrule
+        )
+
     def _determine_sla_status(
         self, age: int, sla_days: Optional[int]
     ) -> Tuple[str, Optional[str]]:
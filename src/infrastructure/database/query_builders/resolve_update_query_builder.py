@@ -1,6 +1,5 @@
 from sqlalchemy.orm import Session
 from src.domain.entities.file_manager import FileManager
-from src.domain.entities.file_activity import FileActivity
 
 class ResolveUpdateQueryBuilder:
     def __init__(self, db: Session):
@@ -19,9 +18,6 @@ class ResolveUpdateQueryBuilder:
     def update_file(self, file: FileManager):
         self.db.add(file)
 
-    def add_file_activities(self, *activities: FileActivity):
-        self.db.add_all(activities)
-
     def move_file_to_ignore(self, file: FileManager, status_comment: str, reason: str):
         file.statuscomment = status_comment
         file.reason = reason
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from src.domain.interfaces.background_job_repository_interface import IBackgroundJobRepository
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackgroundJobRepository(IBackgroundJobRepository):
+    """SQL Server implementation of BackgroundJob repository"""
+
+    def create_job(
+        self, db: Session, job_type: str, fileuids: List[UUID], payload: Dict[str, Any], created_by: str
+    ) -> Any:
+        # Implementation to be added
+        raise NotImplementedError("Background jobs are not available on SQL Server yet")
+
+    def get_job(self, db: Session, jobuid: UUID) -> Optional[Any]:
+        # Implementation to be added
+        return None
+
+    def get_job_items(
+        self, db: Session, job_id: int, status: Optional[str], after_id: int, limit: int
+    ) -> List[Any]:
+        # Implementation to be added
+        return []
+
+    def claim_next_job(self, db: Session, owner: str, lease_until: datetime) -> Optional[Any]:
+        # Implementation to be added
+        return None
+
+    def lock_job(self, db: Session, job_id: int) -> Optional[Any]:
+        # Implementation to be added
+        return None
+
+    def get_pending_items(self, db: Session, job_id: int, limit: int) -> List[Any]:
+        # Implementation to be added
+        return []
+
+    def record_item_outcomes(self, db: Session, job: Any, outcomes: Dict[int, Any]) -> None:
+        # Implementation to be added
+        return None
+
+    def cancel_pending_items(self, db: Session, job: Any) -> int:
+        # Implementation to be added
+        return 0
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 from sqlalchemy.orm import Session
 from src.domain.interfaces.business_rule_repository_interface import IBusinessRuleRepository
 from src.infrastructure.database.sqlserver_repositories.file_manager_repository import logger
@@ -29,7 +29,7 @@ class BusinessRuleRepository(IBusinessRuleRepository):
         # Implementation to be added
         return True
 
-    def update_stage(self, db: Session) -> Any:
+    def update_stage(self, db: Session, audit_writer: Any) -> Any:
         # Implementation to be added
         return None
 
@@ -41,14 +41,31 @@ class BusinessRuleRepository(IBusinessRuleRepository):
         # Implementation to be added
         return {}
 
-    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str) -> Any:
+    def get_business_filter_by_field(self, db: Session, filter_field: str, source_type: str, rule_type: str, content_type: str,
+                                     prefix: Optional[str] = None, limit: Optional[int] = None) -> Any:
         # Implementation to be added
         return []
 
-    def get_business_rule_log_data(self, db: Session, rule_id: str) -> Any:
+    def get_business_rule_log_data(self, db: Session, rule_id: str, page_size: Optional[int] = None, cursor: Optional[str] = None) -> Any:
         # Implementation to be added
         return {}
 
     def get_usage_log_by_rule_async(self, db: Session, input_model: Any) -> Any:
         # Implementation to be added
         return {}
+
+    def reconcile_rule_usage(self, db: Session) -> int:
+        # Implementation to be added
+        return 0
+
+    def simulate_rule(self, db: Session, input_model: Any) -> Any:
+        # Implementation to be added
+        return {}
+
+    def import_rules(self, db: Session, rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # Implementation to be added
+        return {}
+
+    def export_rules(self, db: Session, rule_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        # Implementation to be added
+        return iter([])
@@ -3,7 +3,7 @@ SQL Server File Manager Repository
 Uses the same query builders as PostgreSQL since SQLAlchemy ORM is database-agnostic.
 """
 from typing import List, Any, Dict
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer, undefer_group
 from src.domain.interfaces.file_manager_repository_interface import IFileManagerRepository
 from src.domain.dtos.file_manager_dto import FileManagerFilter
 from src.domain.dtos.update_extract_file_dto import UpdateExtractFileRequest, ResponseObjectModel
@@ -177,7 +177,7 @@ class FileManagerRepository(IFileManagerRepository):
         Returns extraction file details with configuration fields and security mappings.
         """
         try:
-            from src.domain.entities.extraction_file_detail import ExtractionFileDetail
+            from src.domain.entities.extraction_file_detail import EXTRACTION_PAYLOAD, ExtractionFileDetail
             from src.domain.entities.file_configuration import FileConfiguration
             from src.domain.entities.file_configuration_field import FileConfigurationField
             
@@ -187,7 +187,9 @@ class FileManagerRepository(IFileManagerRepository):
             extraction_file_field = ExtractionFileField()
             
             # 1. Get ExtractionFileDetail by fileuid where isactive = true
-            item = db.query(ExtractionFileDetail).filter(
+            item = db.query(ExtractionFileDetail).options(
+                undefer_group(EXTRACTION_PAYLOAD)
+            ).filter(
                 ExtractionFileDetail.fileuid == fileuid,
                 ExtractionFileDetail.isactive == True
             ).first()
@@ -303,7 +305,9 @@ class FileManagerRepository(IFileManagerRepository):
             from src.domain.entities.extract_file import ExtractFile
             logger.info(f"GetExtractFilesByFileUIDAsync: fileuid={fileuid}")
             
-            results = db.query(ExtractFile).filter(
+            results = db.query(ExtractFile).options(
+                undefer(ExtractFile.extracteddata)
+            ).filter(
                 ExtractFile.fileuid == fileuid,
                 ExtractFile.isactive == True
             ).all()
@@ -1,5 +1,5 @@
 from typing import List, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from src.domain.interfaces.file_router_repository_interface import IFileRouterRepository
 from src.domain.entities.extract_file import ExtractFile
 from src.infrastructure.logging.logger_manager import get_logger
@@ -21,7 +21,9 @@ class FileRouterRepository(IFileRouterRepository):
         try:
             logger.info(f"Fetching ExtractFiles with file_uid: {file_uid}")
 
-            results = db.query(ExtractFile).filter(
+            results = db.query(ExtractFile).options(
+                undefer(ExtractFile.extracteddata)
+            ).filter(
                 ExtractFile.fileuid == file_uid
             ).all()
 
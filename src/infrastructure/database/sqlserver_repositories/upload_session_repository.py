@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from src.domain.interfaces.upload_session_repository_interface import IUploadSessionRepository
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+class UploadSessionRepository(IUploadSessionRepository):
+    """SQL Server implementation of UploadSession repository"""
+
+    def create_session(self, db: Session, values: Dict[str, Any]) -> Any:
+        # Implementation to be added
+        raise NotImplementedError("Upload sessions are not available on SQL Server yet")
+
+    def get_session(self, db: Session, sessionuid: UUID, for_update: bool = False) -> Optional[Any]:
+        # Implementation to be added
+        return None
+
+    def record_chunk(self, db: Session, session: Any, chunk_index: int, size: int) -> None:
+        # Implementation to be added
+        return None
+
+    def reset_chunks(self, db: Session, session: Any) -> None:
+        # Implementation to be added
+        return None
+
+    def get_received_chunks(self, db: Session, session: Any) -> List[int]:
+        # Implementation to be added
+        return []
+
+    def get_expired_sessions(self, db: Session, now: datetime, limit: int) -> List[Any]:
+        # Implementation to be added
+        return []
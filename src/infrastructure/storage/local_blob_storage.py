@@ -0,0 +1,70 @@
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from src.domain.interfaces.blob_storage_interface import BlobProperties, IBlobStorage
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+COPY_BLOCK_SIZE = 1024 * 1024
+
+
+class LocalBlobStorage(IBlobStorage):
+    """
+    Blob storage on the local filesystem (reference backend, also used in tests).
+
+    Blobs are written to a temporary file next to their destination and
+    renamed into place once fsynced, so readers never see a partial file.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def put(self, path: str, source: BinaryIO) -> int:
+        target = self._resolve(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+
+        size = 0
+        try:
+            with open(temp, "wb") as handle:
+                for block in iter(lambda: source.read(COPY_BLOCK_SIZE), b""):
+                    handle.write(block)
+                    size += len(block)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp, target)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+        return size
+
+    def open(self, path: str) -> BinaryIO:
+        return open(self._resolve(path), "rb")
+
+    def head(self, path: str) -> Optional[BlobProperties]:
+        try:
+            stat = self._resolve(path).stat()
+        except FileNotFoundError:
+            return None
+        return BlobProperties(path=path, size=stat.st_size, modified=datetime.utcfromtimestamp(stat.st_mtime))
+
+    def delete(self, path: str) -> bool:
+        try:
+            self._resolve(path).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def local_path(self, path: str) -> Optional[str]:
+        return str(self._resolve(path))
+
+    def _resolve(self, path: str) -> Path:
+        target = (self.root / path).resolve()
+        if self.root not in target.parents:
+            raise ValueError(f"Invalid blob path: {path}")
+        return target
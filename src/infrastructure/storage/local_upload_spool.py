@@ -0,0 +1,79 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import BinaryIO
+from uuid import UUID
+
+from src.domain.interfaces.upload_spool_interface import IUploadSpool
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+class _SyncOnCloseFile:
+    """File handle that flushes to disk on close, so a recorded chunk survives a crash."""
+
+    def __init__(self, handle: BinaryIO):
+        self._handle = handle
+
+    def write(self, data: bytes) -> int:
+        return self._handle.write(data)
+
+    def close(self) -> None:
+        try:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        finally:
+            self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class LocalUploadSpool(IUploadSpool):
+    """
+    Reference spool backend on the local filesystem.
+
+    In-progress sessions live in <root>/sessions/<sessionuid>.part, written in
+    place at each chunk's offset, until finalize copies them to blob storage.
+    """
+
+    def __init__(self, root: str):
+        self.sessions_dir = Path(root) / "sessions"
+        self.sessions_dir.mkdir(parents=True, exist_ok=True)
+
+    def allocate(self, sessionuid: UUID, size: int) -> None:
+        with open(self._session_path(sessionuid), "wb") as handle:
+            handle.truncate(size)
+
+    def open_range(self, sessionuid: UUID, offset: int) -> _SyncOnCloseFile:
+        path = self._session_path(sessionuid)
+        if not path.exists():
+            raise FileNotFoundError(f"No spool file for upload session {sessionuid}")
+        handle = open(path, "r+b")
+        handle.seek(offset)
+        return _SyncOnCloseFile(handle)
+
+    def checksum(self, sessionuid: UUID) -> str:
+        digest = hashlib.sha256()
+        with open(self._session_path(sessionuid), "rb") as handle:
+            for block in iter(lambda: handle.read(READ_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def open_read(self, sessionuid: UUID) -> BinaryIO:
+        return open(self._session_path(sessionuid), "rb")
+
+    def discard(self, sessionuid: UUID) -> None:
+        try:
+            self._session_path(sessionuid).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _session_path(self, sessionuid: UUID) -> Path:
+        return self.sessions_dir / f"{sessionuid}.part"
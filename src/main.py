@@ -15,6 +15,9 @@ from src.api.routes import (
     validation_routes,
     master_configuration_type_routes,
     account_details_routes,
+    background_job_routes,
+    upload_session_routes,
+    file_workspace_routes,
 )
 from src.api.controllers import business_rule_controller, file_router_controller
 from src.core.security import get_current_user
@@ -137,6 +140,15 @@ app.include_router(
 app.include_router(
     account_details_routes.router, dependencies=[Depends(get_current_user)]
 )
+app.include_router(
+    background_job_routes.router, dependencies=[Depends(get_current_user)]
+)
+app.include_router(
+    upload_session_routes.router, dependencies=[Depends(get_current_user)]
+)
+app.include_router(
+    file_workspace_routes.router, dependencies=[Depends(get_current_user)]
+)
 
 
 @app.get("/", response_model=Dict[str, str])
@@ -1,6 +1,12 @@
 import json
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Any, Iterator, List, Optional
+
+from src.utils.datetime_utils import parse_datetime
+
+# Classifications whose business date is the transaction date instead of the period end
+TRANSACTION_DATE_CLASSIFICATIONS = ("Distribution", "CapCall")
 
 
 @dataclass
@@ -10,39 +16,121 @@ class PortfolioField:
     period_ending_dt: Optional[str] = None
     transaction_date: Optional[str] = None
 
+    def business_date(self, classification: Optional[str]) -> Optional[datetime]:
+        if classification in TRANSACTION_DATE_CLASSIFICATIONS:
+            return parse_datetime(self.transaction_date)
+        return parse_datetime(self.period_ending_dt)
 
-def are_investor_account_names_unique(extraction_json: str) -> bool:
-    seen = set()
-    doc = json.loads(extraction_json)
 
-    for entity in doc[0].get("entities", []):
-        for portfolio in entity.get("portfolio", []):
-            investor = portfolio.get("Investor", {}).get("Value")
-            account = portfolio.get("Account", {}).get("Value")
+class ExtractionDocument:
+    """
+    An extraction JSON document, parsed at most once.
 
-            key = f"{(investor or '').strip()} | {(account or '').strip()}"
-            if key in seen:
-                return False
-            seen.add(key)
+    The text is parsed on first access to the tree; entities, portfolios and
+    the key portfolio fields are derived from that single parse. to_json()
+    returns the original text unless the tree was changed through
+    set_portfolio_value(), so an unchanged document is never re-serialized.
+    """
 
-    return True
+    def __init__(self, text: str):
+        self._text = text
+        self._root: Any = None
+        self._parsed = False
+        self._changed = False
+        self._key_fields: Optional[PortfolioField] = None
 
+    @property
+    def root(self) -> Any:
+        if not self._parsed:
+            self._root = json.loads(self._text)
+            self._parsed = True
+        return self._root
 
-def extract_portfolio_fields(extraction_json: str) -> PortfolioField:
-    doc = json.loads(extraction_json)
-    portfolio = doc[0]["entities"][0]["portfolio"][0]
+    @property
+    def entities(self) -> List[dict]:
+        return self.root[0].get("entities", [])
+
+    def portfolios(self) -> Iterator[dict]:
+        for entity in self.entities:
+            yield from entity.get("portfolio", [])
+
+    @property
+    def key_fields(self) -> PortfolioField:
+        """
+        Investor, account and date fields of the first portfolio of the first entity.
+        """
+        if self._key_fields is None:
+            portfolio = self.root[0]["entities"][0]["portfolio"][0]
+
+            field = PortfolioField()
+            if "Investor" in portfolio:
+                field.investor = portfolio["Investor"].get("Value")
+            if "Account" in portfolio:
+                field.account = portfolio["Account"].get("Value")
+            if "PeriodEndingDT" in portfolio:
+                field.period_ending_dt = portfolio["PeriodEndingDT"].get("Value")
+            elif "TransactionDate" in portfolio:
+                field.transaction_date = portfolio["TransactionDate"].get("Value")
+            self._key_fields = field
+        return self._key_fields
 
-    field = PortfolioField()
+    def are_investor_account_names_unique(self) -> bool:
+        seen = set()
+        for entity in self.root[0].get("entities", []):
+            for portfolio in entity.get("portfolio", []):
+                investor = portfolio.get("Investor", {}).get("Value")
+                account = portfolio.get("Account", {}).get("Value")
 
-    if "Investor" in portfolio:
-        field.investor = portfolio["Investor"].get("Value")
+                key = f"{(investor or '').strip()} | {(account or '').strip()}"
+                if key in seen:
+                    return False
+                seen.add(key)
+        return True
 
-    if "Account" in portfolio:
-        field.account = portfolio["Account"].get("Value")
+    def diff_key_fields(
+        self,
+        other: "ExtractionDocument",
+        classification: Optional[str],
+        other_classification: Optional[str],
+    ) -> List[str]:
+        """
+        Names of the key fields ("investor", "account", "business_date") that
+        differ in other. Each document's business date is read according to
+        its own classification.
+        """
+        mine, theirs = self.key_fields, other.key_fields
+        changed = []
+        if mine.investor != theirs.investor:
+            changed.append("investor")
+        if mine.account != theirs.account:
+            changed.append("account")
+        if mine.business_date(classification) != theirs.business_date(other_classification):
+            changed.append("business_date")
+        return changed
 
-    if "PeriodEndingDT" in portfolio:
-        field.period_ending_dt = portfolio["PeriodEndingDT"].get("Value")
-    elif "TransactionDate" in portfolio:
-        field.transaction_date = portfolio["TransactionDate"].get("Value")
+    def set_portfolio_value(
+        self, name: str, value: Any, entity_index: int = 0, portfolio_index: int = 0
+    ) -> None:
+        portfolio = self.root[0]["entities"][entity_index]["portfolio"][portfolio_index]
+        if portfolio.get(name, {}).get("Value") == value:
+            return
+        portfolio.setdefault(name, {})["Value"] = value
+        self._changed = True
+        self._key_fields = None
 
-    return field
+    @property
+    def changed(self) -> bool:
+        return self._changed
+
+    def to_json(self) -> str:
+        if not self._changed:
+            return self._text
+        return json.dumps(self._root)
+
+
+def are_investor_account_names_unique(extraction_json: str) -> bool:
+    return ExtractionDocument(extraction_json).are_investor_account_names_unique()
+
+
+def extract_portfolio_fields(extraction_json: str) -> PortfolioField:
+    return ExtractionDocument(extraction_json).key_fields
@@ -0,0 +1,127 @@
+"""
+Validation of extraction JSON against a configuration's field tree.
+
+compile_validation_plan() turns the flat FileConfigurationField rows
+(linked by parentfieldid) into a tree of FieldRule objects once; the
+resulting ValidationPlan is cached per configuration and checks a document
+in a single pass, visiting every value at most once and collecting every
+violation with the JSON path where it occurred.
+
+The configuration's top-level fields are assumed to describe one extracted
+entity and are checked against every item of the document's "entities" list.
+This mapping has not been verified against real configurations, so callers
+treat violations as warnings rather than rejecting the document. Extracted
+values are usually wrapped as {"Value": ..., "Confidence": ...}; Array and
+Object values are accepted either bare or wrapped.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+CONTAINER_TYPES = {"Array": list, "Object": dict}
+
+
+@dataclass(frozen=True)
+class Violation:
+    path: str
+    message: str
+
+
+@dataclass
+class FieldRule:
+    name: str
+    datatype: Optional[str]
+    mandatory: bool
+    children: List["FieldRule"] = field(default_factory=list)
+
+
+def compile_validation_plan(
+    fields: Iterable[Tuple[int, Optional[int], str, Optional[str], Optional[bool]]]
+) -> "ValidationPlan":
+    """
+    Build a plan from (fieldid, parentfieldid, fieldname, datatype, mandatory)
+    rows. Fields without a name, and fields whose parent is not in the rows,
+    are ignored.
+    """
+    rules: Dict[int, FieldRule] = {}
+    parents: Dict[int, Optional[int]] = {}
+    for field_id, parent_id, name, datatype, mandatory in fields:
+        if not name:
+            continue
+        rules[field_id] = FieldRule(name=name, datatype=datatype, mandatory=bool(mandatory))
+        parents[field_id] = parent_id
+
+    roots = []
+    for field_id, rule in rules.items():
+        parent_id = parents[field_id]
+        if parent_id is None:
+            roots.append(rule)
+        elif parent_id in rules:
+            rules[parent_id].children.append(rule)
+    return ValidationPlan(roots)
+
+
+class ValidationPlan:
+    def __init__(self, roots: List[FieldRule]):
+        self.roots = roots
+
+    def validate(self, root: Any) -> List[Violation]:
+        """
+        All violations in a parsed extraction document, in document order.
+        """
+        violations: List[Violation] = []
+        if not isinstance(root, list) or not root or not isinstance(root[0], dict):
+            violations.append(Violation("$", "Document must be a list with an object holding the entities"))
+            return violations
+
+        entities = root[0].get("entities")
+        if not isinstance(entities, list):
+            violations.append(Violation("$[0].entities", "Expected an array"))
+            return violations
+
+        for index, entity in enumerate(entities):
+            self._check_object(entity, self.roots, f"$[0].entities[{index}]", violations)
+        return violations
+
+    def _check_object(self, value: Any, rules: List[FieldRule], path: str, violations: List[Violation]) -> None:
+        if not isinstance(value, dict):
+            violations.append(Violation(path, "Expected an object"))
+            return
+        for rule in rules:
+            self._check_field(value.get(rule.name), rule, f"{path}.{rule.name}", violations)
+
+    def _check_field(self, value: Any, rule: FieldRule, path: str, violations: List[Violation]) -> None:
+        container = CONTAINER_TYPES.get(rule.datatype)
+        if container is None:
+            if rule.mandatory and _is_empty(_unwrap(value)):
+                violations.append(Violation(path, "Mandatory field is missing"))
+            return
+
+        if value is None:
+            if rule.mandatory:
+                violations.append(Violation(path, "Mandatory field is missing"))
+            return
+
+        value = _unwrap(value, container)
+        if container is list:
+            if not isinstance(value, list):
+                violations.append(Violation(path, "Expected an array"))
+                return
+            if rule.mandatory and not value:
+                violations.append(Violation(path, "Mandatory field is empty"))
+            for index, item in enumerate(value):
+                self._check_object(item, rule.children, f"{path}[{index}]", violations)
+        else:
+            self._check_object(value, rule.children, path, violations)
+
+
+def _unwrap(value: Any, container: Optional[type] = None) -> Any:
+    if isinstance(value, dict) and "Value" in value:
+        inner = value["Value"]
+        if container is None or isinstance(inner, container):
+            return inner
+    return value
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
@@ -0,0 +1,103 @@
+"""
+JSON responses with pre-encoded fragments spliced in.
+
+Large values that are already text (stored JSON documents) are written into
+the response body as they are instead of going through model validation,
+jsonable_encoder and json.dumps with the rest of the response. Only the
+surrounding metadata is serialized; each fragment is then substituted for a
+per-call placeholder in the encoded bytes.
+
+A fragment still costs what producing its encoding costs: string() escapes
+the whole text with json.dumps, the same work JSONResponse does for a str
+value, and raw() parses the document once to check it. What the splice saves
+is every other pass over the value (model validation, jsonable_encoder and,
+for raw(), re-encoding the parsed tree).
+"""
+
+import json
+import re
+import uuid
+from typing import Any, List
+
+from fastapi.encoders import jsonable_encoder
+
+# Leading text of a stored document that can be embedded as is: an object or an array
+_DOCUMENT_START = re.compile(r"\s*[{\[]")
+
+
+class JSONFragment:
+    """
+    A value that is already encoded as JSON.
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, encoded: bytes):
+        self.encoded = encoded
+
+    @classmethod
+    def raw(cls, document: str) -> "JSONFragment":
+        """
+        Stored JSON document emitted verbatim when it is a valid object or
+        array. Blank text is emitted as null and any other text, including a
+        truncated or malformed document, as a JSON string, so stored text can
+        never corrupt the body.
+        """
+        if not document or document.isspace():
+            return cls(b"null")
+        if not _DOCUMENT_START.match(document):
+            return cls.string(document)
+        try:
+            json.loads(document, parse_constant=_reject_constant)
+        except ValueError:
+            return cls.string(document)
+        return cls(document.encode("utf-8"))
+
+    @classmethod
+    def string(cls, value: str) -> "JSONFragment":
+        """
+        Text emitted as a JSON string, escaped in a single pass (a full json.dumps
+        of the text, as JSONResponse would do).
+        """
+        return cls(_dumps(value))
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Encode content as JSON the way JSONResponse does, splicing every JSONFragment
+    found in its dicts and lists into the output as is.
+    """
+    nonce = uuid.uuid4().hex
+    fragments: List[bytes] = []
+
+    def substitute(value: Any) -> Any:
+        if isinstance(value, JSONFragment):
+            fragments.append(value.encoded)
+            return f"\x00{nonce}:{len(fragments) - 1}\x00"
+        if isinstance(value, dict):
+            return {key: substitute(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [substitute(item) for item in value]
+        return value
+
+    encoded = _dumps(jsonable_encoder(substitute(content)))
+    if not fragments:
+        return encoded
+
+    # Placeholders come out of json.dumps as "\u0000<nonce>:<index>\u0000"
+    parts = re.split(rb'"\\u0000' + nonce.encode("ascii") + rb':(\d+)\\u0000"', encoded)
+    for position in range(1, len(parts), 2):
+        parts[position] = fragments[int(parts[position])]
+    return b"".join(parts)
+
+
+def _reject_constant(name: str) -> Any:
+    # NaN and Infinity parse in Python but are not JSON
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def _dumps(value: Any) -> bytes:
+    # Same options as starlette's JSONResponse.render
+    return json.dumps(
+        value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
@@ -0,0 +1,24 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def encode_cursor(created: Optional[datetime], row_id: int) -> str:
+    """
+    Encode the (created, id) position of the last row on a page as an opaque cursor.
+    """
+    payload = {"c": created.isoformat() if created else None, "i": row_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """
+    Decode a cursor produced by encode_cursor. Raises ValueError for malformed cursors.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        created = datetime.fromisoformat(payload["c"]) if payload["c"] else None
+        return created, int(payload["i"])
+    except (KeyError, TypeError, ValueError, UnicodeError) as ex:
+        raise ValueError("Invalid cursor") from ex
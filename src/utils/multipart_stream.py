@@ -0,0 +1,196 @@
+"""
+Streaming multipart/form-data reader.
+
+Parses the request body chunk by chunk as it arrives: file parts are written
+to spool files (memory up to a small threshold, then disk) while their size
+and SHA-256 are computed in the same pass, and the total upload size is
+enforced incrementally so an oversized request is rejected without reading
+the rest of it.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+# Bytes a file part keeps in memory before the spool rolls over to disk
+SPOOL_MAX_MEMORY = 1024 * 1024
+# Plain form fields are small; cap them so they cannot be used to buffer a file
+MAX_FIELD_SIZE = 64 * 1024
+
+
+class MultipartUploadError(ValueError):
+    """The request body is not a usable multipart/form-data upload."""
+
+
+class UploadLimitExceeded(MultipartUploadError):
+    """The upload exceeded the size or file count limit."""
+
+
+@dataclass
+class SpooledUpload:
+    filename: str
+    content_type: Optional[str]
+    file: SpooledTemporaryFile
+    size: int = 0
+    checksum: Optional[str] = None  # SHA-256 hex digest
+
+    def close(self) -> None:
+        self.file.close()
+
+
+@dataclass
+class MultipartForm:
+    fields: Dict[str, str] = field(default_factory=dict)
+    files: List[SpooledUpload] = field(default_factory=list)
+
+    def close(self) -> None:
+        for upload in self.files:
+            upload.close()
+
+
+class StreamingMultipartReader:
+    def __init__(self, content_type: str, max_total_bytes: int, max_files: int):
+        media_type, options = parse_options_header(content_type or "")
+        boundary = options.get(b"boundary")
+        if media_type != b"multipart/form-data" or not boundary:
+            raise MultipartUploadError("Expected a multipart/form-data body")
+
+        self.max_total_bytes = max_total_bytes
+        self.max_files = max_files
+        self.form = MultipartForm()
+        self._total_bytes = 0
+
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._field_name: Optional[str] = None
+        self._field_value = bytearray()
+        self._upload: Optional[SpooledUpload] = None
+        self._hasher = None
+        # Part data and part ends queued by the parser callbacks, applied by read()
+        self._pending: List[Tuple[SpooledUpload, Optional[bytes]]] = []
+
+        self._parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    async def read(self, chunks: AsyncIterator[bytes]) -> MultipartForm:
+        """
+        Consume the body stream. On any error the spooled files are closed
+        (and deleted) before the exception propagates.
+        """
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    self._parser.write(chunk)
+                    await self._flush_pending()
+            self._parser.finalize()
+            await self._flush_pending()
+        except Exception:
+            self.form.close()
+            if self._upload:
+                self._upload.close()
+            raise
+        return self.form
+
+    async def _flush_pending(self) -> None:
+        """
+        Write the queued part data to the spool files. Like Starlette's form
+        parser, writes to a spool that has rolled over to disk run in the
+        threadpool so they do not block the event loop.
+        """
+        pending, self._pending = self._pending, []
+        for upload, chunk in pending:
+            if chunk is None:
+                upload.file.seek(0)
+            elif getattr(upload.file, "_rolled", False):
+                await run_in_threadpool(upload.file.write, chunk)
+            else:
+                upload.file.write(chunk)
+
+    # ======================================================================
+    # PARSER CALLBACKS
+    # ======================================================================
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._field_name = None
+        self._field_value = bytearray()
+        self._upload = None
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name")
+        if name is None:
+            raise MultipartUploadError("Form part without a name")
+
+        filename = options.get(b"filename")
+        if filename is None:
+            self._field_name = name.decode("utf-8", errors="replace")
+            return
+
+        if len(self.form.files) >= self.max_files:
+            raise UploadLimitExceeded(f"Maximum {self.max_files} files allowed")
+
+        content_type = self._headers.get(b"content-type")
+        self._upload = SpooledUpload(
+            filename=filename.decode("utf-8", errors="replace"),
+            content_type=content_type.decode("latin-1") if content_type else None,
+            file=SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY),
+        )
+        self._hasher = hashlib.sha256()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        chunk = data[start:end]
+        if self._upload is None:
+            if len(self._field_value) + len(chunk) > MAX_FIELD_SIZE:
+                raise UploadLimitExceeded(f"Form field '{self._field_name}' is too large")
+            self._field_value += chunk
+            return
+
+        self._total_bytes += len(chunk)
+        if self._total_bytes > self.max_total_bytes:
+            raise UploadLimitExceeded("Total upload size exceeds the allowed limit")
+
+        self._pending.append((self._upload, chunk))
+        self._upload.size += len(chunk)
+        self._hasher.update(chunk)
+
+    def _on_part_end(self) -> None:
+        if self._upload is None:
+            if self._field_name is not None:
+                self.form.fields[self._field_name] = self._field_value.decode("utf-8", errors="replace")
+            return
+
+        self._upload.checksum = self._hasher.hexdigest()
+        self._pending.append((self._upload, None))  # rewind once its data is written
+        self.form.files.append(self._upload)
+        self._upload = None
+        self._hasher = None
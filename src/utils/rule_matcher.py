@@ -0,0 +1,116 @@
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Pattern
+
+from src.infrastructure.logging.logger_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Metadata keys checked for email-harvested files, in the order the rule processor uses
+EMAIL_METADATA_KEYS = ("Subject", "To", "Email_Body", "File_Name")
+
+
+def compile_wildcard(pattern: str) -> Pattern:
+    # Same conversion as the rule processor: '*' is a wildcard, everything else is regex
+    return re.compile(pattern.replace("*", ".*"), re.IGNORECASE)
+
+
+@dataclass
+class CompiledRule:
+    rule: Any
+    file_name_pattern: Optional[Pattern] = None
+    email_patterns: List[Pattern] = field(default_factory=list)
+
+    def matches_file_name(self, file_name: Any) -> bool:
+        if not self.file_name_pattern or not isinstance(file_name, str) or not file_name:
+            return False
+        return self.file_name_pattern.search(file_name) is not None
+
+    def matches_email(self, values: List[str]) -> bool:
+        for value in values:
+            for pattern in self.email_patterns:
+                if pattern.search(value):
+                    return True
+        return False
+
+
+def compile_rule(rule: Any) -> Optional[CompiledRule]:
+    """
+    Parse and compile a rule's expressions once.
+    Returns None for rules that can never match (empty, non-JSON or invalid patterns).
+    """
+    if not rule.ruleexpressions:
+        return None
+
+    try:
+        expressions = json.loads(rule.ruleexpressions)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(expressions, dict):
+        return None
+
+    try:
+        compiled = CompiledRule(rule=rule)
+        file_name = expressions.get("FileName")
+        if file_name and isinstance(file_name, str):
+            compiled.file_name_pattern = compile_wildcard(file_name)
+
+        # Email rules match when any expression value matches any metadata field
+        compiled.email_patterns = [
+            compile_wildcard(pattern)
+            for pattern in expressions.values()
+            if pattern and isinstance(pattern, str)
+        ]
+    except re.error as ex:
+        logger.error(f"BUSINESS RULE : Rule {getattr(rule, 'uniqueruleid', None)} has an invalid pattern and is skipped: {ex}")
+        return None
+
+    return compiled
+
+
+class RuleMatcher:
+    """
+    Evaluates file metadata against a set of rules compiled up front.
+    Rules are checked in the given order and the first match wins.
+    """
+
+    def __init__(self, rules: Iterable[Any]):
+        self.rules = [compiled for compiled in (compile_rule(rule) for rule in rules) if compiled]
+
+    def match(self, metadata: Optional[Dict[str, Any]], harvest_source: Optional[str]) -> Optional[Any]:
+        if not metadata or not self.rules:
+            return None
+
+        if harvest_source == "Email":
+            values = [
+                value for value in (metadata.get(key) for key in EMAIL_METADATA_KEYS)
+                if value and isinstance(value, str)
+            ]
+            if not values:
+                return None
+            for compiled in self.rules:
+                if compiled.matches_email(values):
+                    return compiled.rule
+            return None
+
+        file_name = metadata.get("File_Name")
+        if not file_name:
+            return None
+        for compiled in self.rules:
+            if compiled.matches_file_name(file_name):
+                return compiled.rule
+        return None
+
+
+def parse_file_metadata(file_metadata: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Parse a file's metadata JSON, returning None when it is missing or not a JSON object.
+    """
+    if not file_metadata:
+        return None
+    try:
+        metadata = json.loads(file_metadata)
+    except (TypeError, ValueError):
+        return None
+    return metadata if isinstance(metadata, dict) else None
@@ -0,0 +1,44 @@
+import threading
+from typing import Any, Callable, Hashable
+
+from src.utils.ttl_cache import TTLCache
+
+
+class VersionedCache:
+    """
+    In-process cache for data that changes rarely and is invalidated as a whole.
+
+    invalidate() bumps the version; a value loaded under an older version is
+    neither returned nor stored, so a load that raced a change cannot put
+    stale data back. The TTL bounds how long changes made by other
+    instances stay unseen.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self._entries = TTLCache(ttl_seconds, max_entries)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Cached value for key, loading it on a miss. None is a valid, cached value.
+        """
+        version = self._version
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        value = loader()
+        with self._lock:
+            if self._version == version:
+                self._entries.set(key, (version, value))
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()